@@ -0,0 +1,59 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from youtube_to_docs import clients
+
+
+class TestClients(unittest.TestCase):
+    def setUp(self):
+        clients.reset_clients()
+        self.addCleanup(clients.reset_clients)
+
+    @patch("google.genai.Client")
+    def test_clients_are_reused_per_credential(self, mock_client_cls):
+        mock_client_cls.side_effect = lambda **kwargs: object()
+
+        first = clients.genai_client(api_key="key1")
+
+        self.assertIs(clients.genai_client(api_key="key1"), first)
+        self.assertIsNot(clients.genai_client(api_key="key2"), first)
+        self.assertEqual(mock_client_cls.call_count, 2)
+
+    def test_concurrent_first_use_creates_one_client(self):
+        created = []
+
+        def factory():
+            created.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(clients.get_client(("k",), factory))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(set(map(id, results))), 1)
+
+    def test_http_session_keeps_connections_alive(self):
+        session = clients.http_session()
+
+        self.assertIs(clients.http_session(), session)
+        adapter = session.get_adapter("https://bedrock-runtime.amazonaws.com")
+        self.assertEqual(adapter._pool_maxsize, clients.HTTP_POOL_SIZE)
+
+        clients.reset_clients()
+        self.assertIsNot(clients.http_session(), session)
+
+
+if __name__ == "__main__":
+    unittest.main()
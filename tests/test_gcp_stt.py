@@ -1,3 +1,4 @@
+import datetime
 import os
 import sys
 import unittest
@@ -6,10 +7,16 @@ from unittest.mock import MagicMock, patch
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from youtube_to_docs import clients
 from youtube_to_docs.llms import generate_transcript
+from youtube_to_docs.utils import srt_to_text
 
 
 class TestGCPSTT(unittest.TestCase):
+    def setUp(self):
+        clients.reset_clients()
+        self.addCleanup(clients.reset_clients)
+
     @patch("youtube_to_docs.llms._transcribe_gcp")
     def test_gcp_dispatch(self, mock_transcribe):
         """Test that gcp- models are dispatched to _transcribe_gcp."""
@@ -87,6 +94,60 @@ class TestGCPSTT(unittest.TestCase):
 
             self.assertEqual(transcript, "Test Transcript")
 
+    @patch.dict(
+        os.environ,
+        {"GOOGLE_CLOUD_PROJECT": "test-project", "YTD_GCS_BUCKET_NAME": "test-bucket"},
+    )
+    @patch("uuid.uuid4", return_value="1234")
+    def test_transcribe_gcp_srt_keeps_results_without_word_offsets(self, mock_uuid):
+        """Every result ends up in the SRT, so the transcript can be derived."""
+        mock_speech_module = MagicMock()
+
+        def word(text, start, end):
+            return MagicMock(
+                word=text,
+                start_offset=datetime.timedelta(seconds=start),
+                end_offset=datetime.timedelta(seconds=end),
+            )
+
+        timed = MagicMock()
+        timed.alternatives = [
+            MagicMock(
+                transcript="Hello there.",
+                words=[word("Hello", 0, 1), word("there.", 1, 2)],
+            )
+        ]
+        untimed = MagicMock(result_end_offset=datetime.timedelta(seconds=5))
+        untimed.alternatives = [MagicMock(transcript="Goodbye.", words=[])]
+
+        batch_result = MagicMock()
+        batch_result.transcript.results = [timed, untimed]
+        operation = mock_speech_module.SpeechClient.return_value.batch_recognize
+        operation.return_value.result.return_value.results = {
+            "gs://test-bucket/temp/ytd_audio_1234.m4a": batch_result
+        }
+
+        with patch.dict(
+            sys.modules,
+            {
+                "google.cloud.speech_v2": mock_speech_module,
+                "google.cloud.storage": MagicMock(),
+                "google.cloud.speech_v2.types": MagicMock(),
+            },
+        ):
+            from youtube_to_docs import llms
+
+            srt, _, _ = llms._transcribe_gcp(
+                "gcp-chirp3", "audio.m4a", "http://url", srt=True
+            )
+
+        self.assertEqual(
+            srt,
+            "1\n00:00:00,000 --> 00:00:02,000\nHello there.\n\n"
+            "2\n00:00:02,000 --> 00:00:05,000\nGoodbye.\n",
+        )
+        self.assertEqual(srt_to_text(srt), "Hello there. Goodbye.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
-from youtube_to_docs import infographic
+from youtube_to_docs import clients, infographic
 
 
 class TestInfographic(unittest.TestCase):
@@ -19,6 +19,8 @@ class TestInfographic(unittest.TestCase):
             },
         )
         self.env_patcher.start()
+        clients.reset_clients()
+        self.addCleanup(clients.reset_clients)
 
     def tearDown(self):
         self.env_patcher.stop()
@@ -117,7 +119,7 @@ class TestInfographic(unittest.TestCase):
         self.assertEqual(in_tok, 0)
         self.assertEqual(out_tok, 0)
 
-    @patch("youtube_to_docs.infographic.requests.post")
+    @patch("requests.Session.post")
     def test_generate_infographic_bedrock(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -137,7 +139,7 @@ class TestInfographic(unittest.TestCase):
         args, kwargs = mock_post.call_args
         self.assertIn("amazon.titan-image-generator-v2:0", args[0])
 
-    @patch("youtube_to_docs.infographic.requests.post")
+    @patch("requests.Session.post")
     def test_generate_infographic_bedrock_nova(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -156,7 +158,7 @@ class TestInfographic(unittest.TestCase):
         args, kwargs = mock_post.call_args
         self.assertIn("amazon.nova-canvas-v1:0", args[0])
 
-    @patch("youtube_to_docs.infographic.requests.post")
+    @patch("requests.Session.post")
     def test_generate_infographic_bedrock_with_suffix(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -174,7 +176,7 @@ class TestInfographic(unittest.TestCase):
         self.assertIn("amazon.nova-canvas-v1:0", args[0])
         self.assertNotIn("amazon.nova-canvas-v1:0:0", args[0])
 
-    @patch("youtube_to_docs.infographic.requests.post")
+    @patch("requests.Session.post")
     def test_generate_infographic_bedrock_skip_long_prompt(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
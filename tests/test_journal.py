@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+from youtube_to_docs import journal
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.test_dir_obj = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.test_dir_obj.name, "docs.csv.journal.jsonl")
+
+    def tearDown(self):
+        self.test_dir_obj.cleanup()
+
+    def test_append_and_replay_keeps_latest_row_per_url(self):
+        j = journal.Journal(self.path)
+        j.append({"URL": "url1", "Title": "Title 1"})
+        j.append({"URL": "url2", "Title": "Title 2"})
+        j.append({"URL": "url1", "Title": "Title 1", "Summary": "Done"})
+
+        rows = journal.Journal(self.path).replay()
+
+        self.assertEqual(
+            rows,
+            [
+                {"URL": "url2", "Title": "Title 2"},
+                {"URL": "url1", "Title": "Title 1", "Summary": "Done"},
+            ],
+        )
+
+    def test_replay_ignores_truncated_line(self):
+        j = journal.Journal(self.path)
+        j.append({"URL": "url1", "Title": "Title 1"})
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"URL": "url2", "Ti')
+
+        self.assertEqual(j.replay(), [{"URL": "url1", "Title": "Title 1"}])
+
+    def test_replay_missing_file(self):
+        self.assertEqual(journal.Journal(self.path).replay(), [])
+
+    def test_due_and_clear(self):
+        j = journal.Journal(self.path)
+        j.append({"URL": "url1"})
+        self.assertFalse(j.due(2))
+        j.append({"URL": "url2"})
+        self.assertTrue(j.due(2))
+
+        j.clear()
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(j.due(2))
+        self.assertEqual(j.replay(), [])
+
+    def test_compact_keeps_rows_not_yet_saved(self):
+        j = journal.Journal(self.path)
+        j.append({"URL": "url1"}, finished=False)
+        j.append({"URL": "url2"}, finished=False)
+        j.append({"URL": "url1", "Summary": "Done"})
+
+        j.compact(["url1"])
+
+        self.assertFalse(j.due(1))
+        self.assertEqual(j.replay(), [{"URL": "url2"}])
+
+        j.compact(["url1", "url2"])
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_due_ignores_partial_rows_and_honours_interval(self):
+        j = journal.Journal(self.path)
+        j.append({"URL": "url1"}, finished=False)
+        self.assertFalse(j.due(1))
+        self.assertEqual(len(j.replay()), 1)
+
+        j.append({"URL": "url1", "Summary": "Done"})
+        self.assertTrue(j.due(1))
+        self.assertFalse(j.due(0, interval=60))
+        with patch("time.monotonic", return_value=j.compacted_at + 61):
+            self.assertTrue(j.due(0, interval=60))
+
+    def test_journal_path(self):
+        self.assertEqual(
+            journal.journal_path("out/docs.csv", True), "out/docs.csv.journal.jsonl"
+        )
+        self.assertEqual(
+            journal.journal_path("workspace", False),
+            os.path.join(".youtube-to-docs", "workspace.journal.jsonl"),
+        )
+
+    def test_merge_rows(self):
+        existing = pl.DataFrame({"URL": ["url1", "url2"], "Title": ["Old", "Two"]})
+
+        merged = journal.merge_rows(
+            existing, [{"URL": "url1", "Title": "New", "Cost": 0.5}]
+        )
+
+        self.assertEqual(merged["URL"].to_list(), ["url2", "url1"])
+        self.assertEqual(merged["Title"].to_list(), ["Two", "New"])
+        self.assertEqual(merged["Cost"].to_list(), [None, 0.5])
+        self.assertEqual(
+            journal.merge_rows(None, [{"URL": "url1"}])["URL"].to_list(), ["url1"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from youtube_to_docs import llm_cache
+from youtube_to_docs.utils import ErrorText
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir_obj = tempfile.TemporaryDirectory()
+        self.cache = llm_cache.ResponseCache(self.test_dir_obj.name)
+
+    def tearDown(self):
+        self.test_dir_obj.cleanup()
+
+    def test_cache_key(self):
+        key = llm_cache.cache_key("_query_llm", ("gemini", "Prompt\r\nText  "), {})
+
+        # Line endings and trailing whitespace do not matter
+        self.assertEqual(
+            key, llm_cache.cache_key("_query_llm", ("gemini", "Prompt\nText"), {})
+        )
+        self.assertNotEqual(
+            key, llm_cache.cache_key("_query_llm", ("gemini-pro", "Prompt\nText"), {})
+        )
+        self.assertNotEqual(
+            llm_cache.cache_key("generate_alt_text", ("gemini", b"png1"), {}),
+            llm_cache.cache_key("generate_alt_text", ("gemini", b"png2"), {}),
+        )
+
+    def test_call_caches_result(self):
+        calls = []
+
+        def query():
+            calls.append(1)
+            return "Summary", 100, 50
+
+        self.assertEqual(self.cache.call("key", query), ("Summary", 100, 50))
+        self.assertEqual(self.cache.call("key", query), ("Summary", 100, 50))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_errors_are_not_cached(self):
+        error = ErrorText("Error: 429 Too Many Requests")
+        self.cache.call("key", lambda: (error, 0, 0))
+
+        self.assertEqual(self.cache.call("key", lambda: ("Done", 1, 2)), ("Done", 1, 2))
+
+    def test_provider_errors_are_not_cached(self):
+        calls = []
+
+        def throttled():
+            calls.append(1)
+            return ErrorText("Bedrock API Error 429: Too many requests"), 0, 0
+
+        self.cache.call("key", throttled)
+        self.assertIsNone(self.cache.get("key"))
+
+        # The next call retries and its successful result is cached
+        self.assertEqual(
+            self.cache.call("key", lambda: ("Summary", 1, 2)), ("Summary", 1, 2)
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.cache.get("key"), ("Summary", 1, 2))
+
+        for text in (
+            "Vertex API Error 503: unavailable",
+            "Unexpected response format: {}",
+        ):
+            self.assertFalse(llm_cache.is_cacheable((ErrorText(text), 0, 0)))
+
+    def test_summary_starting_with_error_is_cached(self):
+        result = ("Error handling in Python: a summary", 1, 2)
+        self.cache.call("key", lambda: result)
+        self.assertEqual(self.cache.get("key"), result)
+
+    def test_expired_entries_are_dropped(self):
+        self.cache.ttl_seconds = 60
+        self.cache.put("key", ("Summary", 100, 50))
+
+        with patch("time.time", return_value=time.time() + 61):
+            self.assertIsNone(self.cache.get("key"))
+
+        self.assertEqual(list(self.cache._entries()), [])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.put("aa1", ("x" * 100, 1, 1))
+        self.cache.put("bb2", ("y" * 100, 1, 1))
+        entry_size = os.path.getsize(self.cache._path("aa1"))
+        # aa1 was used more recently than bb2
+        os.utime(self.cache._path("bb2"), (1, 1))
+        self.cache.get("aa1")
+
+        self.cache.max_bytes = entry_size * 5 // 2
+        self.cache.put("cc3", ("z" * 100, 1, 1))
+
+        self.assertIsNone(self.cache.get("bb2"))
+        self.assertIsNotNone(self.cache.get("aa1"))
+        self.assertIsNotNone(self.cache.get("cc3"))
+
+    def test_concurrent_identical_calls_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def query():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "Summary", 100, 50
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.call("k", query)))
+            for _ in range(3)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [("Summary", 100, 50)] * 3)
+
+
+class TestCachedDecorator(unittest.TestCase):
+    def setUp(self):
+        self.test_dir_obj = tempfile.TemporaryDirectory()
+        self.addCleanup(self.test_dir_obj.cleanup)
+        self.addCleanup(llm_cache.reset_llm_cache)
+        self.calls = []
+
+        @llm_cache.cached
+        def query(model_name, prompt):
+            self.calls.append(prompt)
+            return f"Answer to {prompt}", 10, 5
+
+        self.query = query
+
+    def test_disabled_by_default(self):
+        llm_cache.reset_llm_cache()
+
+        self.query("gemini", "Prompt")
+        self.query("gemini", "Prompt")
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_configured_cache_is_shared_across_runs(self):
+        llm_cache.configure_llm_cache(self.test_dir_obj.name)
+        self.query("gemini", "Prompt")
+
+        # A new run (new cache object) reuses the stored response
+        llm_cache.configure_llm_cache(self.test_dir_obj.name)
+        self.assertEqual(self.query("gemini", "Prompt"), ("Answer to Prompt", 10, 5))
+        self.query("gemini", "Other prompt")
+
+        self.assertEqual(self.calls, ["Prompt", "Other prompt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,8 @@ import os
 import unittest
 from unittest.mock import MagicMock, patch
 
-from youtube_to_docs import llms
+from youtube_to_docs import clients, llm_cache, llms, mapreduce
+from youtube_to_docs.utils import ErrorText
 
 
 class TestLLMs(unittest.TestCase):
@@ -19,6 +20,10 @@ class TestLLMs(unittest.TestCase):
             },
         )
         self.env_patcher.start()
+        llm_cache.reset_llm_cache()
+        clients.reset_clients()
+        self.addCleanup(clients.reset_clients)
+        self.addCleanup(mapreduce.reset_map_reduce)
 
     def tearDown(self):
         self.env_patcher.stop()
@@ -65,7 +70,7 @@ class TestLLMs(unittest.TestCase):
         self.assertEqual(in_tokens, 100)
         self.assertEqual(out_tokens, 50)
 
-    @patch("youtube_to_docs.llms.requests.post")
+    @patch("requests.Session.post")
     def test_generate_summary_bedrock(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -168,6 +173,96 @@ class TestLLMs(unittest.TestCase):
         self.assertEqual(out_tokens, 40)
 
 
+class TestMapReduce(unittest.TestCase):
+    def setUp(self):
+        llm_cache.reset_llm_cache()
+        # About 10 tokens per chunk
+        mapreduce.configure_map_reduce(10, workers=2)
+        self.addCleanup(mapreduce.reset_map_reduce)
+        self.transcript = "The budget was approved. The vote was unanimous."
+        self.prompts = []
+
+    def query(self, model_name, prompt):
+        self.prompts.append(prompt)
+        if "combine them" in prompt:
+            return "Combined summary", 30, 10
+        if "merge them" in prompt:
+            return "Speaker 1 (Chair)\nSpeaker 2 (Clerk)", 30, 10
+        if "questions and answers" in prompt:
+            question = "Budget?" if "budget" in prompt else "Vote?"
+            return f"| q | a |\n|---|---|\n| {question} | Yes |", 20, 5
+        if "identify the speakers" in prompt:
+            return "Speaker 1 (Chair)", 20, 5
+        return "Part summary", 20, 5
+
+    def test_long_transcript_summary_is_mapped_and_reduced(self):
+        with patch("youtube_to_docs.llms._query_llm", side_effect=self.query):
+            summary = llms.generate_summary(
+                "gemini-pro", self.transcript, "Title", "url"
+            )
+
+        self.assertEqual(summary, ("Combined summary", 70, 20))
+        self.assertEqual(len(self.prompts), 3)
+        self.assertIn("part 1 of 2", self.prompts[0] + self.prompts[1])
+        self.assertIn("Part summary\n\nPart summary", self.prompts[2])
+
+    def test_long_transcript_is_one_call_unless_enabled(self):
+        mapreduce.reset_map_reduce()
+        # Far above the per-model chunk size of gemini models
+        transcript = "The budget was approved. " * 50_000
+
+        with patch("youtube_to_docs.llms._query_llm", side_effect=self.query):
+            summary = llms.generate_summary("gemini-pro", transcript, "Title", "url")
+            llms.extract_speakers("gemini-pro", transcript)
+            llms.generate_qa("gemini-pro", transcript, "Speaker 1", "url")
+
+        self.assertEqual(summary, ("Part summary", 20, 5))
+        self.assertEqual(len(self.prompts), 3)
+        self.assertTrue(all(transcript in p for p in self.prompts))
+
+    def test_long_transcript_speakers_are_merged(self):
+        with patch("youtube_to_docs.llms._query_llm", side_effect=self.query):
+            speakers, in_tokens, _ = llms.extract_speakers(
+                "gemini-pro", self.transcript
+            )
+
+        self.assertEqual(speakers, "Speaker 1 (Chair)\nSpeaker 2 (Clerk)")
+        self.assertEqual(in_tokens, 70)
+
+    def test_long_transcript_qa_tables_are_joined(self):
+        with patch("youtube_to_docs.llms._query_llm", side_effect=self.query):
+            qa, in_tokens, out_tokens = llms.generate_qa(
+                "gemini-pro", self.transcript, "Speaker 1", "url"
+            )
+
+        # The tables are joined locally, without a reduce call
+        self.assertEqual(len(self.prompts), 2)
+        self.assertEqual(
+            qa,
+            "| question number | q | a |\n|---|---|---|\n"
+            "| 1 | Budget? | Yes |\n| 2 | Vote? | Yes |",
+        )
+        self.assertEqual((in_tokens, out_tokens), (40, 10))
+
+    def test_provider_error_in_a_chunk_is_returned(self):
+        def query(model_name, prompt):
+            if "budget" in prompt:
+                return ErrorText("Bedrock API Error 429: Too many requests"), 0, 0
+            return self.query(model_name, prompt)
+
+        with patch("youtube_to_docs.llms._query_llm", side_effect=query):
+            summary, _, _ = llms.generate_summary(
+                "gemini-pro", self.transcript, "Title", "url"
+            )
+            qa, _, _ = llms.generate_qa(
+                "gemini-pro", self.transcript, "Speaker 1", "url"
+            )
+
+        self.assertEqual(summary, "Bedrock API Error 429: Too many requests")
+        self.assertEqual(qa, "Bedrock API Error 429: Too many requests")
+        self.assertFalse(any("combine them" in p for p in self.prompts))
+
+
 class TestPricing(unittest.TestCase):
     @patch(
         "youtube_to_docs.llms.PRICES",
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+from youtube_to_docs.storage import LocalStorage
+
+
+class TestLocalStorageManifest(unittest.TestCase):
+    def setUp(self):
+        self.test_dir_obj = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.test_dir_obj.name, "docs.csv")
+        self.df = pl.DataFrame(
+            {
+                "URL": ["url1", "url2"],
+                "Summary Text model": ["A long summary", None],
+                "cost ($)": [0.25, 1.5],
+            }
+        )
+
+    def tearDown(self):
+        self.test_dir_obj.cleanup()
+
+    def test_csv_default(self):
+        storage = LocalStorage()
+        storage.save_dataframe(self.df, self.csv_path)
+
+        self.assertIsNone(storage.manifest_path(self.csv_path))
+        self.assertEqual(os.listdir(self.test_dir_obj.name), ["docs.csv"])
+        self.assertEqual(storage.load_dataframe(self.csv_path).shape, (2, 3))
+
+    def test_columnar_manifest_is_authoritative(self):
+        for manifest_format, suffix in (("parquet", ".parquet"), ("arrow", ".arrow")):
+            with self.subTest(manifest_format=manifest_format):
+                storage = LocalStorage(manifest_format=manifest_format)
+                storage.save_dataframe(self.df, self.csv_path)
+
+                columnar_path = os.path.join(self.test_dir_obj.name, f"docs{suffix}")
+                self.assertEqual(storage.manifest_path(self.csv_path), columnar_path)
+                self.assertTrue(os.path.exists(columnar_path))
+                # The CSV export is still written
+                self.assertEqual(pl.read_csv(self.csv_path).shape, (2, 3))
+
+                # Loading the columnar file keeps the types and nulls
+                self.assertTrue(storage.load_dataframe(self.csv_path).equals(self.df))
+
+    def test_loaded_manifest_can_be_replaced(self):
+        for manifest_format in ("parquet", "arrow"):
+            with self.subTest(manifest_format=manifest_format):
+                storage = LocalStorage(manifest_format=manifest_format)
+                storage.save_dataframe(self.df, self.csv_path)
+
+                with (
+                    patch("polars.read_ipc", wraps=pl.read_ipc) as read_ipc,
+                    patch("polars.read_parquet", wraps=pl.read_parquet) as read,
+                ):
+                    loaded = storage.load_dataframe(self.csv_path)
+                    storage.save_dataframe(loaded.head(1), self.csv_path)
+
+                calls = read_ipc.call_args_list + read.call_args_list
+                self.assertEqual(len(calls), 1)
+                self.assertFalse(calls[0].kwargs["memory_map"])
+                self.assertEqual(storage.load_dataframe(self.csv_path).height, 1)
+
+    def test_checkpoint_skips_the_csv_export(self):
+        storage = LocalStorage(manifest_format="parquet")
+        storage.save_dataframe(self.df, self.csv_path)
+        before = os.path.getmtime(self.csv_path)
+
+        storage.save_dataframe(self.df.head(1), self.csv_path, final=False)
+
+        self.assertEqual(os.path.getmtime(self.csv_path), before)
+        self.assertEqual(pl.read_csv(self.csv_path).height, 2)
+        # The checkpoint is what gets loaded
+        self.assertEqual(storage.load_dataframe(self.csv_path).height, 1)
+
+        storage.save_dataframe(self.df.head(1), self.csv_path)
+        self.assertEqual(pl.read_csv(self.csv_path).height, 1)
+
+    def test_csv_manifest_is_always_written(self):
+        storage = LocalStorage()
+        storage.save_dataframe(self.df, self.csv_path, final=False)
+        self.assertEqual(storage.load_dataframe(self.csv_path).height, 2)
+
+    def test_falls_back_to_csv(self):
+        # A CSV-only manifest from an earlier run is still loaded
+        self.df.write_csv(self.csv_path)
+        storage = LocalStorage(manifest_format="parquet")
+        self.assertEqual(storage.load_dataframe(self.csv_path).shape, (2, 3))
+
+    def test_edited_csv_wins(self):
+        storage = LocalStorage(manifest_format="parquet")
+        storage.save_dataframe(self.df, self.csv_path)
+
+        pl.DataFrame({"URL": ["url3"]}).write_csv(self.csv_path)
+        later = time.time() + 10
+        os.utime(self.csv_path, (later, later))
+
+        self.assertEqual(
+            storage.load_dataframe(self.csv_path)["URL"].to_list(), ["url3"]
+        )
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            LocalStorage(manifest_format="feather")
+
+
+if __name__ == "__main__":
+    unittest.main()
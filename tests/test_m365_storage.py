@@ -0,0 +1,458 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlparse
+
+import polars as pl
+
+from youtube_to_docs.storage import M365Storage
+
+
+class GraphStandIn(ThreadingHTTPServer):
+    """A local stand-in for the few Graph endpoints used by the manifest."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), GraphHandler)
+        self.files: dict[str, bytes] = {}
+        self.folders: set[str] = set()
+        self.calls: list[tuple[str, str]] = []
+        self.batches: list[list[dict]] = []
+        # Items returned by the next delta query
+        self.changes: list[dict] = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def parent_reference(self, path: str) -> dict:
+        parent = path.rsplit("/", 1)[0] if "/" in path else ""
+        return {
+            "driveId": "drive",
+            "id": f"id-{parent}" if parent else "id-root",
+            "path": f"/drive/root:/{parent}",
+        }
+
+    def item(self, path: str) -> dict:
+        return {
+            "id": f"id-{path}",
+            "name": path.rsplit("/", 1)[-1],
+            "webUrl": f"https://sharepoint.example/{path}",
+            "@microsoft.graph.downloadUrl": f"{self.base_url}/download/{path}",
+            "parentReference": self.parent_reference(path),
+        }
+
+    def folder_item(self, path: str) -> dict:
+        return {
+            "id": f"id-{path}",
+            "name": path.rsplit("/", 1)[-1],
+            "folder": {},
+            "parentReference": self.parent_reference(path),
+        }
+
+    def children(self, folder: str, skip: int = 0) -> tuple[int, dict]:
+        """Returns a page of the children of folder (two items per page)."""
+        items = [
+            self.item(remote)
+            for remote in sorted(self.files)
+            if remote.rsplit("/", 1)[0] == folder
+        ] + [
+            self.folder_item(path)
+            for path in sorted(self.folders)
+            if path.rsplit("/", 1)[0] == folder
+        ]
+        if not items and folder not in self.folders:
+            return 404, {"error": {"code": "itemNotFound"}}
+        page = {"value": items[skip : skip + 2]}
+        if skip + 2 < len(items):
+            page["@odata.nextLink"] = (
+                f"{self.base_url}/me/drive/root:/{folder}:/children?skip={skip + 2}"
+            )
+        return 200, page
+
+
+class GraphHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes | dict = b""):
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_GET(self):
+        server = self.server
+        path = unquote(urlparse(self.path).path)
+        server.calls.append(("GET", path))
+        if path == "/me/drive/root/delta":
+            query = parse_qs(urlparse(self.path).query)
+            token = query["token"][0]
+            changes = [] if token == "latest" else server.changes
+            next_token = "1" if token == "latest" else str(int(token) + 1)
+            return self._send(
+                200,
+                {
+                    "value": changes,
+                    "@odata.deltaLink": (
+                        f"{server.base_url}/me/drive/root/delta?token={next_token}"
+                    ),
+                },
+            )
+        if path.startswith("/me/drive/root:/") and path.endswith(":/children"):
+            folder = path[len("/me/drive/root:/") : -len(":/children")]
+            query = parse_qs(urlparse(self.path).query)
+            return self._send(
+                *server.children(folder, int(query.get("skip", ["0"])[0]))
+            )
+        if path.startswith("/me/drive/root:/"):
+            remote = path[len("/me/drive/root:/") :]
+            if remote in server.files:
+                return self._send(200, server.item(remote))
+            if remote in server.folders:
+                return self._send(200, server.folder_item(remote))
+            return self._send(404, {"error": {"code": "itemNotFound"}})
+        if path.startswith("/download/"):
+            return self._send(200, server.files[path[len("/download/") :]])
+        if path.endswith("/workbook/worksheets"):
+            return self._send(200, {"value": [{"name": "Sheet 1"}]})
+        self._send(404)
+
+    def do_PUT(self):
+        server = self.server
+        path = unquote(urlparse(self.path).path)
+        server.calls.append(("PUT", path))
+        remote = path[len("/me/drive/root:/") : -len(":/content")]
+        server.files[remote] = self._body()
+        self._send(201, server.item(remote))
+
+    def do_POST(self):
+        server = self.server
+        path = unquote(urlparse(self.path).path)
+        server.calls.append(("POST", path))
+        requests_ = json.loads(self._body())["requests"]
+        server.batches.append(requests_)
+        responses = []
+        for r in requests_:
+            url = unquote(urlparse(r["url"]).path)
+            status, body = 200, {}
+            if url.startswith("/me/drive/root:/") and url.endswith(":/children"):
+                folder = url[len("/me/drive/root:/") : -len(":/children")]
+                if r["method"] == "GET":
+                    status, body = server.children(folder)
+                else:
+                    server.folders.add(f"{folder}/{r['body']['name']}")
+                    status = 201
+                    body = server.folder_item(f"{folder}/{r['body']['name']}")
+            responses.append({"id": r["id"], "status": status, "body": body})
+        self._send(200, {"responses": responses})
+
+
+class GraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = GraphStandIn()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        test_dir_obj = tempfile.TemporaryDirectory()
+        self.addCleanup(test_dir_obj.cleanup)
+        self.cache_file = Path(test_dir_obj.name) / "graph_cache.json"
+        for patcher in (
+            patch.object(M365Storage, "ID_CACHE_FILE", self.cache_file),
+            patch("youtube_to_docs.storage.atexit"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.storage = self.make_storage()
+
+    def make_storage(self) -> M365Storage:
+        with (
+            patch.dict(os.environ, {"GRAPH_BASE_URL": self.server.base_url}),
+            patch.object(M365Storage, "_get_access_token", return_value="token"),
+        ):
+            storage = M365Storage()
+        self.server.calls.clear()
+        return storage
+
+
+class TestM365StorageWorkbook(GraphTestCase):
+    def setUp(self):
+        super().setUp()
+        self.xlsx = "youtube-to-docs-artifacts/youtube-docs.xlsx"
+        self.df = pl.DataFrame(
+            {
+                "URL": ["url1", "url2", "url3"],
+                "Title": ["One", "Two", "Three"],
+                "Cost": [0.5, 1.0, 2.0],
+            }
+        )
+        with io.BytesIO() as output:
+            self.df.write_excel(output)
+            self.server.files[self.xlsx] = output.getvalue()
+
+    def test_save_patches_changed_rows_through_batch(self):
+        loaded = self.storage.load_dataframe("youtube-docs.csv")
+        self.assertEqual(loaded["URL"].to_list(), ["url1", "url2", "url3"])
+        self.server.calls.clear()
+
+        # url2 changes, url1.5 is inserted and a Summary column is added
+        df = pl.DataFrame(
+            {
+                "URL": ["url1", "url1.5", "url2", "url3"],
+                "Title": ["One", "New", "Two v2", "Three"],
+                "Summary": [None, "S", None, None],
+                "Cost": [0.5, 0.1, 1.0, 2.0],
+            }
+        )
+        link = self.storage.save_dataframe(df, "youtube-docs.csv")
+
+        self.assertEqual(link, f"https://sharepoint.example/{self.xlsx}")
+        self.assertNotIn("PUT", [method for method, _ in self.server.calls])
+        self.assertEqual(len(self.server.batches), 1)
+
+        sheet = f"/me/drive/items/id-{self.xlsx}/workbook/worksheets/Sheet%201"
+        requests_ = [
+            (r["method"], r["url"], r.get("body")) for r in self.server.batches[0]
+        ]
+        self.assertEqual(
+            requests_,
+            [
+                ("POST", f"{sheet}/range(address='C:C')/insert", {"shift": "Right"}),
+                ("POST", f"{sheet}/range(address='3:3')/insert", {"shift": "Down"}),
+                (
+                    "PATCH",
+                    f"{sheet}/range(address='A1:D1')",
+                    {"values": [["URL", "Title", "Summary", "Cost"]]},
+                ),
+                (
+                    "PATCH",
+                    f"{sheet}/range(address='A3:D4')",
+                    {
+                        "values": [
+                            ["url1.5", "New", "S", 0.1],
+                            ["url2", "Two v2", "", 1.0],
+                        ]
+                    },
+                ),
+            ],
+        )
+        # Requests run in order
+        self.assertEqual(
+            [r.get("dependsOn") for r in self.server.batches[0]],
+            [None, ["1"], ["2"], ["3"]],
+        )
+
+        # Saving the same frame again sends nothing
+        self.server.calls.clear()
+        self.storage.save_dataframe(df, "youtube-docs.csv")
+        self.assertEqual(self.server.calls, [])
+
+    def test_save_reuploads_when_rows_removed(self):
+        self.storage.load_dataframe("youtube-docs.csv")
+
+        self.storage.save_dataframe(self.df.slice(1), "youtube-docs.csv")
+
+        self.assertEqual(self.server.batches, [])
+        self.assertIn(
+            ("PUT", f"/me/drive/root:/{self.xlsx}:/content"), self.server.calls
+        )
+        saved = pl.read_excel(io.BytesIO(self.server.files[self.xlsx]))
+        self.assertEqual(saved["URL"].to_list(), ["url2", "url3"])
+
+    def test_batches_are_split(self):
+        self.storage.load_dataframe("youtube-docs.csv")
+        # Each new row needs its own insert request
+        urls = [f"new{i}" for i in range(45)]
+        df = pl.concat(
+            [
+                self.df,
+                pl.DataFrame({"URL": urls, "Title": urls, "Cost": [0.0] * len(urls)}),
+            ]
+        )
+
+        self.storage.save_dataframe(df, "youtube-docs.csv")
+
+        self.assertEqual([len(batch) for batch in self.server.batches], [20, 20, 6])
+
+
+class TestM365StorageListing(GraphTestCase):
+    def setUp(self):
+        super().setUp()
+        folder = "youtube-to-docs-artifacts/summary-files"
+        for name in ("a.docx", "b.docx", "c.txt", "D.png", "e.docx"):
+            self.server.files[f"{folder}/{name}"] = b""
+
+    def test_exists_is_answered_from_one_listing(self):
+        self.assertTrue(self.storage.exists("summary-files/a.md"))
+        self.assertTrue(self.storage.exists("summary-files/c.txt"))
+        self.assertTrue(self.storage.exists("summary-files/d.png"))
+        self.assertTrue(self.storage.exists("summary-files/e.md"))
+        self.assertFalse(self.storage.exists("summary-files/missing.md"))
+        self.assertFalse(self.storage.exists("other-files/missing.txt"))
+
+        # Three pages of the summary folder and one 404 for the other folder
+        self.assertEqual(len(self.server.calls), 4)
+        self.assertTrue(
+            all(path.endswith(":/children") for _, path in self.server.calls)
+        )
+
+    def test_writes_update_the_listing(self):
+        self.assertFalse(self.storage.exists("summary-files/new.png"))
+        self.storage.write_bytes("summary-files/new.png", b"png")
+        self.server.calls.clear()
+        self.storage.item_cache.clear()
+
+        self.assertTrue(self.storage.exists("summary-files/new.png"))
+        self.assertEqual(self.server.calls, [])
+
+    def test_ensure_directories_batches_lookups_and_creates(self):
+        self.server.folders.update(
+            {
+                "youtube-to-docs-artifacts",
+                "youtube-to-docs-artifacts/summary-files",
+                "youtube-to-docs-artifacts/qa-files",
+            }
+        )
+
+        self.storage.ensure_directories(["summary-files", "qa-files", "tag-files"])
+
+        # The root folder and its listing (two pages), then one batch for the rest
+        self.assertEqual(
+            self.server.calls,
+            [
+                ("GET", "/me/drive/root:/youtube-to-docs-artifacts"),
+                ("GET", "/me/drive/root:/youtube-to-docs-artifacts:/children"),
+                ("GET", "/me/drive/root:/youtube-to-docs-artifacts:/children"),
+                ("POST", "/$batch"),
+            ],
+        )
+        self.assertEqual(
+            [(r["method"], "dependsOn" in r) for r in self.server.batches[0]],
+            [("GET", False), ("GET", False), ("POST", False)],
+        )
+        self.assertIn("youtube-to-docs-artifacts/tag-files", self.server.folders)
+
+        self.server.calls.clear()
+        self.assertFalse(self.storage.exists("qa-files/a.md"))
+        self.assertFalse(self.storage.exists("tag-files/a.txt"))
+        self.assertEqual(self.server.calls, [])
+        # summary-files has more than one page, so it is listed in full on use
+        self.assertTrue(self.storage.exists("summary-files/e.md"))
+        self.assertEqual(len(self.server.calls), 3)
+
+    def test_listings_persist_across_runs(self):
+        self.assertTrue(self.storage.exists("summary-files/a.md"))
+        self.storage._save_id_cache()
+        saved = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        listing = saved[self.server.base_url]["listings"][
+            "youtube-to-docs-artifacts/summary-files"
+        ]
+        # Download URLs expire, so they are not persisted
+        self.assertNotIn("@microsoft.graph.downloadUrl", listing["a.docx"])
+
+        # Another client deletes a.docx and adds f.docx in the meantime. Delta
+        # items carry the id of their parent but not its path
+        folder_id = "id-youtube-to-docs-artifacts/summary-files"
+        self.server.changes = [
+            {"id": "id-youtube-to-docs-artifacts/summary-files/a.docx", "deleted": {}},
+            {
+                "id": "id-f",
+                "name": "f.docx",
+                "file": {},
+                "parentReference": {"driveId": "drive", "id": folder_id},
+            },
+        ]
+
+        storage = self.make_storage()
+        self.assertFalse(storage.exists("summary-files/a.md"))
+        self.assertTrue(storage.exists("summary-files/b.md"))
+        self.assertTrue(storage.exists("summary-files/f.md"))
+        # One delta query replaces all listing calls
+        self.assertEqual(self.server.calls, [])
+        self.assertTrue(storage.delta_link.endswith("token=2"))
+
+    def test_delta_items_are_placed_by_parent_id(self):
+        self.server.folders.update(
+            {"youtube-to-docs-artifacts", "youtube-to-docs-artifacts/qa-files"}
+        )
+        self.storage.ensure_directories(["qa-files"])
+        self.storage._save_id_cache()
+
+        # Another client creates a folder in the root and a file in qa-files,
+        # and changes something outside the artifacts folder
+        root = "youtube-to-docs-artifacts"
+        self.server.folders.add(f"{root}/tag-files")
+        self.server.changes = [
+            {
+                "id": f"id-{root}/tag-files",
+                "name": "tag-files",
+                "folder": {},
+                "parentReference": {"driveId": "drive", "id": f"id-{root}"},
+            },
+            {
+                "id": "id-g",
+                "name": "g.txt",
+                "file": {},
+                "parentReference": {"driveId": "drive", "id": f"id-{root}/qa-files"},
+            },
+            {
+                "id": "id-elsewhere",
+                "name": "notes.txt",
+                "file": {},
+                "parentReference": {"driveId": "drive", "id": "id-unrelated"},
+            },
+        ]
+
+        storage = self.make_storage()
+        self.server.batches.clear()
+        storage.ensure_directories(["tag-files"])
+
+        self.assertIn("tag-files", storage.folder_listings[root])
+        self.assertTrue(storage.exists("qa-files/g.txt"))
+        # The folder is found, not created again with a new name
+        self.assertFalse(
+            any(r["method"] == "POST" for b in self.server.batches for r in b)
+        )
+        self.assertNotIn(f"{root}/tag-files 1", self.server.folders)
+
+    def test_moved_folder_drops_its_listings(self):
+        self.assertTrue(self.storage.exists("summary-files/a.md"))
+        self.storage.exists("youtube-docs.csv")
+        self.storage._save_id_cache()
+        self.server.changes = [
+            {
+                "id": "id-summary",
+                "name": "summary-files",
+                "folder": {},
+                "parentReference": {"driveId": "drive", "id": "id-somewhere-else"},
+            }
+        ]
+        self.storage.folder_listings["youtube-to-docs-artifacts"]["summary-files"] = {
+            "id": "id-summary",
+            "name": "summary-files",
+            "folder": {},
+        }
+        self.storage._save_id_cache()
+
+        storage = self.make_storage()
+
+        self.assertNotIn(
+            "youtube-to-docs-artifacts/summary-files", storage.folder_listings
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
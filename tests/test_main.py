@@ -1,11 +1,14 @@
 import os
 import tempfile
+import threading
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 import polars as pl
 
-from youtube_to_docs import main
+from youtube_to_docs import llm_cache, main
+from youtube_to_docs.journal import Journal
+from youtube_to_docs.storage import LocalStorage
 
 
 class TestMain(unittest.TestCase):
@@ -14,8 +17,10 @@ class TestMain(unittest.TestCase):
         self.test_dir = self.test_dir_obj.name
         self.outfile = os.path.join(self.test_dir, "test_output_main.csv")
 
-        self.sleep_patcher = patch("youtube_to_docs.main.time.sleep")
+        self.sleep_patcher = patch("youtube_to_docs.ratelimit.time.sleep")
         self.mock_sleep = self.sleep_patcher.start()
+        # main() turns on the LLM response cache for the rest of the process
+        self.addCleanup(llm_cache.reset_llm_cache)
 
         # Create dummy audio file for tests that need it inside the temp dir
         self.dummy_audio = os.path.join(self.test_dir, "dummy_audio.m4a")
@@ -27,7 +32,7 @@ class TestMain(unittest.TestCase):
         self.test_dir_obj.cleanup()
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -45,6 +50,7 @@ class TestMain(unittest.TestCase):
         mock_resolve,
         mock_svc,
     ):
+        mock_svc.side_effect = lambda: MagicMock()
         mock_gen_tags.return_value = ("tag1, tag2", 10, 5)
         mock_resolve.return_value = ["vid1"]
         mock_details.return_value = (
@@ -79,9 +85,11 @@ class TestMain(unittest.TestCase):
         )  # Since pricing is mocked to 0.0
         self.assertIn("Transcript File human generated", df.columns)
         self.assertIn("Transcript characters from youtube", df.columns)
+        # Video IDs are read on another thread, with a service of their own
+        self.assertIsNot(mock_resolve.call_args.args[1], mock_details.call_args.args[1])
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -132,7 +140,7 @@ class TestMain(unittest.TestCase):
         # But here we just check if the cost column is missing, which it should be.
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -195,7 +203,7 @@ class TestMain(unittest.TestCase):
         self.assertIn("https://www.youtube.com/watch?v=vid2", df["URL"].to_list())
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("os.makedirs")
@@ -242,7 +250,7 @@ class TestMain(unittest.TestCase):
                 os.remove(dummy_transcript)
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_model_pricing")
     @patch("youtube_to_docs.main.generate_summary")
     @patch("youtube_to_docs.main.generate_tags")
@@ -307,7 +315,7 @@ class TestMain(unittest.TestCase):
         self.assertIn("Transcript File human generated", df.columns)
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -366,7 +374,7 @@ class TestMain(unittest.TestCase):
             self.assertEqual(cols[i], col)
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.generate_summary")
@@ -452,7 +460,7 @@ class TestMain(unittest.TestCase):
                 )
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -514,7 +522,7 @@ class TestMain(unittest.TestCase):
         self.assertIn("Transcript characters from youtube (es)", df.columns)
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -575,7 +583,74 @@ class TestMain(unittest.TestCase):
         self.assertIn("Transcript File human generated (es)", df.columns)
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("youtube_to_docs.main.get_model_pricing")
+    @patch("youtube_to_docs.main.generate_summary")
+    @patch("youtube_to_docs.main.generate_tags")
+    @patch("os.makedirs")
+    def test_multiple_languages_concurrent(
+        self,
+        mock_makedirs,
+        mock_gen_tags,
+        mock_gen_summary,
+        mock_get_pricing,
+        mock_fetch_trans,
+        mock_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_gen_tags.return_value = ("tag1, tag2", 10, 5)
+        mock_resolve.return_value = ["vid1"]
+        mock_details.return_value = (
+            "Title 1",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url1",
+        )
+        mock_gen_summary.return_value = ("Summary", 100, 50)
+        mock_get_pricing.return_value = (0.0, 0.0)
+
+        # English runs first, then es and fr must be fetching at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        fetched = []
+
+        def fetch_side_effect(video_id, language="en"):
+            fetched.append(language)
+            if language != "en":
+                barrier.wait()
+            return (f"Transcript {language}", False, "")
+
+        mock_fetch_trans.side_effect = fetch_side_effect
+
+        with patch(
+            "sys.argv",
+            [
+                "main.py",
+                "vid1",
+                "-o",
+                self.outfile,
+                "-m",
+                "gemini-test",
+                "--language",
+                "es,en,fr",
+            ],
+        ):
+            with patch("builtins.open", mock_open()):
+                main.main()
+
+        self.assertEqual(fetched[0], "en")
+        df = pl.read_csv(self.outfile)
+        self.assertIn("Summary Text gemini-test from youtube", df.columns)
+        self.assertIn("Summary Text gemini-test from youtube (es)", df.columns)
+        self.assertIn("Summary Text gemini-test from youtube (fr)", df.columns)
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -586,7 +661,7 @@ class TestMain(unittest.TestCase):
     @patch("youtube_to_docs.main.generate_qa")
     @patch("youtube_to_docs.main.extract_audio")
     @patch("youtube_to_docs.storage.LocalStorage.upload_file")
-    @patch("youtube_to_docs.main.generate_transcript")
+    @patch("youtube_to_docs.main.transcribe_audio")
     @patch("youtube_to_docs.main.generate_one_sentence_summary")
     @patch("youtube_to_docs.main.generate_tags")
     @patch("os.makedirs")
@@ -667,8 +742,12 @@ class TestMain(unittest.TestCase):
         mock_gen_info.assert_called()
         self.assertEqual(mock_gen_info.call_args.args[0], "gemini-2.5-flash-image")
 
+        # The transcript and SRT come from a single (chunked) STT call
+        mock_gen_transcript.assert_called_once()
+        self.assertEqual(mock_gen_transcript.call_args.kwargs["chunk_minutes"], 10)
+
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -679,7 +758,7 @@ class TestMain(unittest.TestCase):
     @patch("youtube_to_docs.main.generate_qa")
     @patch("youtube_to_docs.main.extract_audio")
     @patch("youtube_to_docs.storage.LocalStorage.upload_file")
-    @patch("youtube_to_docs.main.generate_transcript")
+    @patch("youtube_to_docs.main.transcribe_audio")
     @patch("youtube_to_docs.main.generate_one_sentence_summary")
     @patch("youtube_to_docs.main.generate_tags")
     @patch("os.makedirs")
@@ -757,7 +836,7 @@ class TestMain(unittest.TestCase):
         self.assertEqual(mock_gen_info.call_args.args[0], "gemini-3-pro-image-preview")
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -768,7 +847,7 @@ class TestMain(unittest.TestCase):
     @patch("youtube_to_docs.main.generate_qa")
     @patch("youtube_to_docs.main.extract_audio")
     @patch("youtube_to_docs.storage.LocalStorage.upload_file")
-    @patch("youtube_to_docs.main.generate_transcript")
+    @patch("youtube_to_docs.main.transcribe_audio")
     @patch("youtube_to_docs.main.generate_one_sentence_summary")
     @patch("youtube_to_docs.main.generate_tags")
     @patch("os.makedirs")
@@ -848,7 +927,7 @@ class TestMain(unittest.TestCase):
         self.assertEqual(mock_gen_info.call_args.args[0], "gemini-3-pro-image-preview")
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -903,7 +982,7 @@ class TestMain(unittest.TestCase):
         )
 
     @patch("youtube_to_docs.main.get_youtube_service")
-    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.iter_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
     @patch("youtube_to_docs.main.fetch_transcript")
     @patch("youtube_to_docs.main.get_model_pricing")
@@ -956,6 +1035,470 @@ class TestMain(unittest.TestCase):
         )
         self.assertTrue(any_results_header)
 
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("youtube_to_docs.main.get_model_pricing")
+    @patch("youtube_to_docs.main.generate_summary")
+    @patch("youtube_to_docs.main.generate_tags")
+    @patch("os.makedirs")
+    def test_workers(
+        self,
+        mock_makedirs,
+        mock_gen_tags,
+        mock_gen_summary,
+        mock_get_pricing,
+        mock_fetch_trans,
+        mock_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_gen_tags.return_value = ("tag1, tag2", 10, 5)
+        mock_resolve.return_value = ["vid1", "vid2", "vid3"]
+
+        def details_side_effect(video_id, service):
+            return (
+                f"Title {video_id}",
+                "Desc",
+                f"2023-01-0{video_id[-1]}",
+                "Chan",
+                "Tags",
+                "0:01:00",
+                f"url-{video_id}",
+            )
+
+        mock_details.side_effect = details_side_effect
+        mock_fetch_trans.return_value = ("Transcript", False, "")
+        mock_gen_summary.return_value = ("Summary", 100, 50)
+        mock_get_pricing.return_value = (0.0, 0.0)
+
+        with patch(
+            "sys.argv",
+            [
+                "main.py",
+                "vid1,vid2,vid3",
+                "-o",
+                self.outfile,
+                "-m",
+                "gemini-test",
+                "--workers",
+                "3",
+            ],
+        ):
+            with patch("builtins.open", mock_open()):
+                main.main()
+
+        self.assertEqual(mock_details.call_count, 3)
+        # Worker temp directories are isolated per thread
+        self.assertTrue(
+            any("video-worker" in str(call) for call in mock_makedirs.call_args_list)
+        )
+        df = pl.read_csv(self.outfile)
+        self.assertEqual(len(df), 3)
+        # Manifest is still sorted by publish date
+        self.assertEqual(
+            df["URL"].to_list(),
+            [
+                "https://www.youtube.com/watch?v=vid3",
+                "https://www.youtube.com/watch?v=vid2",
+                "https://www.youtube.com/watch?v=vid1",
+            ],
+        )
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("youtube_to_docs.main.get_model_pricing")
+    @patch("youtube_to_docs.main.generate_summary")
+    @patch("youtube_to_docs.main.extract_speakers")
+    @patch("youtube_to_docs.main.generate_qa")
+    @patch("youtube_to_docs.main.generate_one_sentence_summary")
+    @patch("youtube_to_docs.main.generate_tags")
+    @patch("os.makedirs")
+    def test_multiple_models_concurrent(
+        self,
+        mock_makedirs,
+        mock_gen_tags,
+        mock_gen_one_sentence,
+        mock_gen_qa,
+        mock_extract_speakers,
+        mock_gen_summary,
+        mock_get_pricing,
+        mock_fetch_trans,
+        mock_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_resolve.return_value = ["vid1"]
+        mock_details.return_value = (
+            "Title 1",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url1",
+        )
+        mock_fetch_trans.return_value = ("Transcript 1", False, "")
+        mock_get_pricing.return_value = (0.0, 0.0)
+        mock_extract_speakers.return_value = ("Speaker 1", 10, 10)
+        mock_gen_qa.return_value = ("Q&A", 20, 20)
+        mock_gen_one_sentence.return_value = ("One sentence", 5, 5)
+        mock_gen_tags.return_value = ("tag1, tag2", 10, 5)
+
+        # Each model's summary only returns once both models are summarizing
+        barrier = threading.Barrier(2, timeout=5)
+
+        def summary_side_effect(model_name, *args, **kwargs):
+            barrier.wait()
+            return (f"Summary {model_name}", 100, 50)
+
+        mock_gen_summary.side_effect = summary_side_effect
+
+        with patch(
+            "sys.argv",
+            ["main.py", "vid1", "-o", self.outfile, "-m", "model-a,model-b"],
+        ):
+            with patch("builtins.open", mock_open()):
+                main.main()
+
+        df = pl.read_csv(self.outfile)
+        self.assertEqual(df[0, "Summary Text model-a from youtube"], "Summary model-a")
+        self.assertEqual(df[0, "Summary Text model-b from youtube"], "Summary model-b")
+        # Columns are merged in model order
+        self.assertLess(
+            df.columns.index("Summary Text model-a from youtube"),
+            df.columns.index("Summary Text model-b from youtube"),
+        )
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_videos_details")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("os.makedirs")
+    def test_batched_video_details(
+        self,
+        mock_makedirs,
+        mock_fetch_trans,
+        mock_details,
+        mock_batch_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_resolve.return_value = ["vid1", "vid2"]
+        # vid2 is missing from the batch and is fetched on its own
+        mock_batch_details.return_value = {
+            "vid1": (
+                "Title 1",
+                "Desc",
+                "2023-01-01",
+                "Chan",
+                "Tags",
+                "0:01:00",
+                "https://www.youtube.com/watch?v=vid1",
+            )
+        }
+        mock_details.return_value = (
+            "Title 2",
+            "Desc",
+            "2023-01-02",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "https://www.youtube.com/watch?v=vid2",
+        )
+        mock_fetch_trans.return_value = None
+
+        with patch("sys.argv", ["main.py", "vid1,vid2", "-o", self.outfile]):
+            main.main()
+
+        mock_batch_details.assert_called_once_with(
+            ["vid1", "vid2"], mock_svc.return_value
+        )
+        mock_details.assert_called_once_with("vid2", mock_svc.return_value)
+        df = pl.read_csv(self.outfile)
+        self.assertEqual(df["Title"].to_list(), ["Title 2", "Title 1"])
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("os.makedirs")
+    def test_incremental_passes_manifest_state(
+        self, mock_makedirs, mock_resolve, mock_svc
+    ):
+        pl.DataFrame(
+            {
+                "URL": [
+                    "https://www.youtube.com/watch?v=vid1",
+                    "https://www.youtube.com/watch?v=vid2",
+                ],
+                "Title": ["Title 1", "Title 2"],
+                "Data Published": ["2023-01-01", "2023-02-01"],
+            }
+        ).write_csv(self.outfile)
+        mock_resolve.return_value = []
+
+        with patch(
+            "sys.argv", ["main.py", "@channel", "-o", self.outfile, "--incremental"]
+        ):
+            main.main()
+
+        mock_resolve.assert_called_once_with(
+            "@channel",
+            mock_svc.return_value,
+            known_video_ids={"vid1", "vid2"},
+            latest_published="2023-02-01",
+        )
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("os.makedirs")
+    def test_replays_journal_from_interrupted_run(
+        self, mock_makedirs, mock_resolve, mock_svc
+    ):
+        pl.DataFrame(
+            {
+                "URL": ["https://www.youtube.com/watch?v=vid1"],
+                "Title": ["Title 1"],
+                "Data Published": ["2023-01-01"],
+            }
+        ).write_csv(self.outfile)
+        journal_file = f"{self.outfile}.journal.jsonl"
+        with open(journal_file, "w", encoding="utf-8") as f:
+            f.write(
+                '{"URL": "https://www.youtube.com/watch?v=vid2", '
+                '"Title": "Title 2", "Data Published": "2023-01-02"}\n'
+            )
+        mock_resolve.return_value = []
+
+        with patch("sys.argv", ["main.py", "@channel", "-o", self.outfile]):
+            main.main()
+
+        df = pl.read_csv(self.outfile)
+        self.assertEqual(df["Title"].to_list(), ["Title 2", "Title 1"])
+        self.assertFalse(os.path.exists(journal_file))
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("youtube_to_docs.main.extract_speakers")
+    @patch("youtube_to_docs.main.generate_qa")
+    @patch("youtube_to_docs.main.generate_summary")
+    @patch("youtube_to_docs.main.generate_one_sentence_summary")
+    @patch("youtube_to_docs.main.generate_tags")
+    def test_slim_manifest(
+        self,
+        mock_tags,
+        mock_one_sentence,
+        mock_summary,
+        mock_qa,
+        mock_speakers,
+        mock_fetch_trans,
+        mock_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_resolve.return_value = ["vid1"]
+        mock_details.return_value = (
+            "Title 1",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url1",
+        )
+        mock_fetch_trans.return_value = ("Transcript 1", False, "")
+        mock_speakers.return_value = ("Speaker 1 (Host)", 10, 5)
+        mock_qa.return_value = ("| Q | A |", 10, 5)
+        mock_summary.return_value = ("Summary 1", 100, 50)
+        mock_one_sentence.return_value = ("One sentence.", 10, 5)
+        mock_tags.return_value = ("tag1, tag2", 10, 5)
+        argv = ["main.py", "vid1", "-o", self.outfile, "-m", "m", "--slim-manifest"]
+
+        with patch("sys.argv", argv):
+            main.main()
+
+        df = pl.read_csv(self.outfile)
+        self.assertNotIn("Summary Text m from youtube", df.columns)
+        self.assertNotIn("QA Text m from youtube", df.columns)
+        self.assertNotIn("Speakers m from youtube", df.columns)
+        self.assertEqual(df[0, "Summary Text m from youtube Size"], 9)
+        self.assertEqual(df[0, "One Sentence Summary m from youtube"], "One sentence.")
+        summary_file = df[0, "Summary File m from youtube"]
+        with open(summary_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "Summary 1")
+
+        # A second run finds the artifacts and does not regenerate them
+        with patch("sys.argv", argv):
+            main.main()
+
+        mock_summary.assert_called_once()
+        mock_qa.assert_called_once()
+        mock_speakers.assert_called_once()
+        self.assertEqual(pl.read_csv(self.outfile).columns, df.columns)
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("youtube_to_docs.main.extract_speakers")
+    @patch("youtube_to_docs.main.generate_qa")
+    @patch("youtube_to_docs.main.generate_summary")
+    @patch("youtube_to_docs.main.generate_one_sentence_summary")
+    @patch("youtube_to_docs.main.generate_tags")
+    def test_slim_manifest_journals_slim_rows(
+        self,
+        mock_tags,
+        mock_one_sentence,
+        mock_summary,
+        mock_qa,
+        mock_speakers,
+        mock_fetch_trans,
+        mock_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_resolve.return_value = ["vid1"]
+        mock_details.return_value = (
+            "Title 1",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url1",
+        )
+        mock_fetch_trans.return_value = ("Transcript 1", False, "")
+        mock_speakers.return_value = ("Speaker 1 (Host)", 10, 5)
+        mock_qa.return_value = ("| Q | A |", 10, 5)
+        mock_summary.return_value = ("Summary 1", 100, 50)
+        mock_one_sentence.return_value = ("One sentence.", 10, 5)
+        mock_tags.return_value = ("tag1, tag2", 10, 5)
+        journaled = []
+        append = Journal.append
+
+        def record(journal, row, finished=True):
+            journaled.append(dict(row))
+            append(journal, row, finished)
+
+        argv = ["main.py", "vid1", "-o", self.outfile, "-m", "m", "--slim-manifest"]
+        with (
+            patch("sys.argv", argv),
+            patch.object(Journal, "append", autospec=True, side_effect=record),
+        ):
+            main.main()
+
+        # Later stages still get the texts
+        self.assertEqual(mock_one_sentence.call_args.args[1], "Summary 1")
+        self.assertEqual(mock_tags.call_args.args[1], "Summary 1")
+        self.assertEqual(mock_qa.call_args.args[2], "Speaker 1 (Host)")
+        # The finished row only references the artifact files
+        row = journaled[-1]
+        for col in (
+            "Summary Text m from youtube",
+            "QA Text m from youtube",
+            "Speakers m from youtube",
+        ):
+            self.assertIsNone(row.get(col), col)
+        self.assertEqual(row["Summary Text m from youtube Size"], 9)
+        self.assertTrue(row["Summary File m from youtube"])
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    def test_save_every(self, mock_fetch_trans, mock_details, mock_resolve, mock_svc):
+        mock_resolve.return_value = ["vid1", "vid2", "vid3"]
+        mock_details.return_value = (
+            "Title",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url",
+        )
+        mock_fetch_trans.return_value = ("Transcript", False, "")
+        argv = ["main.py", "@channel", "-o", self.outfile, "--save-every", "2"]
+
+        with (
+            patch("sys.argv", argv),
+            patch.object(
+                LocalStorage, "save_dataframe", autospec=True, return_value=""
+            ) as mock_save,
+        ):
+            main.main()
+
+        # One compaction after two videos and the final save
+        self.assertEqual(mock_save.call_count, 2)
+        self.assertEqual(len(mock_save.call_args_list[0].args[1]), 2)
+        self.assertEqual(len(mock_save.call_args_list[1].args[1]), 3)
+
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.iter_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    def test_interrupt_saves_finished_videos(
+        self, mock_fetch_trans, mock_details, mock_resolve, mock_svc
+    ):
+        mock_resolve.return_value = ["vid1", "vid2"]
+        mock_details.return_value = (
+            "Title",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url",
+        )
+        mock_fetch_trans.side_effect = [("Transcript", False, ""), KeyboardInterrupt]
+
+        with patch("sys.argv", ["main.py", "@channel", "-o", self.outfile]):
+            with self.assertRaises(KeyboardInterrupt):
+                main.main()
+
+        df = pl.read_csv(self.outfile)
+        self.assertEqual(df["URL"].to_list(), ["https://www.youtube.com/watch?v=vid1"])
+        # Only the unfinished video is left in the journal, for the next run
+        replayed = Journal(f"{self.outfile}.journal.jsonl").replay()
+        self.assertEqual(
+            [row["URL"] for row in replayed], ["https://www.youtube.com/watch?v=vid2"]
+        )
+
+
+class TestManifestIndex(unittest.TestCase):
+    def test_lookup(self):
+        df = pl.DataFrame(
+            {
+                "URL": ["url1", "url2", "url1"],
+                "Title": ["Title 1", "Title 2", "Duplicate"],
+                "Audio File": ["a1.m4a", None, "dup.m4a"],
+            }
+        )
+        index = main.ManifestIndex(df)
+
+        self.assertEqual(len(index), 2)
+        self.assertIn("url2", index)
+        self.assertNotIn("url3", index)
+        self.assertEqual(
+            index.get("url1"),
+            {"URL": "url1", "Title": "Title 1", "Audio File": "a1.m4a"},
+        )
+        self.assertIsNone(index.get("url3"))
+        self.assertEqual(index.value("url1", "Audio File"), "a1.m4a")
+        self.assertIsNone(index.value("url2", "Audio File"))
+        self.assertIsNone(index.value("url1", "Missing"))
+
+    def test_empty(self):
+        for df in (None, pl.DataFrame({"Title": ["No URL column"]})):
+            index = main.ManifestIndex(df)
+            self.assertEqual(len(index), 0)
+            self.assertIsNone(index.get("url1"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from youtube_to_docs import mapreduce, models
+
+
+def srt_block(index, second, text):
+    return f"{index}\n00:00:{second:02d},000 --> 00:00:{second + 1:02d},000\n{text}"
+
+
+class TestChunking(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(mapreduce.reset_map_reduce)
+
+    def test_chunk_budget(self):
+        # Map-reduce is off unless it is enabled
+        self.assertEqual(mapreduce.chunk_budget("gemini-3-flash-preview"), 0)
+
+        mapreduce.configure_map_reduce(None)
+        self.assertEqual(mapreduce.chunk_budget("gemini-3-flash-preview"), 100_000)
+        self.assertEqual(mapreduce.chunk_budget("bedrock-claude-haiku-4-5"), 60_000)
+        self.assertEqual(
+            mapreduce.chunk_budget("unknown-model"), models.DEFAULT_CHUNK_TOKENS
+        )
+
+        mapreduce.configure_map_reduce(20_000)
+        self.assertEqual(mapreduce.chunk_budget("gemini-3-flash-preview"), 20_000)
+
+    def test_parse_chunk_tokens(self):
+        self.assertIsNone(mapreduce.parse_chunk_tokens("auto"))
+        self.assertEqual(mapreduce.parse_chunk_tokens("20000"), 20_000)
+        self.assertEqual(mapreduce.parse_chunk_tokens("0"), 0)
+        for spec in ("-1", "lots"):
+            with self.assertRaises(ValueError):
+                mapreduce.parse_chunk_tokens(spec)
+
+    def test_short_transcript_is_one_chunk(self):
+        self.assertEqual(mapreduce.split_transcript("Hello.", 100), ["Hello."])
+        self.assertEqual(
+            mapreduce.split_transcript("Hello. " * 100, 0), ["Hello. " * 100]
+        )
+
+    def test_plain_text_is_split_between_sentences(self):
+        transcript = "First sentence here. Second sentence here. Third one here."
+
+        chunks = mapreduce.split_transcript(transcript, 12)
+
+        self.assertEqual(
+            chunks,
+            ["First sentence here. Second sentence here.", "Third one here."],
+        )
+
+    def test_srt_is_split_between_cues(self):
+        blocks = [srt_block(i, i, f"Cue number {i} " + "x" * 20) for i in range(1, 7)]
+
+        chunks = mapreduce.split_transcript("\n\n".join(blocks), 40)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("\n\n".join(chunks), "\n\n".join(blocks))
+        for chunk in chunks:
+            self.assertTrue(chunk.startswith(tuple(str(i) for i in range(1, 7))))
+
+    def test_slice_timing_reference_follows_chunk_times(self):
+        reference = "\n\n".join(
+            srt_block(i, s, f"ref {s}") for i, s in enumerate([0, 20, 40, 59], 1)
+        )
+        chunk = srt_block(1, 45, "spoken")
+
+        # Cues within 30 seconds of the chunk are kept
+        self.assertEqual(
+            mapreduce.slice_timing_reference(reference, chunk, 1, 2),
+            "\n\n".join(
+                srt_block(i, s, f"ref {s}") for i, s in [(2, 20), (3, 40), (4, 59)]
+            ),
+        )
+
+    def test_group_parts_has_at_least_two_parts_per_group(self):
+        parts = ["a" * 40, "b" * 40, "c" * 40]
+
+        self.assertEqual(mapreduce.group_parts(parts, 10), [parts])
+        self.assertEqual(
+            mapreduce.group_parts(parts + ["d" * 40], 20),
+            [parts[:2], [parts[2], "d" * 40]],
+        )
+
+    def test_merge_markdown_tables(self):
+        tables = [
+            "| q | a |\n|---|---|\n| Q1 | A1 |",
+            'float("nan")',
+            "Here are the questions:\n| q | a |\n|---|---|\n| Q2 | A2 |\n| Q3 | A3 |",
+        ]
+
+        self.assertEqual(
+            mapreduce.merge_markdown_tables(tables),
+            "| q | a |\n|---|---|\n| Q1 | A1 |\n| Q2 | A2 |\n| Q3 | A3 |",
+        )
+        self.assertIsNone(mapreduce.merge_markdown_tables(["nan"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from youtube_to_docs import ratelimit
+from youtube_to_docs.utils import ErrorText
+
+
+class FakeClock:
+    """A monotonic clock that only advances when sleep is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch.multiple(
+            "youtube_to_docs.ratelimit.time",
+            monotonic=self.clock.monotonic,
+            sleep=self.clock.sleep,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_paced(self):
+        bucket = ratelimit.TokenBucket(60)  # One per second, burst of 60
+
+        for _ in range(60):
+            self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(self.clock.sleeps, [])
+
+        waited = bucket.acquire()
+        self.assertAlmostEqual(waited, 1.0)
+
+    def test_burst_size(self):
+        bucket = ratelimit.TokenBucket(60, burst=2)
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+
+    def test_debt_is_repaid_before_next_call(self):
+        bucket = ratelimit.TokenBucket(600)  # Ten tokens per second
+
+        bucket.consume(900)  # 300 tokens in debt after the full bucket
+        waited = bucket.acquire(0)
+
+        self.assertAlmostEqual(waited, 30.0)
+
+    def test_large_request_waits_for_full_bucket_only(self):
+        bucket = ratelimit.TokenBucket(60)
+        bucket.consume(60)
+
+        waited = bucket.acquire(1000)
+
+        self.assertAlmostEqual(waited, 60.0)
+
+
+class TestRateLimits(unittest.TestCase):
+    def setUp(self):
+        ratelimit.reset_rate_limits()
+        self.addCleanup(ratelimit.reset_rate_limits)
+
+    def test_get_provider(self):
+        self.assertEqual(ratelimit.get_provider("gemini-3-flash-preview"), "gemini")
+        self.assertEqual(
+            ratelimit.get_provider("vertex-claude-haiku-4-5@20251001"), "vertex"
+        )
+        self.assertEqual(ratelimit.get_provider("claude-haiku-4-5"), "bedrock")
+        self.assertEqual(ratelimit.get_provider("titan-image-generator-v2"), "bedrock")
+        self.assertEqual(ratelimit.get_provider("foundry-gpt-5-mini"), "foundry")
+        self.assertEqual(ratelimit.get_provider("imagen-4.0-generate-001"), "gemini")
+        self.assertEqual(ratelimit.get_provider("gcp-chirp3"), "gcp")
+
+    def test_parse_rate_limits(self):
+        self.assertEqual(
+            ratelimit.parse_rate_limits("gemini=1000/4000000, bedrock=50,youtube=/"),
+            {
+                "gemini": (1000.0, 4000000.0),
+                "bedrock": (50.0, None),
+                "youtube": (None, None),
+            },
+        )
+
+    def test_parse_rate_limits_invalid(self):
+        with self.assertRaises(ValueError):
+            ratelimit.parse_rate_limits("gemini")
+        with self.assertRaises(ValueError):
+            ratelimit.parse_rate_limits("gemini=fast")
+
+    def test_defaults_and_configure(self):
+        self.assertIsNotNone(ratelimit.get_limiter("transcript").requests)
+        self.assertIsNone(ratelimit.get_limiter("gemini").requests)
+
+        ratelimit.configure_rate_limits({"gemini": (100, 1000)})
+
+        limiter = ratelimit.get_limiter("gemini")
+        self.assertEqual(limiter.requests.rate_per_minute, 100)
+        self.assertEqual(limiter.tokens.rate_per_minute, 1000)
+        self.assertIs(ratelimit.get_limiter("gemini"), limiter)
+
+    def test_transcript_cold_start_is_paced(self):
+        clock = FakeClock()
+        with patch.multiple(
+            "youtube_to_docs.ratelimit.time",
+            monotonic=clock.monotonic,
+            sleep=clock.sleep,
+        ):
+            for _ in range(60):
+                ratelimit.acquire("transcript")
+
+        # Only the first couple of requests go out without waiting
+        self.assertGreaterEqual(clock.now, 57.0)
+
+    def test_rate_limited_charges_tokens(self):
+        ratelimit.configure_rate_limits({"bedrock": (None, 1000)})
+
+        @ratelimit.rate_limited
+        def call(model_name, prompt):
+            return "text", 300, 200
+
+        self.assertEqual(call("bedrock-nova-lite", "prompt"), ("text", 300, 200))
+        self.assertAlmostEqual(
+            ratelimit.get_limiter("bedrock").tokens.tokens, 500, delta=1
+        )
+
+    def test_rate_limited_without_model(self):
+        @ratelimit.rate_limited
+        def call(model_name):
+            return None, 0, 0
+
+        self.assertEqual(call(None), (None, 0, 0))
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def setUp(self):
+        ratelimit.reset_rate_limits()
+        self.addCleanup(ratelimit.reset_rate_limits)
+
+    def test_additive_increase(self):
+        controller = ratelimit.AdaptiveConcurrency(initial=2, maximum=3)
+
+        for _ in range(20):
+            controller.acquire()
+            controller.release()
+
+        self.assertEqual(controller.current, 3)
+        self.assertEqual(controller.peak, 3)
+
+    def test_multiplicative_decrease(self):
+        controller = ratelimit.AdaptiveConcurrency(initial=8)
+
+        controller.acquire()
+        controller.release(throttled=True)
+        self.assertEqual(controller.current, 4)
+
+        for _ in range(5):
+            controller.acquire()
+            controller.release(throttled=True)
+        self.assertEqual(controller.current, 1)
+        self.assertEqual(controller.throttled, 6)
+
+    def test_acquire_blocks_at_limit(self):
+        controller = ratelimit.AdaptiveConcurrency(initial=1)
+        controller.acquire()
+
+        acquired = threading.Event()
+
+        def second_call():
+            controller.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=second_call)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+
+        controller.release()
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+    def test_is_throttled(self):
+        for text in (
+            "Error: 429 RESOURCE_EXHAUSTED.",
+            "Bedrock API Error 429: slow down",
+            "Vertex API Error 503: overloaded",
+            "Error: Error code: 429 - Too Many Requests",
+        ):
+            self.assertTrue(ratelimit.is_throttled(ErrorText(text)), text)
+        self.assertFalse(
+            ratelimit.is_throttled(ErrorText("Error: GEMINI_API_KEY not found"))
+        )
+        # Summaries that merely mention the numbers are not errors
+        self.assertFalse(ratelimit.is_throttled("The talk covered HTTP 429 errors."))
+        self.assertFalse(ratelimit.is_throttled(b"429"))
+
+    def test_rate_limited_reports_throttling(self):
+        responses = iter(
+            [(ErrorText("Error: 429 RESOURCE_EXHAUSTED"), 0, 0), ("Summary", 10, 10)]
+        )
+
+        @ratelimit.rate_limited
+        def call(model_name, prompt):
+            return next(responses)
+
+        call("gemini-3-flash-preview", "prompt")
+        call("gemini-3-flash-preview", "prompt")
+
+        current, peak, throttled = ratelimit.concurrency_report()["gemini"]
+        self.assertEqual(throttled, 1)
+        self.assertEqual(current, ratelimit.INITIAL_CONCURRENCY // 2)
+        self.assertEqual(peak, ratelimit.INITIAL_CONCURRENCY)
+
+
+if __name__ == "__main__":
+    unittest.main()
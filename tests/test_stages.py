@@ -0,0 +1,103 @@
+import threading
+import unittest
+from graphlib import CycleError
+
+from youtube_to_docs.stages import StageGraph
+
+
+class TestStageGraph(unittest.TestCase):
+    def test_dependencies_run_first(self):
+        order = []
+        lock = threading.Lock()
+
+        def record(name):
+            def func():
+                with lock:
+                    order.append(name)
+                return name
+
+            return func
+
+        graph = StageGraph()
+        graph.add("qa", record("qa"), inputs=["speakers"])
+        graph.add("speakers", record("speakers"))
+        graph.add("tags", record("tags"), inputs=["summary"])
+        graph.add("summary", record("summary"))
+
+        results = graph.run()
+
+        self.assertEqual(
+            results,
+            {"qa": "qa", "speakers": "speakers", "tags": "tags", "summary": "summary"},
+        )
+        self.assertLess(order.index("speakers"), order.index("qa"))
+        self.assertLess(order.index("summary"), order.index("tags"))
+
+    def test_independent_stages_run_concurrently(self):
+        # Both stages must be running at the same time for the barrier to pass
+        barrier = threading.Barrier(2, timeout=5)
+
+        graph = StageGraph()
+        graph.add("speakers", barrier.wait)
+        graph.add("summary", barrier.wait)
+
+        graph.run()
+
+    def test_sequential_run(self):
+        order = []
+
+        graph = StageGraph()
+        graph.add("b", lambda: order.append("b"), inputs=["a"])
+        graph.add("a", lambda: order.append("a"))
+
+        graph.run(max_workers=1)
+
+        self.assertEqual(order, ["a", "b"])
+
+    def test_unproduced_inputs_are_available(self):
+        graph = StageGraph()
+        graph.add("qa", lambda: "done", inputs=["transcript"])
+
+        self.assertEqual(graph.run(), {"qa": "done"})
+
+    def test_error_skips_dependents(self):
+        ran = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        graph = StageGraph()
+        graph.add("speakers", fail)
+        graph.add("qa", lambda: ran.append("qa"), inputs=["speakers"])
+
+        with self.assertRaises(RuntimeError):
+            graph.run()
+
+        self.assertEqual(ran, [])
+
+    def test_cycle_raises(self):
+        graph = StageGraph()
+        graph.add("a", lambda: None, inputs=["b"])
+        graph.add("b", lambda: None, inputs=["a"])
+
+        with self.assertRaises(CycleError):
+            graph.run()
+
+    def test_duplicate_stage_name_raises(self):
+        graph = StageGraph()
+        graph.add("a", lambda: None)
+
+        with self.assertRaises(ValueError):
+            graph.add("a", lambda: None)
+
+    def test_duplicate_output_raises(self):
+        graph = StageGraph()
+        graph.add("a", lambda: None, outputs=["summary"])
+        graph.add("b", lambda: None, outputs=["summary"])
+
+        with self.assertRaises(ValueError):
+            graph.run()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,13 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
+import polars as pl
+
+from youtube_to_docs import storage as storage_module
 from youtube_to_docs.storage import GoogleDriveStorage
 
 
@@ -12,6 +19,16 @@ class TestGoogleDriveStorage(unittest.TestCase):
         self.mock_service = MagicMock()
         mock_build.return_value = self.mock_service
 
+        test_dir_obj = tempfile.TemporaryDirectory()
+        self.addCleanup(test_dir_obj.cleanup)
+        self.cache_file = os.path.join(test_dir_obj.name, "drive_cache.json")
+        for patcher in (
+            patch.object(GoogleDriveStorage, "ID_CACHE_FILE", self.cache_file),
+            patch("youtube_to_docs.storage.atexit"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
         # Mock Path.home() and other path ops
         mock_path_obj = MagicMock()
         mock_path.home.return_value = mock_path_obj
@@ -43,6 +60,374 @@ class TestGoogleDriveStorage(unittest.TestCase):
         # Assert service create call
         self.mock_service.files().create.assert_called_once()
 
+    def _load_sheet(self, df):
+        """Loads df as the existing manifest Sheet."""
+        self.mock_service.files().export().execute.return_value = (
+            df.write_csv().encode()
+        )
+        with patch.object(self.storage, "_get_file_id", return_value="sheet_id"):
+            loaded = self.storage.load_dataframe("youtube-docs.csv")
+        self.storage.file_cache["youtube-docs.csv"] = {
+            "id": "sheet_id",
+            "webViewLink": "https://docs.google.com/spreadsheets/d/sheet_id",
+        }
+        self.mock_service.spreadsheets().get().execute.return_value = {
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": 7,
+                        "title": "youtube-docs",
+                        "gridProperties": {"rowCount": 1000, "columnCount": 26},
+                    }
+                }
+            ]
+        }
+        self.mock_service.reset_mock()
+        return loaded
+
+    def test_save_dataframe_upserts_changed_rows(self):
+        self._load_sheet(
+            pl.DataFrame(
+                {"URL": ["url2", "url1"], "Title": ["Two", "One"], "Cost": [1, 2]}
+            )
+        )
+        df = pl.DataFrame(
+            {
+                "URL": ["url3", "url2", "url1"],
+                "Title": ["Three", "Two", "One"],
+                "Summary": ["New", None, "Done"],
+                "Cost": [3, 1, 2],
+            }
+        )
+
+        link = self.storage.save_dataframe(df, "youtube-docs.csv")
+
+        self.assertEqual(link, "https://docs.google.com/spreadsheets/d/sheet_id")
+        self.mock_service.files().update.assert_not_called()
+        structure = self.mock_service.spreadsheets().batchUpdate.call_args.kwargs
+        inserts = [r["insertDimension"]["range"] for r in structure["body"]["requests"]]
+        self.assertEqual(
+            inserts,
+            [
+                {"sheetId": 7, "dimension": "COLUMNS", "startIndex": 2, "endIndex": 3},
+                {"sheetId": 7, "dimension": "ROWS", "startIndex": 1, "endIndex": 2},
+            ],
+        )
+        values = self.mock_service.spreadsheets().values().batchUpdate.call_args
+        data = values.kwargs["body"]["data"]
+        # Header, the new row and the row with a new value; url2 is unchanged
+        self.assertEqual(
+            [d["range"] for d in data],
+            ["'youtube-docs'!A1:D1", "'youtube-docs'!A2:D2", "'youtube-docs'!A4:D4"],
+        )
+        self.assertEqual(data[1]["values"], [["url3", "Three", "New", 3]])
+        self.assertEqual(data[2]["values"], [["url1", "One", "Done", 2]])
+        self.assertEqual(values.kwargs["body"]["valueInputOption"], "RAW")
+
+        # Saving the same frame again writes nothing
+        self.mock_service.reset_mock()
+        self.storage.save_dataframe(df, "youtube-docs.csv")
+        self.mock_service.spreadsheets().values().batchUpdate.assert_not_called()
+        self.mock_service.files().update.assert_not_called()
+
+    def test_upserted_missing_values_are_blank(self):
+        self._load_sheet(pl.DataFrame({"URL": ["url1"], "Cost": [1.5]}))
+        df = pl.DataFrame(
+            {"URL": ["url1", "url2", "url3"], "Cost": [1.5, None, float("nan")]}
+        )
+
+        self.storage.save_dataframe(df, "youtube-docs.csv")
+
+        values = self.mock_service.spreadsheets().values().batchUpdate.call_args
+        data = values.kwargs["body"]["data"]
+        self.assertEqual(data[0]["values"], [["url2", ""], ["url3", ""]])
+
+        # Blank cells match the snapshot, so nothing is written again
+        self.mock_service.reset_mock()
+        self.storage.save_dataframe(df, "youtube-docs.csv")
+        self.mock_service.spreadsheets().values().batchUpdate.assert_not_called()
+
+    def test_save_dataframe_reuploads_when_rows_removed(self):
+        self._load_sheet(pl.DataFrame({"URL": ["url2", "url1"], "Title": ["2", "1"]}))
+        self.mock_service.files().update().execute.return_value = {
+            "id": "sheet_id",
+            "webViewLink": "link",
+        }
+        self.mock_service.spreadsheets().get().execute.return_value = {
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": 7,
+                        "gridProperties": {
+                            "rowCount": 1000,
+                            "frozenRowCount": 1,
+                            "frozenColumnCount": 1,
+                        },
+                    }
+                }
+            ]
+        }
+
+        with patch.object(self.storage, "_get_parent_id", return_value="parent_id"):
+            link = self.storage.save_dataframe(
+                pl.DataFrame({"URL": ["url1"], "Title": ["1"]}), "youtube-docs.csv"
+            )
+
+        self.assertEqual(link, "link")
+        self.mock_service.spreadsheets().values().batchUpdate.assert_not_called()
+        # Properties are already as wanted, so they are not updated
+        self.mock_service.spreadsheets().batchUpdate.assert_not_called()
+
+    def test_sheet_helpers(self):
+        self.assertEqual(storage_module._column_letter(0), "A")
+        self.assertEqual(storage_module._column_letter(25), "Z")
+        self.assertEqual(storage_module._column_letter(26), "AA")
+        self.assertEqual(storage_module._column_letter(701), "ZZ")
+        self.assertEqual(
+            storage_module._insert_positions(["a", "c"], ["x", "a", "b", "c"]), [0, 2]
+        )
+        self.assertIsNone(storage_module._insert_positions(["a", "c"], ["c", "a"]))
+        self.assertIsNone(storage_module._insert_positions(["a", "b"], ["a"]))
+
+    def test_exists_is_answered_from_folder_listings(self):
+        folder = "application/vnd.google-apps.folder"
+        listings = {
+            "'root_id' in parents and trashed=false": [
+                {
+                    "files": [
+                        {"id": "sum_id", "name": "summary-files", "mimeType": folder}
+                    ]
+                }
+            ],
+            "'sum_id' in parents and trashed=false": [
+                {"files": [{"id": "a_id", "name": "a.md"}], "nextPageToken": "p2"},
+                {"files": [{"id": "b_id", "name": "b.md"}]},
+            ],
+        }
+        pages = {q: iter(results) for q, results in listings.items()}
+        files = MagicMock()
+        files.list.side_effect = lambda q, **kwargs: MagicMock(
+            execute=MagicMock(side_effect=lambda: next(pages[q]))
+        )
+        self.mock_service.files.return_value = files
+
+        self.assertTrue(self.storage.exists("summary-files/a.md"))
+        self.assertTrue(self.storage.exists("summary-files/b.md"))
+        self.assertFalse(self.storage.exists("summary-files/c.md"))
+        # The root folder and two pages of summary-files
+        self.assertEqual(files.list.call_count, 3)
+
+        # Writes update the listing
+        files.create().execute.return_value = {"id": "c_id", "webViewLink": "link"}
+        self.storage.write_bytes("summary-files/c.md", b"c")
+        self.storage.file_cache.clear()
+        self.assertTrue(self.storage.exists("summary-files/c.md"))
+        self.assertEqual(files.list.call_count, 3)
+
+    def test_ensure_directories_uses_batch_requests(self):
+        folder = "application/vnd.google-apps.folder"
+        self.storage.folder_listings["root_id"] = {
+            "summary-files": {
+                "id": "sum_id",
+                "name": "summary-files",
+                "mimeType": folder,
+            }
+        }
+        responses = {
+            "qa-files": {"id": "qa_id"},
+            "sum_id": {"files": [{"id": "a_id", "name": "a.md"}]},
+        }
+        batches = []
+
+        def new_batch(callback):
+            added = []
+            batches.append(added)
+            batch = MagicMock()
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, responses[request_id], None)
+                for request_id in added
+            ]
+            return batch
+
+        self.mock_service.reset_mock()
+        self.mock_service.new_batch_http_request.side_effect = new_batch
+
+        self.storage.ensure_directories(["./summary-files", "qa-files"])
+
+        # One batch creates the missing folder, one lists the existing one
+        self.assertEqual(batches, [["qa-files"], ["sum_id"]])
+        self.assertEqual(self.storage.folder_cache["root_id/qa-files"], "qa_id")
+        self.assertTrue(self.storage.exists("summary-files/a.md"))
+        self.assertFalse(self.storage.exists("qa-files/a.md"))
+        self.mock_service.files().list().execute.assert_not_called()
+
+    def test_each_thread_has_its_own_services(self):
+        thread_service = MagicMock()
+        seen = []
+
+        with patch("youtube_to_docs.storage.build", return_value=thread_service):
+            worker = threading.Thread(target=lambda: seen.append(self.storage.service))
+            worker.start()
+            worker.join()
+
+        self.assertIs(self.storage.service, self.mock_service)
+        self.assertEqual(seen, [thread_service])
+
+    def test_concurrent_threads_create_a_folder_once(self):
+        started = threading.Barrier(8)
+        self.storage.folder_listings["root_id"] = {}
+        self.mock_service.reset_mock()
+
+        def create():
+            time.sleep(0.05)  # Gives other threads the chance to race
+            return {"id": "sum_id"}
+
+        self.mock_service.files().create().execute.side_effect = create
+
+        def ensure():
+            started.wait()
+            self.storage.ensure_directory("summary-files")
+
+        with patch("youtube_to_docs.storage.build", return_value=self.mock_service):
+            workers = [threading.Thread(target=ensure) for _ in range(8)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        self.assertEqual(self.mock_service.files().create().execute.call_count, 1)
+        self.assertEqual(self.storage.folder_cache["root_id/summary-files"], "sum_id")
+
+    def test_other_folders_are_listed_while_one_is_listed(self):
+        second_started = threading.Event()
+
+        def list_request(folder_id, page_token=None):
+            request = MagicMock()
+            if folder_id == "a_id":
+                # Under a storage-wide lock folder b could not start meanwhile
+                request.execute.side_effect = lambda: (
+                    {"files": []} if second_started.wait(5) else None
+                )
+            else:
+                second_started.set()
+                request.execute.return_value = {"files": []}
+            return request
+
+        listings = {}
+        with patch.object(self.storage, "_list_request", side_effect=list_request):
+            workers = [
+                threading.Thread(
+                    target=lambda f=f: listings.update(
+                        {f: self.storage._list_folder(f)}
+                    )
+                )
+                for f in ("a_id", "b_id")
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        self.assertEqual(listings, {"a_id": {}, "b_id": {}})
+
+    def test_finished_threads_hand_on_their_services(self):
+        seen = []
+
+        def use_services():
+            seen.append(self.storage.service)
+
+        with patch(
+            "youtube_to_docs.storage.build", side_effect=lambda *a, **k: MagicMock()
+        ) as mock_build:
+            for _ in range(3):
+                worker = threading.Thread(target=use_services)
+                worker.start()
+                worker.join()
+
+        # Only the first thread built services; the later ones reused them
+        self.assertEqual(mock_build.call_count, 3)
+        self.assertIs(seen[1], seen[0])
+        self.assertIs(seen[2], seen[0])
+
+    def _save_cache_and_restart(self, service):
+        """Persists the ID cache and starts a new run using service."""
+        self.storage.changes_token = "t1"
+        self.storage.folder_cache = {"root_id/summary-files": "sum_id"}
+        self.storage.folder_listings = {
+            "sum_id": {
+                "a.md": {"id": "a_id", "name": "a.md"},
+                "b.md": {"id": "b_id", "name": "b.md"},
+            }
+        }
+        self.storage._save_id_cache()
+
+        with (
+            patch("youtube_to_docs.storage.build", return_value=service),
+            patch.object(GoogleDriveStorage, "_get_creds"),
+        ):
+            return GoogleDriveStorage("workspace")
+
+    def test_id_cache_is_synced_with_changes(self):
+        service = MagicMock()
+        service.changes().list().execute.return_value = {
+            "changes": [
+                {"fileId": "a_id", "removed": True},
+                {
+                    "fileId": "c_id",
+                    "file": {"id": "c_id", "name": "c.md", "parents": ["sum_id"]},
+                },
+            ],
+            "newStartPageToken": "t2",
+        }
+
+        storage = self._save_cache_and_restart(service)
+
+        self.assertEqual(storage.root_folder_id, "root_id")
+        self.assertEqual(storage.changes_token, "t2")
+        self.assertFalse(storage.exists("summary-files/a.md"))
+        self.assertTrue(storage.exists("summary-files/b.md"))
+        self.assertTrue(storage.exists("summary-files/c.md"))
+        # Neither the root folder nor any listing is looked up again
+        service.files().list.assert_not_called()
+
+    def test_renamed_file_is_moved_in_the_index(self):
+        service = MagicMock()
+        service.changes().list().execute.return_value = {
+            "changes": [
+                {
+                    "fileId": "b_id",
+                    "file": {"id": "b_id", "name": "b2.md", "parents": ["sum_id"]},
+                },
+            ],
+            "newStartPageToken": "t2",
+        }
+
+        storage = self._save_cache_and_restart(service)
+
+        self.assertEqual(storage.file_index["b_id"], ("sum_id", "b2.md"))
+        self.assertEqual(storage.file_index["a_id"], ("sum_id", "a.md"))
+        self.assertFalse(storage.exists("summary-files/b.md"))
+        self.assertTrue(storage.exists("summary-files/b2.md"))
+
+    def test_id_cache_is_dropped_when_root_folder_is_removed(self):
+        service = MagicMock()
+        service.changes().list().execute.return_value = {
+            "changes": [{"fileId": "root_id", "removed": True}],
+            "newStartPageToken": "t2",
+        }
+        service.changes().getStartPageToken().execute.return_value = {
+            "startPageToken": "t9"
+        }
+        service.files().list().execute.return_value = {"files": [{"id": "new_root"}]}
+
+        storage = self._save_cache_and_restart(service)
+
+        self.assertEqual(storage.root_folder_id, "new_root")
+        self.assertEqual(storage.changes_token, "t9")
+        self.assertEqual(storage.folder_listings, {})
+        self.assertEqual(storage.folder_cache, {})
+
 
 if __name__ == "__main__":
     unittest.main()
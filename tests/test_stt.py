@@ -0,0 +1,167 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from youtube_to_docs import stt
+from youtube_to_docs.utils import ErrorText, parse_srt
+
+
+def srt(*cues):
+    return stt.format_srt(list(cues))
+
+
+class TestPlanWindows(unittest.TestCase):
+    def test_cuts_at_nearby_silences_with_overlap(self):
+        windows = stt.plan_windows(1500, [(100, 101), (590, 594), (1185, 1187)], 600, 5)
+
+        self.assertEqual(
+            windows,
+            [
+                (0.0, 597.0, 0.0, 592.0),
+                (587.0, 1191.0, 592.0, 1186.0),
+                (1181.0, 1500, 1186.0, 1500),
+            ],
+        )
+
+    def test_cuts_at_fixed_offsets_without_silences(self):
+        windows = stt.plan_windows(1300, [], 600, 5)
+
+        self.assertEqual(
+            [w[2:] for w in windows], [(0.0, 600), (600, 1200), (1200, 1300)]
+        )
+
+    def test_detect_silences(self):
+        output = MagicMock(
+            stderr=(
+                "[silencedetect @ 0x1] silence_start: -0.01\n"
+                "[silencedetect @ 0x1] silence_end: 1.5 | silence_duration: 1.51\n"
+                "[silencedetect @ 0x1] silence_start: 590.2\n"
+                "[silencedetect @ 0x1] silence_end: 593.8 | silence_duration: 3.6\n"
+            )
+        )
+        with patch("subprocess.run", return_value=output):
+            silences = stt.detect_silences("ffmpeg", "audio.m4a")
+
+        self.assertEqual(silences, [(0.0, 1.5), (590.2, 593.8)])
+
+
+class TestMergeCues(unittest.TestCase):
+    def test_overlapping_cues_appear_once(self):
+        windows = [(0.0, 605.0, 0.0, 600.0), (595.0, 900.0, 600.0, 900.0)]
+        window_cues = [
+            [(0.0, 4.0, "Welcome."), (596.0, 599.0, "Next item."), (601, 604, "Vote.")],
+            # The second window starts 5 seconds before the cut
+            [(1.0, 4.0, "Next item."), (6.0, 9.0, "Vote."), (10.0, 12.0, "Passed.")],
+        ]
+
+        merged = stt.merge_cues(windows, window_cues)
+
+        self.assertEqual(
+            merged,
+            [
+                (0.0, 4.0, "Welcome."),
+                (596.0, 599.0, "Next item."),
+                (601.0, 604.0, "Vote."),
+                (605.0, 607.0, "Passed."),
+            ],
+        )
+
+
+class TestTranscribeAudio(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(stt, "_ffmpeg_paths", return_value=("ffmpeg", "ffprobe"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(stt, "extract_window")
+        self.mock_extract = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(stt, "detect_silences", return_value=[])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_short_audio_is_transcribed_in_one_pass(self):
+        transcribe = MagicMock(return_value=(srt((0, 2, "Hi.")), 10, 5))
+
+        with patch.object(stt, "probe_duration", return_value=300):
+            result = stt.transcribe_audio(
+                "gemini-flash", "audio.m4a", "url", transcribe=transcribe
+            )
+
+        self.assertEqual(result, (srt((0, 2, "Hi.")), 10, 5))
+        transcribe.assert_called_once_with(
+            "gemini-flash", "audio.m4a", "url", language="en", srt=True
+        )
+        self.mock_extract.assert_not_called()
+
+    def test_long_audio_is_transcribed_in_concurrent_windows(self):
+        started = []
+        all_started = threading.Event()
+
+        def extract(ffmpeg, audio_path, start, end, output_path):
+            self.window_starts[output_path] = start
+
+        self.window_starts = {}
+        self.mock_extract.side_effect = extract
+
+        def transcribe(model_name, path, url, language="en", srt=True):
+            started.append(path)
+            if len(started) == 3:
+                all_started.set()
+            # Every window is in flight before any finishes
+            self.assertTrue(all_started.wait(5))
+            offset = self.window_starts[path]
+            return stt.format_srt([(10, 12, f"Said at {offset:.0f}.")]), 100, 20
+
+        with patch.object(stt, "probe_duration", return_value=1500):
+            text, in_tokens, out_tokens = stt.transcribe_audio(
+                "gemini-flash",
+                "audio.m4a",
+                "url",
+                transcribe=transcribe,
+                chunk_minutes=10,
+                overlap_seconds=5,
+            )
+
+        self.assertEqual(
+            parse_srt(text),
+            [
+                (10.0, 12.0, "Said at 0."),
+                (605.0, 607.0, "Said at 595."),
+                (1205.0, 1207.0, "Said at 1195."),
+            ],
+        )
+        self.assertEqual((in_tokens, out_tokens), (300, 60))
+
+    def test_window_error_is_returned(self):
+        results = iter([(ErrorText("Error: quota"), 0, 0), (srt((0, 2, "Hi.")), 1, 1)])
+
+        with patch.object(stt, "probe_duration", return_value=900):
+            text, _, _ = stt.transcribe_audio(
+                "gemini-flash",
+                "audio.m4a",
+                "url",
+                transcribe=lambda *args, **kwargs: next(results),
+                workers=1,
+            )
+
+        self.assertEqual(text, "Error: quota")
+
+    def test_provider_error_is_not_taken_as_a_cue(self):
+        results = iter(
+            [(srt((0, 2, "Hi.")), 1, 1), (ErrorText("Bedrock API Error 429"), 0, 0)]
+        )
+
+        with patch.object(stt, "probe_duration", return_value=900):
+            text, _, _ = stt.transcribe_audio(
+                "gemini-flash",
+                "audio.m4a",
+                "url",
+                transcribe=lambda *args, **kwargs: next(results),
+                workers=1,
+            )
+
+        self.assertEqual(text, "Bedrock API Error 429")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -95,6 +97,113 @@ class TestTranscript(unittest.TestCase):
         ids = transcript.resolve_video_ids("@channel", mock_service)
         self.assertEqual(ids, ["vid_from_channel"])
 
+    def test_iter_video_ids_yields_page_by_page(self):
+        mock_service = MagicMock()
+        first, second = MagicMock(), MagicMock()
+        first.execute.return_value = {
+            "items": [{"contentDetails": {"videoId": "vid1"}}]
+        }
+        second.execute.return_value = {
+            "items": [{"contentDetails": {"videoId": "vid2"}}]
+        }
+        mock_service.playlistItems().list.return_value = first
+        mock_service.playlistItems().list_next.side_effect = [second, None]
+
+        ids = transcript.iter_video_ids("PL123", mock_service)
+
+        self.assertEqual(next(ids), "vid1")
+        second.execute.assert_not_called()
+        self.assertEqual(list(ids), ["vid2"])
+        mock_service.playlistItems().list.assert_called_with(
+            part="contentDetails", playlistId="PL123", maxResults=50
+        )
+
+    def test_iter_video_ids_incremental_stops_at_known_run(self):
+        mock_service = MagicMock()
+        first, second = MagicMock(), MagicMock()
+        first.execute.return_value = {
+            "items": [
+                {
+                    "contentDetails": {
+                        "videoId": video_id,
+                        "videoPublishedAt": f"2024-01-{day:02d}T00:00:00Z",
+                    }
+                }
+                for video_id, day in [
+                    ("new1", 20),
+                    ("old1", 10),
+                    ("new2", 19),
+                    ("old2", 9),
+                    ("old3", 8),
+                ]
+            ]
+        }
+        mock_service.playlistItems().list.return_value = first
+        mock_service.playlistItems().list_next.return_value = second
+
+        ids = list(
+            transcript.iter_video_ids(
+                "UU123",
+                mock_service,
+                known_video_ids={"old1", "old2"},
+                latest_published="2024-01-10T00:00:00Z",
+                known_run=2,
+            )
+        )
+
+        # Known videos are skipped; old3 is not in the manifest but is older
+        # than its newest video, so it ends the run
+        self.assertEqual(ids, ["new1", "new2", "old3"])
+        second.execute.assert_not_called()
+
+    def test_iter_video_ids_incremental_pages_playlists_in_full(self):
+        mock_service = MagicMock()
+        first, second = MagicMock(), MagicMock()
+        first.execute.return_value = {
+            "items": [
+                {
+                    "contentDetails": {
+                        "videoId": video_id,
+                        "videoPublishedAt": "2020-01-01T00:00:00Z",
+                    }
+                }
+                for video_id in ["old1", "added1", "old2", "added2"]
+            ]
+        }
+        second.execute.return_value = {
+            "items": [{"contentDetails": {"videoId": "added3"}}]
+        }
+        mock_service.playlistItems().list.return_value = first
+        mock_service.playlistItems().list_next.side_effect = [second, None]
+
+        ids = list(
+            transcript.iter_video_ids(
+                "PL123",
+                mock_service,
+                known_video_ids={"old1", "old2"},
+                latest_published="2024-01-10T00:00:00Z",
+                known_run=2,
+            )
+        )
+
+        # Videos added later with an older publish date are not skipped
+        self.assertEqual(ids, ["added1", "added2", "added3"])
+
+    def test_iter_pages(self):
+        pages = list(transcript.iter_pages(iter(["a", "b", "c", "d", "e"]), 2))
+        self.assertEqual(pages, [["a", "b"], ["c", "d"], ["e"]])
+        self.assertEqual(list(transcript.iter_pages(iter([]))), [])
+
+    def test_iter_pages_reraises_errors(self):
+        def ids():
+            yield "a"
+            raise SystemExit(1)
+
+        pages = transcript.iter_pages(ids(), 1)
+        self.assertEqual(next(pages), ["a"])
+        with self.assertRaises(SystemExit):
+            next(pages)
+
     def test_get_video_details_none(self):
         details = transcript.get_video_details("vid1", None)
         self.assertEqual(
@@ -127,6 +236,51 @@ class TestTranscript(unittest.TestCase):
         self.assertEqual(details[0], "Test Video")
         self.assertEqual(details[5], "0:01:10")  # Duration
 
+    def test_get_videos_details_batches(self):
+        mock_service = MagicMock()
+        video_ids = [f"vid{i}" for i in range(120)]
+
+        def list_side_effect(**kwargs):
+            ids = kwargs["id"].split(",")
+            request = MagicMock()
+            request.execute.return_value = {
+                "items": [
+                    {
+                        "id": video_id,
+                        "snippet": {
+                            "title": f"Title {video_id}",
+                            "description": "Desc",
+                            "publishedAt": "2023-01-01",
+                            "channelTitle": "Test Channel",
+                        },
+                        "contentDetails": {"duration": "PT1M10S"},
+                    }
+                    # vid5 is private and is not returned
+                    for video_id in ids
+                    if video_id != "vid5"
+                ]
+            }
+            return request
+
+        mock_service.videos().list.side_effect = list_side_effect
+
+        details = transcript.get_videos_details(video_ids, mock_service)
+
+        calls = mock_service.videos().list.call_args_list
+        self.assertEqual(len(calls), 3)  # 50 + 50 + 20
+        self.assertEqual(len(calls[0].kwargs["id"].split(",")), 50)
+        self.assertEqual(len(calls[2].kwargs["id"].split(",")), 20)
+        self.assertEqual(calls[0].kwargs["fields"], transcript.VIDEO_DETAILS_FIELDS)
+        self.assertEqual(len(details), 119)
+        self.assertNotIn("vid5", details)
+        self.assertEqual(details["vid7"][0], "Title vid7")
+        self.assertEqual(details["vid7"][4], "")  # No tags
+        self.assertEqual(details["vid7"][5], "0:01:10")
+        self.assertEqual(details["vid7"][6], "https://www.youtube.com/watch?v=vid7")
+
+    def test_get_videos_details_no_service(self):
+        self.assertEqual(transcript.get_videos_details(["vid1"], None), {})
+
     @patch("youtube_to_docs.transcript.YouTubeTranscriptApi.list")
     def test_fetch_transcript(self, mock_list):
         mock_transcript_list = MagicMock()
@@ -196,5 +350,120 @@ class TestTranscript(unittest.TestCase):
         mock_en_transcript.translate.assert_called_with("es")
 
 
+class TestAudioPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.test_dir_obj = tempfile.TemporaryDirectory()
+        self.test_dir = self.test_dir_obj.name
+
+    def tearDown(self):
+        self.test_dir_obj.cleanup()
+
+    def fake_extract(self, size=10, gate=None):
+        calls = []
+
+        def extract(video_id, output_dir):
+            calls.append((video_id, threading.current_thread().name))
+            if gate is not None:
+                gate.wait(5)
+            path = os.path.join(output_dir, f"{video_id}.m4a")
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+            return path
+
+        return extract, calls
+
+    def test_prefetches_ahead_and_releases(self):
+        extract, calls = self.fake_extract()
+        prefetcher = transcript.AudioPrefetcher(
+            ["a", "b", "c"], self.test_dir, lookahead=2, extract=extract
+        )
+        prefetcher.start()
+        with prefetcher.condition:
+            prefetcher.condition.wait_for(lambda: len(prefetcher.ready) == 2, 5)
+
+        path = prefetcher.get("a")
+        self.assertEqual(path, os.path.join(self.test_dir, "a.m4a"))
+        prefetcher.release("a")
+        self.assertFalse(os.path.exists(path))
+
+        # Using "a" frees a lookahead slot for "c"
+        with prefetcher.condition:
+            prefetcher.condition.wait_for(lambda: "c" in prefetcher.ready, 5)
+
+        for video_id in ["b", "c"]:
+            self.assertTrue(os.path.exists(prefetcher.get(video_id)))
+            prefetcher.release(video_id)
+        prefetcher.close()
+
+        # Everything was downloaded once, in the background
+        self.assertEqual(sorted(c[0] for c in calls), ["a", "b", "c"])
+        self.assertTrue(all(c[1] == "audio-prefetch" for c in calls))
+        self.assertEqual(prefetcher.used_bytes, 0)
+
+    def test_lookahead_limit(self):
+        extract, calls = self.fake_extract()
+        prefetcher = transcript.AudioPrefetcher(
+            ["a", "b", "c", "d"], self.test_dir, lookahead=2, extract=extract
+        )
+        prefetcher.start()
+
+        # Wait until the background thread has filled the lookahead
+        with prefetcher.condition:
+            prefetcher.condition.wait_for(lambda: len(prefetcher.ready) == 2, 5)
+        self.assertEqual([c[0] for c in calls], ["a", "b"])
+
+        prefetcher.close()
+
+    def test_disk_budget(self):
+        extract, calls = self.fake_extract(size=100)
+        prefetcher = transcript.AudioPrefetcher(
+            ["a", "b", "c"], self.test_dir, lookahead=3, max_bytes=50, extract=extract
+        )
+        prefetcher.start()
+
+        with prefetcher.condition:
+            prefetcher.condition.wait_for(lambda: "a" in prefetcher.ready, 5)
+        # The first file alone exceeds the budget, so nothing else is fetched
+        self.assertEqual([c[0] for c in calls], ["a"])
+
+        prefetcher.get("a")
+        prefetcher.release("a")
+        with prefetcher.condition:
+            prefetcher.condition.wait_for(lambda: "b" in prefetcher.ready, 5)
+        self.assertEqual([c[0] for c in calls], ["a", "b"])
+
+        prefetcher.close()
+
+    def test_get_before_prefetch_extracts_directly(self):
+        gate = threading.Event()
+        extract, calls = self.fake_extract(gate=gate)
+        prefetcher = transcript.AudioPrefetcher(
+            ["a", "b"], self.test_dir, lookahead=1, extract=extract
+        )
+        prefetcher.start()
+
+        # "a" is blocked in the background, "b" has not started yet
+        gate.set()
+        path = prefetcher.get("b")
+        self.assertEqual(path, os.path.join(self.test_dir, "b.m4a"))
+        prefetcher.close()
+
+        self.assertEqual(sorted(c[0] for c in calls), ["a", "b"])
+
+    def test_skips_videos_that_do_not_need_audio(self):
+        extract, calls = self.fake_extract()
+        prefetcher = transcript.AudioPrefetcher(
+            ["a", "b"],
+            self.test_dir,
+            extract=extract,
+            needs_audio=lambda video_id: video_id != "a",
+        )
+        prefetcher.start()
+        prefetcher.get("b")
+        prefetcher.close()
+
+        self.assertEqual([c[0] for c in calls], ["b"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import polars as pl
 
+from youtube_to_docs import clients
 from youtube_to_docs.tts import (
     generate_speech,
     generate_speech_gcp,
@@ -14,6 +15,10 @@ from youtube_to_docs.tts import (
 
 
 class TestTTS(unittest.TestCase):
+    def setUp(self):
+        clients.reset_clients()
+        self.addCleanup(clients.reset_clients)
+
     def test_parse_tts_arg(self):
         # Test with hyphen
         model, voice = parse_tts_arg("gemini-2.5-flash-preview-tts-Kore")
@@ -190,6 +195,10 @@ class TestTTS(unittest.TestCase):
 class TestGCPTTS(unittest.TestCase):
     """Tests for GCP Chirp3 TTS functionality."""
 
+    def setUp(self):
+        clients.reset_clients()
+        self.addCleanup(clients.reset_clients)
+
     def test_parse_tts_arg_gcp_simple(self):
         """Test parsing gcp-chirp3 without a voice (defaults to Kore)."""
         model, voice = parse_tts_arg("gcp-chirp3")
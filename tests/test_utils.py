@@ -151,3 +151,92 @@ class TestQAProcessing(unittest.TestCase):
         # Nan strings should be handled before calling this, but if passed:
         # It won't have 2 lines, so returns as is.
         self.assertEqual(utils.add_question_numbers("nan"), "nan")
+
+
+class TestSlimManifest(unittest.TestCase):
+    def test_text_file_column(self):
+        self.assertEqual(
+            utils.text_file_column("Summary Text m from youtube (es)"),
+            "Summary File m from youtube (es)",
+        )
+        self.assertEqual(utils.text_file_column("QA Text m from m"), "QA File m from m")
+        self.assertEqual(
+            utils.text_file_column("Speakers m from m"), "Speakers File m from m"
+        )
+        self.assertIsNone(utils.text_file_column("Speakers File m from m"))
+        self.assertIsNone(utils.text_file_column("Summary Text m from m Hash"))
+        self.assertIsNone(utils.text_file_column("One Sentence Summary m from m"))
+
+    def test_slim_dataframe(self):
+        df = pl.DataFrame(
+            {
+                "URL": ["url1", "url2"],
+                "Summary Text m": ["hello", "no file"],
+                "Summary File m": ["summary.md", None],
+                "QA Text m": ["qa", None],
+                "QA File m": ["qa.md", None],
+            }
+        )
+
+        slim = utils.slim_dataframe(df)
+
+        # Texts with a file are replaced by their hash and size
+        self.assertEqual(slim["Summary Text m"].to_list(), [None, "no file"])
+        self.assertEqual(
+            slim["Summary Text m Hash"].to_list(),
+            [
+                "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824",
+                None,
+            ],
+        )
+        self.assertEqual(slim["Summary Text m Size"].to_list(), [5, None])
+        self.assertNotIn("QA Text m", slim.columns)
+        self.assertEqual(slim["QA Text m Size"].to_list(), [2, None])
+
+        # Slimming an already slim manifest keeps the hashes
+        self.assertTrue(utils.slim_dataframe(slim).equals(slim))
+
+
+class TestIsErrorText(unittest.TestCase):
+    def test_is_error_text(self):
+        for text in (
+            "Error: GEMINI_API_KEY not found",
+            "Bedrock API Error 429: Too many requests",
+            "Vertex API Error 503: unavailable",
+            "Unexpected content format: {}",
+        ):
+            self.assertTrue(utils.is_error_text(utils.ErrorText(text)), text)
+        # Results are told apart by type, not by their first word
+        for text in ("Error handling in Python: a summary", "", None):
+            self.assertFalse(utils.is_error_text(text), text)
+
+
+class TestSrt(unittest.TestCase):
+    SRT = (
+        "```srt\n"
+        "1\n"
+        "00:00:01,000 --> 00:00:03,500\n"
+        "Hello and welcome\n"
+        "to the meeting.\n"
+        "\n"
+        "2\n"
+        "01:02:03,250 --> 01:02:05,000\n"
+        "Thank you.\n"
+        "```"
+    )
+
+    def test_parse_srt(self):
+        self.assertEqual(
+            utils.parse_srt(self.SRT),
+            [
+                (1.0, 3.5, "Hello and welcome to the meeting."),
+                (3723.25, 3725.0, "Thank you."),
+            ],
+        )
+
+    def test_srt_to_text(self):
+        self.assertEqual(
+            utils.srt_to_text(self.SRT), "Hello and welcome to the meeting. Thank you."
+        )
+        # Content without cues is returned as is
+        self.assertEqual(utils.srt_to_text("Error: quota\n"), "Error: quota")
@@ -0,0 +1,148 @@
+"""
+Process-wide registry of provider clients and HTTP sessions.
+
+Building a client (or an authorized session) per call costs a TLS handshake
+and, for Google Cloud, a credential lookup on every request. Clients are
+instead created lazily, once per provider, region and credential, and shared
+by all threads. Provider SDKs are imported inside the factories so their
+extras stay optional.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept alive per host; matches the highest useful --workers value
+HTTP_POOL_SIZE = 64
+
+_lock = threading.Lock()
+_clients: Dict[Tuple[Any, ...], Any] = {}
+
+
+def get_client(key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+    """
+    Returns the client registered under key, calling factory to create it on
+    first use. Concurrent first uses of the same key create one client.
+    """
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+        return client
+
+
+def drop_client(key: Tuple[Any, ...]) -> None:
+    """Forgets the client under key, e.g. after its credentials were renewed."""
+    with _lock:
+        _clients.pop(key, None)
+
+
+def reset_clients() -> None:
+    """Forgets every client, so the next use creates new ones."""
+    with _lock:
+        _clients.clear()
+
+
+def _mount_pool(session: requests.Session) -> requests.Session:
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def http_session() -> requests.Session:
+    """A keep-alive session for plain HTTPS APIs (e.g. AWS Bedrock)."""
+    return get_client(("http",), lambda: _mount_pool(requests.Session()))
+
+
+def authorized_session() -> Any:
+    """
+    A keep-alive session authorized with Application Default Credentials.
+    Tokens are refreshed by the session as they expire.
+    """
+
+    def create():
+        import google.auth
+        from google.auth.transport.requests import AuthorizedSession
+
+        credentials, _ = google.auth.default()
+        return _mount_pool(AuthorizedSession(credentials))
+
+    return get_client(("google-adc",), create)
+
+
+def genai_client(
+    api_key: Optional[str] = None,
+    project: Optional[str] = None,
+    location: Optional[str] = None,
+) -> Any:
+    """
+    A google-genai client for the Gemini API (api_key) or for Vertex AI
+    (project and location).
+    """
+
+    def create():
+        from google import genai
+        from google.genai import types
+
+        if api_key is not None:
+            return genai.Client(api_key=api_key)
+        return genai.Client(
+            vertexai=True,
+            project=project,
+            location=location,
+            http_options=types.HttpOptions(api_version="v1"),
+        )
+
+    return get_client(("genai", api_key, project, location), create)
+
+
+def openai_client(base_url: str, api_key: str) -> Any:
+    """An OpenAI-compatible client (Azure AI Foundry)."""
+
+    def create():
+        from openai import OpenAI
+
+        return OpenAI(base_url=base_url, api_key=api_key)
+
+    return get_client(("openai", base_url, api_key), create)
+
+
+def gcs_client(project: str) -> Any:
+    """A Google Cloud Storage client for project."""
+
+    def create():
+        from google.cloud import storage
+
+        return storage.Client(project=project)
+
+    return get_client(("gcs", project), create)
+
+
+def speech_client(api_endpoint: Optional[str] = None) -> Any:
+    """A Cloud Speech-to-Text V2 client, regional when api_endpoint is set."""
+
+    def create():
+        from google.api_core.client_options import ClientOptions
+        from google.cloud import speech_v2
+
+        client_options = None
+        if api_endpoint:
+            client_options = ClientOptions(api_endpoint=api_endpoint)
+        return speech_v2.SpeechClient(client_options=client_options)
+
+    return get_client(("speech", api_endpoint), create)
+
+
+def tts_client() -> Any:
+    """A Cloud Text-to-Speech client."""
+
+    def create():
+        from google.cloud import texttospeech
+
+        return texttospeech.TextToSpeechClient()
+
+    return get_client(("tts",), create)
@@ -2,9 +2,11 @@ import base64
 import os
 from typing import Optional, Tuple
 
-import requests
+from youtube_to_docs.clients import genai_client, http_session, openai_client
+from youtube_to_docs.ratelimit import rate_limited
 
 
+@rate_limited
 def generate_infographic(
     image_model: Optional[str],
     summary_text: str,
@@ -29,7 +31,6 @@ def generate_infographic(
     )
 
     try:
-        from google import genai
         from google.genai import types
 
         GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
@@ -37,7 +38,7 @@ def generate_infographic(
             print("Error: GEMINI_API_KEY not found for infographic generation")
             return None, 0, 0
 
-        client = genai.Client(api_key=GEMINI_API_KEY)
+        client = genai_client(api_key=GEMINI_API_KEY)
 
         if image_model.startswith("gemini"):
             contents = [
@@ -160,7 +161,7 @@ def generate_infographic(
                         "height": 768 if "titan" in image_model else 720,
                     },
                 }
-                response = requests.post(
+                response = http_session().post(
                     endpoint,
                     headers={
                         "Content-Type": "application/json",
@@ -189,17 +190,13 @@ def generate_infographic(
 
         elif image_model.startswith("foundry"):
             try:
-                from openai import OpenAI
-
                 AZURE_FOUNDRY_ENDPOINT = os.environ["AZURE_FOUNDRY_ENDPOINT"]
                 AZURE_FOUNDRY_API_KEY = os.environ["AZURE_FOUNDRY_API_KEY"]
                 actual_model_name = image_model.replace("foundry-", "")
 
-                openai_client = OpenAI(
-                    base_url=AZURE_FOUNDRY_ENDPOINT, api_key=AZURE_FOUNDRY_API_KEY
-                )
+                client = openai_client(AZURE_FOUNDRY_ENDPOINT, AZURE_FOUNDRY_API_KEY)
 
-                response = openai_client.images.generate(
+                response = client.images.generate(
                     model=actual_model_name,
                     prompt=prompt,
                     n=1,
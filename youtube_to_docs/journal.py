@@ -0,0 +1,143 @@
+"""
+Append-only checkpoint journal for manifest rows.
+
+Instead of rewriting the whole manifest after every video, each finished row
+is appended to a JSONL file. The manifest is compacted (rewritten in full)
+every few videos (or every few seconds) and at the end of the run, after which
+the compacted rows are dropped from the journal. If a run crashes, the next run
+replays the journal on startup.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List
+
+import polars as pl
+
+# Number of journaled videos after which the full manifest is rewritten
+JOURNAL_COMPACT_EVERY = 50
+
+
+class Journal:
+    """A JSONL file holding manifest rows that have not been compacted yet."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pending = 0
+        self.compacted_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def append(self, row: Dict[str, Any], finished: bool = True) -> None:
+        """
+        Appends a row and flushes it to disk. Only finished rows count towards
+        the next compaction; partial rows (e.g. initial metadata) are journaled
+        so they survive a crash but do not trigger a manifest rewrite.
+        """
+        line = json.dumps(dict(row), default=str, ensure_ascii=False)
+        with self.lock:
+            parent = os.path.dirname(self.path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+            if finished:
+                self.pending += 1
+
+    def replay(self) -> List[Dict[str, Any]]:
+        """
+        Returns the journaled rows, keeping only the latest row per URL.
+        A truncated last line (from a crash mid-write) is ignored.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Warning: Skipping unreadable journal entry in {self.path}")
+                    continue
+                if isinstance(row, dict) and row.get("URL"):
+                    # Re-insert so the order follows the latest write
+                    rows.pop(row["URL"], None)
+                    rows[row["URL"]] = row
+        return list(rows.values())
+
+    def due(self, every: int = JOURNAL_COMPACT_EVERY, interval: float = 0) -> bool:
+        """
+        Returns True once every rows have been journaled since the last clear,
+        or once interval seconds have passed with at least one row pending.
+        """
+        if not self.pending:
+            return False
+        if every > 0 and self.pending >= every:
+            return True
+        return interval > 0 and time.monotonic() - self.compacted_at >= interval
+
+    def compact(self, saved_urls: Iterable[str]) -> None:
+        """
+        Drops the entries of the rows now saved in the manifest (saved_urls)
+        and keeps the others, e.g. the partial rows of videos that other
+        workers are still processing.
+        """
+        saved = set(saved_urls)
+        with self.lock:
+            self.pending = 0
+            self.compacted_at = time.monotonic()
+            if not os.path.exists(self.path):
+                return
+            kept = []
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(row, dict) and row.get("URL") not in saved:
+                        kept.append(line.rstrip("\n") + "\n")
+            if not kept:
+                os.remove(self.path)
+                return
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(kept)
+            os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Removes the journal after its rows have been compacted."""
+        with self.lock:
+            self.pending = 0
+            self.compacted_at = time.monotonic()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def journal_path(manifest: str, local: bool) -> str:
+    """
+    Returns the journal path for a manifest: next to a local CSV/XLSX, or in
+    the working directory for manifests stored in the cloud.
+    """
+    if local:
+        return f"{manifest}.journal.jsonl"
+    name = "".join(c if c.isalnum() or c in "-_." else "_" for c in manifest)
+    return os.path.join(".youtube-to-docs", f"{name}.journal.jsonl")
+
+
+def merge_rows(existing_df: pl.DataFrame | None, rows: List[Dict]) -> pl.DataFrame:
+    """
+    Returns existing_df with rows replacing the entries that share their URL
+    and any new rows appended.
+    """
+    rows_df = pl.from_dicts(rows, infer_schema_length=None)
+    if existing_df is None:
+        return rows_df
+    remaining = existing_df.filter(~pl.col("URL").is_in(rows_df["URL"].to_list()))
+    return pl.concat([remaining, rows_df], how="diagonal_relaxed")
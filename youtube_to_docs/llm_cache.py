@@ -0,0 +1,264 @@
+"""
+Content-addressed on-disk cache for LLM responses.
+
+Each response is stored under a hash of the calling function, the model, the
+normalized prompt and any other arguments (images are hashed by content), so
+a prompt that was already answered in an earlier run (e.g. one that crashed
+before saving the manifest) is not sent to the provider again. The cache is
+bounded in size (least recently used entries are evicted first) and entries
+expire after a TTL. Concurrent identical requests share one provider call.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from youtube_to_docs.utils import is_error_text
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_DIR = os.path.join(".youtube-to-docs", "llm-cache")
+DEFAULT_MAX_MB = 1024
+DEFAULT_TTL_DAYS = 30
+
+# Bump to invalidate every cached response (e.g. when the entry format changes)
+CACHE_VERSION = 1
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalizes line endings and trailing whitespace, which do not change the
+    meaning of a prompt.
+    """
+    lines = prompt.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def cache_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Returns the cache key for a call of name with args and kwargs."""
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, bytes):
+            return {"sha256": hashlib.sha256(value).hexdigest()}
+        if isinstance(value, str):
+            return normalize_prompt(value)
+        return value
+
+    payload = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "name": name,
+            "args": [encode(a) for a in args],
+            "kwargs": {k: encode(v) for k, v in sorted(kwargs.items())},
+        },
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(result: Tuple[Any, int, int]) -> bool:
+    """Errors and empty responses are not cached, so they are retried."""
+    text = result[0]
+    return isinstance(text, str) and bool(text.strip()) and not is_error_text(text)
+
+
+class ResponseCache:
+    """
+    A directory of JSON entries holding (text, input_tokens, output_tokens),
+    evicted least recently used first once max_bytes is exceeded.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        ttl_seconds: float = DEFAULT_TTL_DAYS * 24 * 3600,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        # Keys being fetched right now -> event set once the result is stored
+        self.in_flight: Dict[str, threading.Event] = {}
+        # Total size of the entries, computed on the first write
+        self.size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Tuple[str, int, int]]:
+        """Returns the cached result for key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            return None
+        try:
+            entry = json.loads(content)
+        except ValueError:
+            # A partially written or corrupt entry is dropped
+            self._remove(path)
+            return None
+        if self.ttl_seconds > 0 and time.time() - entry["created"] > self.ttl_seconds:
+            self._remove(path)
+            return None
+        try:
+            # The modification time orders entries for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["text"], entry["input_tokens"], entry["output_tokens"]
+
+    def put(self, key: str, result: Tuple[str, int, int]) -> None:
+        """Stores result under key and evicts old entries if over the size cap."""
+        path = self._path(key)
+        entry = {
+            "created": time.time(),
+            "text": result[0],
+            "input_tokens": result[1],
+            "output_tokens": result[2],
+        }
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self.lock:
+            if self.size is None:
+                self.size = sum(size for _, size, _ in self._entries())
+            else:
+                self.size += len(data)
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """Yields (path, size, mtime) for every entry."""
+        if not os.path.isdir(self.directory):
+            return
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until 90% of the cap is free."""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        self.size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for path, size, _ in entries:
+            if self.size <= target:
+                break
+            self._remove(path)
+            self.size -= size
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def call(
+        self, key: str, func: Callable[[], Tuple[str, int, int]]
+    ) -> Tuple[str, int, int]:
+        """
+        Returns the cached result for key, or calls func and caches its result.
+        Callers asking for a key that is already being fetched wait for that
+        call instead of making their own.
+        """
+        while True:
+            with self.lock:
+                waiting = self.in_flight.get(key)
+                if waiting is None:
+                    done = threading.Event()
+                    self.in_flight[key] = done
+            if waiting is None:
+                break
+            waiting.wait()
+            cached = self.get(key)
+            if cached is not None:
+                with self.lock:
+                    self.hits += 1
+                return cached
+            # The other call failed (errors are not cached), so try again
+
+        try:
+            cached = self.get(key)
+            if cached is not None:
+                with self.lock:
+                    self.hits += 1
+                return cached
+            with self.lock:
+                self.misses += 1
+            result = func()
+            if is_cacheable(result):
+                try:
+                    self.put(key, result)
+                except OSError as e:
+                    print(f"Warning: Could not cache LLM response: {e}")
+            return result
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+            done.set()
+
+
+# The cache used by @cached functions; None disables caching
+_cache: Optional[ResponseCache] = None
+
+
+def configure_llm_cache(
+    directory: str = DEFAULT_CACHE_DIR,
+    max_mb: float = DEFAULT_MAX_MB,
+    ttl_days: float = DEFAULT_TTL_DAYS,
+) -> ResponseCache:
+    """Enables the response cache for @cached functions."""
+    global _cache
+    _cache = ResponseCache(
+        directory,
+        max_bytes=int(max_mb * 1024 * 1024),
+        ttl_seconds=ttl_days * 24 * 3600,
+    )
+    return _cache
+
+
+def reset_llm_cache() -> None:
+    """Disables the response cache."""
+    global _cache
+    _cache = None
+
+
+def get_llm_cache() -> Optional[ResponseCache]:
+    return _cache
+
+
+def cached(
+    func: Callable[..., Tuple[T, int, int]],
+) -> Callable[..., Tuple[T, int, int]]:
+    """
+    Decorator for LLM calls returning (text, input_tokens, output_tokens). A
+    cached result is returned with the token counts of the original call, so
+    the manifest reports the same cost as the run that produced it.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _cache
+        if cache is None or not args or not args[0]:
+            return func(*args, **kwargs)
+        key = cache_key(func.__name__, args, kwargs)
+        return cache.call(key, lambda: func(*args, **kwargs))
+
+    return wrapper
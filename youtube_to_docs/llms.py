@@ -1,13 +1,37 @@
+import datetime
 import os
 import re
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple, cast
-
-import requests
-
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from youtube_to_docs.clients import (
+    authorized_session,
+    drop_client,
+    gcs_client,
+    genai_client,
+    http_session,
+    openai_client,
+    speech_client,
+)
+from youtube_to_docs.llm_cache import cached
+from youtube_to_docs.mapreduce import (
+    chunk_budget,
+    group_parts,
+    is_empty_result,
+    map_chunks,
+    merge_markdown_tables,
+    slice_timing_reference,
+    split_transcript,
+)
 from youtube_to_docs.prices import PRICES
-from youtube_to_docs.utils import add_question_numbers, normalize_model_name
+from youtube_to_docs.ratelimit import rate_limited
+from youtube_to_docs.utils import (
+    ErrorText,
+    add_question_numbers,
+    is_error_text,
+    normalize_model_name,
+)
 
 
 def get_model_pricing(model_name: str) -> Tuple[float | None, float | None]:
@@ -42,6 +66,8 @@ def get_model_pricing(model_name: str) -> Tuple[float | None, float | None]:
     return None, None
 
 
+@cached
+@rate_limited
 def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
     """
     Generic function to query the specified LLM model.
@@ -56,11 +82,10 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
 
     if model_name.startswith("gemini"):
         try:
-            from google import genai
             from google.genai import types
 
             GEMINI_API_KEY = os.environ["GEMINI_API_KEY"]
-            google_genai_client = genai.Client(api_key=GEMINI_API_KEY)
+            google_genai_client = genai_client(api_key=GEMINI_API_KEY)
             response = google_genai_client.models.generate_content(
                 model=model_name,
                 contents=[
@@ -75,18 +100,16 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                 output_tokens = response.usage_metadata.candidates_token_count or 0
         except KeyError:
             print("Error: GEMINI_API_KEY not found")
-            response_text = "Error: GEMINI_API_KEY not found"
+            response_text = ErrorText("Error: GEMINI_API_KEY not found")
         except Exception as e:
             print(f"Gemini API Error: {e}")
-            response_text = f"Error: {e}"
+            response_text = ErrorText(f"Error: {e}")
 
     elif model_name.startswith("vertex"):
         try:
             import subprocess
 
-            import google.auth
             from google.auth.exceptions import RefreshError
-            from google.auth.transport.requests import AuthorizedSession
 
             vertex_project_id = os.environ["PROJECT_ID"]
             actual_model_name = model_name.replace("vertex-", "")
@@ -111,7 +134,7 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
 
                 if vertex_api_key:
                     # Use API Key if available
-                    response = requests.post(
+                    response = http_session().post(
                         endpoint,
                         json=payload,
                         headers=headers,
@@ -127,11 +150,8 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
 
                 if response is None:
                     # Fallback to Application Default Credentials
-                    vertex_credentials, _ = google.auth.default()
-                    authed_session = AuthorizedSession(vertex_credentials)
-
                     try:
-                        response = authed_session.post(
+                        response = authorized_session().post(
                             endpoint, json=payload, headers=headers
                         )
                     except RefreshError:
@@ -145,15 +165,14 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                                 check=True,
                             )
                             # Reload credentials and retry
-                            vertex_credentials, _ = google.auth.default()
-                            authed_session = AuthorizedSession(vertex_credentials)
-                            response = authed_session.post(
+                            drop_client(("google-adc",))
+                            response = authorized_session().post(
                                 endpoint, json=payload, headers=headers
                             )
                         except Exception as e:
                             error_msg = f"Re-authentication failed: {e}"
                             print(error_msg)
-                            return f"Error: {error_msg}", 0, 0
+                            return ErrorText(f"Error: {error_msg}"), 0, 0
 
                 if response.status_code == 200:
                     response_json = response.json()
@@ -165,26 +184,22 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                     ):
                         response_text = content_blocks[0]["text"]
                     else:
-                        response_text = f"Unexpected response format: {response.text}"
+                        response_text = ErrorText(
+                            f"Unexpected response format: {response.text}"
+                        )
 
                     usage = response_json.get("usage", {})
                     input_tokens = usage.get("input_tokens", 0)
                     output_tokens = usage.get("output_tokens", 0)
                 else:
-                    response_text = (
+                    response_text = ErrorText(
                         f"Vertex API Error {response.status_code}: {response.text}"
                     )
                     print(response_text)
             elif actual_model_name.startswith("gemini"):
-                from google import genai
-                from google.genai import types
-
                 vertex_location = os.environ.get("VERTEX_LOCATION", "us-east5")
-                client = genai.Client(
-                    vertexai=True,
-                    project=vertex_project_id,
-                    location=vertex_location,
-                    http_options=types.HttpOptions(api_version="v1"),
+                client = genai_client(
+                    project=vertex_project_id, location=vertex_location
                 )
                 response = client.models.generate_content(
                     model=actual_model_name,
@@ -199,10 +214,10 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
             print(
                 "Error: PROJECT_ID environment variable required for GCPVertex models."
             )
-            response_text = "Error: PROJECT_ID required"
+            response_text = ErrorText("Error: PROJECT_ID required")
         except Exception as e:
             print(f"Vertex Request Error: {e}")
-            response_text = f"Error: {e}"
+            response_text = ErrorText(f"Error: {e}")
 
     elif model_name.startswith("bedrock"):
         try:
@@ -228,7 +243,7 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                 f"https://bedrock-runtime.us-east-1.amazonaws.com/model/"
                 f"{actual_model_name}/converse"
             )
-            response = requests.post(
+            response = http_session().post(
                 endpoint,
                 headers={
                     "Content-Type": "application/json",
@@ -255,15 +270,19 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                     ):
                         response_text = content_blocks[0]["text"]
                     else:
-                        response_text = f"Unexpected content format: {response_json}"
+                        response_text = ErrorText(
+                            f"Unexpected content format: {response_json}"
+                        )
 
                     usage = response_json.get("usage", {})
                     input_tokens = usage.get("inputTokens", 0)
                     output_tokens = usage.get("outputTokens", 0)
                 except KeyError:
-                    response_text = f"Unexpected response structure: {response_json}"
+                    response_text = ErrorText(
+                        f"Unexpected response structure: {response_json}"
+                    )
             else:
-                response_text = (
+                response_text = ErrorText(
                     f"Bedrock API Error {response.status_code}: {response.text}"
                 )
         except KeyError:
@@ -271,21 +290,17 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                 "Error: AWS_BEARER_TOKEN_BEDROCK environment variable required for "
                 "AWS Bedrock models."
             )
-            response_text = "Error: AWS_BEARER_TOKEN_BEDROCK required"
+            response_text = ErrorText("Error: AWS_BEARER_TOKEN_BEDROCK required")
         except Exception as e:
             print(f"Bedrock Request Error: {e}")
-            response_text = f"Error: {e}"
+            response_text = ErrorText(f"Error: {e}")
 
     elif model_name.startswith("foundry"):
         try:
-            from openai import OpenAI
-
             AZURE_FOUNDRY_ENDPOINT = os.environ["AZURE_FOUNDRY_ENDPOINT"]
             AZURE_FOUNDRY_API_KEY = os.environ["AZURE_FOUNDRY_API_KEY"]
             actual_model_name = model_name.replace("foundry-", "")
-            client = OpenAI(
-                base_url=AZURE_FOUNDRY_ENDPOINT, api_key=AZURE_FOUNDRY_API_KEY
-            )
+            client = openai_client(AZURE_FOUNDRY_ENDPOINT, AZURE_FOUNDRY_API_KEY)
             completion = client.chat.completions.create(
                 model=actual_model_name,
                 messages=[
@@ -304,14 +319,15 @@ def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
                 "Error: AZURE_FOUNDRY_ENDPOINT and AZURE_FOUNDRY_API_KEY "
                 "environment variables required."
             )
-            response_text = "Error: Foundry vars required"
+            response_text = ErrorText("Error: Foundry vars required")
         except Exception as e:
             print(f"Foundry Request Error: {e}")
-            response_text = f"Error: {e}"
+            response_text = ErrorText(f"Error: {e}")
 
     return response_text, input_tokens, output_tokens
 
 
+@rate_limited
 def generate_transcript(
     model_name: str,
     audio_path: str,
@@ -331,14 +347,13 @@ def generate_transcript(
         return _transcribe_gcp(model_name, audio_path, url, language, srt)
 
     if not model_name.startswith("gemini"):
-        return f"Error: STT not yet implemented for model {model_name}", 0, 0
+        return ErrorText(f"Error: STT not yet implemented for model {model_name}"), 0, 0
 
     try:
-        from google import genai
         from google.genai import types
 
         GEMINI_API_KEY = os.environ["GEMINI_API_KEY"]
-        client = genai.Client(api_key=GEMINI_API_KEY)
+        client = genai_client(api_key=GEMINI_API_KEY)
 
         with open(audio_path, "rb") as f:
             audio_bytes = f.read()
@@ -396,10 +411,10 @@ def generate_transcript(
         return response_text, input_tokens, output_tokens
 
     except KeyError:
-        return "Error: GEMINI_API_KEY not found", 0, 0
+        return ErrorText("Error: GEMINI_API_KEY not found"), 0, 0
     except Exception as e:
         print(f"Gemini STT Error: {e}")
-        return f"Error: {e}", 0, 0
+        return ErrorText(f"Error: {e}"), 0, 0
 
 
 def _transcribe_gcp(
@@ -414,13 +429,14 @@ def _transcribe_gcp(
     Requires 'YTD_GCS_BUCKET_NAME' env var for temporary storage.
     """
     try:
-        from google.api_core.client_options import ClientOptions
-        from google.cloud import speech_v2, storage
+        from google.cloud import speech_v2, storage  # noqa: F401
         from google.cloud.speech_v2.types import cloud_speech
     except ImportError:
         return (
-            "Error: google-cloud-speech and google-cloud-storage are required for "
-            "GCP models. Install with `pip install '.[gcp]'`",
+            ErrorText(
+                "Error: google-cloud-speech and google-cloud-storage are required "
+                "for GCP models. Install with `pip install '.[gcp]'`"
+            ),
             0,
             0,
         )
@@ -429,7 +445,11 @@ def _transcribe_gcp(
     bucket_name = os.environ.get("YTD_GCS_BUCKET_NAME", "youtube-to-docs")
 
     if not project_id:
-        return "Error: GOOGLE_CLOUD_PROJECT environment variable is required.", 0, 0
+        return (
+            ErrorText("Error: GOOGLE_CLOUD_PROJECT environment variable is required."),
+            0,
+            0,
+        )
 
     # Extract model ID (e.g. gcp-chirp3 -> chirp_3 or just pass as is if mapped?)
     actual_model = model_name.replace("gcp-", "").replace("-", "_")
@@ -447,7 +467,7 @@ def _transcribe_gcp(
 
     # 1. Upload to GCS
     try:
-        storage_client = storage.Client(project=project_id)
+        storage_client = gcs_client(project_id)
         bucket = storage_client.bucket(bucket_name)
         blob_name = f"temp/ytd_audio_{uuid.uuid4()}.m4a"
         blob = bucket.blob(blob_name)
@@ -455,19 +475,17 @@ def _transcribe_gcp(
         blob.upload_from_filename(audio_path)
         gcs_uri = f"gs://{bucket_name}/{blob_name}"
     except Exception as e:
-        return f"Error uploading to GCS: {e}", 0, 0
+        return ErrorText(f"Error uploading to GCS: {e}"), 0, 0
 
     transcript_text = ""
 
     try:
         # 2. Transcribe
-        client_options = None
+        api_endpoint = None
         if location != "global":
             api_endpoint = f"{location}-speech.googleapis.com"
-            client_options = ClientOptions(api_endpoint=api_endpoint)
 
-        # Instantiates a client
-        client = speech_v2.SpeechClient(client_options=client_options)
+        client = speech_client(api_endpoint)
 
         # Map 'en' to 'en-US' for GCP V2 if needed
         if language == "en":
@@ -531,12 +549,26 @@ def _transcribe_gcp(
                     milliseconds = int((total_seconds * 1000) % 1000)
                     return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
 
+                # End of the previous result, where a result without word
+                # offsets starts
+                last_end = datetime.timedelta(0)
+
                 for result in results:
                     alt = result.alternatives[0]
                     full_text_parts.append(alt.transcript)
 
-                    if srt and hasattr(alt, "words"):
-                        words = alt.words
+                    words = list(getattr(alt, "words", None) or []) if srt else []
+                    if srt and not words and alt.transcript.strip():
+                        # No word offsets: the whole result becomes one cue
+                        result_end = result.result_end_offset or last_end
+                        srt_entries.append(
+                            f"{srt_counter}\n"
+                            f"{format_time(last_end)} --> {format_time(result_end)}\n"
+                            f"{alt.transcript.strip()}\n"
+                        )
+                        srt_counter += 1
+                        last_end = result_end
+                    elif words:
                         current_segment_words = []
                         current_segment_len = 0
 
@@ -583,6 +615,7 @@ def _transcribe_gcp(
                                 f"{seg_text}\n"
                             )
                             srt_counter += 1
+                        last_end = words[-1].end_offset
 
                 transcript_text = " ".join(full_text_parts)
 
@@ -593,15 +626,17 @@ def _transcribe_gcp(
                 # Check for errors
                 if batch_result.error:
                     return (
-                        f"Error from BatchRecognize: {batch_result.error.message}",
+                        ErrorText(
+                            f"Error from BatchRecognize: {batch_result.error.message}"
+                        ),
                         0,
                         0,
                     )
         else:
-            return "Error: Result not found in response", 0, 0
+            return ErrorText("Error: Result not found in response"), 0, 0
 
     except Exception as e:
-        return f"Error during transcription: {e}", 0, 0
+        return ErrorText(f"Error during transcription: {e}"), 0, 0
     finally:
         # 3. Cleanup GCS
         try:
@@ -619,15 +654,45 @@ def generate_summary(
     url: str,
     language: str = "en",
 ) -> Tuple[str, int, int]:
-    """Generates a summary and returns (summary_text, input_tokens, output_tokens)."""
-    prompt = (
-        f"I have included a transcript for {url} ({video_title})"
-        "\n\n"
-        f"Can you please summarize this in {language}?"
-        "\n\n"
-        f"{transcript}"
-    )
-    return _query_llm(model_name, prompt)
+    """
+    Generates a summary and returns (summary_text, input_tokens, output_tokens).
+    Long transcripts are summarized part by part and the parts then combined.
+    """
+    chunks = split_transcript(transcript, chunk_budget(model_name))
+    if len(chunks) == 1:
+        prompt = (
+            f"I have included a transcript for {url} ({video_title})"
+            "\n\n"
+            f"Can you please summarize this in {language}?"
+            "\n\n"
+            f"{transcript}"
+        )
+        return _query_llm(model_name, prompt)
+
+    def summarize_part(index: int, chunk: str) -> Tuple[str, int, int]:
+        prompt = (
+            f"I have included part {index + 1} of {len(chunks)} of a transcript "
+            f"for {url} ({video_title})"
+            "\n\n"
+            f"Can you please summarize this part in {language}? Keep the key "
+            "points, names, numbers and decisions, as the summaries of all parts "
+            "will be combined into one."
+            "\n\n"
+            f"{chunk}"
+        )
+        return _query_llm(model_name, prompt)
+
+    def combine_prompt(parts: List[str]) -> str:
+        return (
+            "I have included summaries of consecutive parts of a transcript for "
+            f"{url} ({video_title})"
+            "\n\n"
+            "Can you please combine them into a single summary of the whole "
+            f"transcript in {language}?"
+            "\n\n" + "\n\n".join(parts)
+        )
+
+    return _map_reduce(model_name, chunks, summarize_part, combine_prompt)
 
 
 def generate_one_sentence_summary(
@@ -648,12 +713,9 @@ def extract_speakers(model_name: str, transcript: str) -> Tuple[str, int, int]:
     """
     Extracts speakers from the transcript.
     Returns (speakers_markdown, input_tokens, output_tokens).
+    Long transcripts are searched part by part and the lists then merged.
     """
-    prompt = (
-        "I have included a transcript."
-        "\n\n"
-        "Can you please identify the speakers in the transcript?"
-        "\n\n"
+    output_format = (
         "The output should be a markdown string in English like"
         "\n\n"
         "Speaker 1 (title)"
@@ -665,10 +727,41 @@ def extract_speakers(model_name: str, transcript: str) -> Tuple[str, int, int]:
         "If the speaker is unknown use the placeholder UNKNOWN and if the title "
         "is unknown use the placeholder UNKNOWN. "
         'If No speaker(s) are detected set it to float("nan").'
-        "\n\n"
-        f"Transcript: {transcript}"
     )
-    return _query_llm(model_name, prompt)
+
+    def speakers_prompt(part: str) -> str:
+        return (
+            "I have included a transcript."
+            "\n\n"
+            "Can you please identify the speakers in the transcript?"
+            "\n\n"
+            f"{output_format}"
+            "\n\n"
+            f"Transcript: {part}"
+        )
+
+    chunks = split_transcript(transcript, chunk_budget(model_name))
+    if len(chunks) == 1:
+        return _query_llm(model_name, speakers_prompt(transcript))
+
+    def combine_prompt(parts: List[str]) -> str:
+        return (
+            "I have included the speakers identified in consecutive parts of one "
+            "transcript."
+            "\n\n"
+            "Can you please merge them into a single list, listing each person "
+            "once with the most specific title found?"
+            "\n\n"
+            f"{output_format}"
+            "\n\n" + "\n\n".join(parts)
+        )
+
+    return _map_reduce(
+        model_name,
+        chunks,
+        lambda index, chunk: _query_llm(model_name, speakers_prompt(chunk)),
+        combine_prompt,
+    )
 
 
 def generate_qa(
@@ -682,46 +775,74 @@ def generate_qa(
     """
     Extracts Q&A pairs from the transcript.
     Returns (qa_markdown, input_tokens, output_tokens).
+    Long transcripts are searched part by part and the tables then joined.
     """
-    prompt = (
-        "I have included a transcript (which might be in SRT format with timestamps)."
-        "\n\n"
-        "Can you please extract the questions and answers from the transcript "
-        f"in {language}?"
-        "\n\n"
-        "The output should be a markdown table like:"
-        "\n\n"
-        "| questioner(s) | question | responder(s) | answer | "
-        "timestamp | timestamp url |"
-        "\n"
-        "|---|---|---|---|---|---|"
-        "\n"
-        "| Speaker 1 | What is... | Speaker 2 | It is... | 01:23 | "
-        "[Link](https://youtu.be/...&t=83) |\n"
-        "\n\n"
-        "If the questioner or responder is unknown use the placeholder UNKNOWN. "
-        "Use people's name and titles in the questioner and responder fields. "
-        'If no Q&A pairs are detected set it to float("nan").'
-        "\n\n"
-        "For the 'timestamp' column, use the format MM:SS or HH:MM:SS. "
-        "If the 'Timing Reference' below is provided, please use its "
-        "timestamps to provide high accuracy timestamps. Otherwise, use "
-        "timestamps from the main transcript."
-        "For the 'timestamp url' column, use the base YouTube URL provided below "
-        "and append the timestamp in seconds (e.g. &t=123 or ?t=123). "
-        "Format this column as a markdown hyperlink with the text 'Link' "
-        "(e.g. [Link](https://youtu.be/...&t=123)). "
-        "If the base URL already contains a '?', use '&t=' otherwise use '?t='. "
-        f"Base URL: {url}"
-        "\n\n"
-        f"Speakers detected: {speakers}"
-        "\n\n"
-        f"Content Transcript: {transcript}"
-    )
-    if timing_reference:
-        prompt += f"\n\nTiming Reference (SRT): {timing_reference}"
 
-    response_text, input_tokens, output_tokens = _query_llm(model_name, prompt)
+    def qa_prompt(part: str, part_reference: Optional[str]) -> str:
+        prompt = (
+            "I have included a transcript (which might be in SRT format with "
+            "timestamps)."
+            "\n\n"
+            "Can you please extract the questions and answers from the transcript "
+            f"in {language}?"
+            "\n\n"
+            "The output should be a markdown table like:"
+            "\n\n"
+            "| questioner(s) | question | responder(s) | answer | "
+            "timestamp | timestamp url |"
+            "\n"
+            "|---|---|---|---|---|---|"
+            "\n"
+            "| Speaker 1 | What is... | Speaker 2 | It is... | 01:23 | "
+            "[Link](https://youtu.be/...&t=83) |\n"
+            "\n\n"
+            "If the questioner or responder is unknown use the placeholder UNKNOWN. "
+            "Use people's name and titles in the questioner and responder fields. "
+            'If no Q&A pairs are detected set it to float("nan").'
+            "\n\n"
+            "For the 'timestamp' column, use the format MM:SS or HH:MM:SS. "
+            "If the 'Timing Reference' below is provided, please use its "
+            "timestamps to provide high accuracy timestamps. Otherwise, use "
+            "timestamps from the main transcript."
+            "For the 'timestamp url' column, use the base YouTube URL provided below "
+            "and append the timestamp in seconds (e.g. &t=123 or ?t=123). "
+            "Format this column as a markdown hyperlink with the text 'Link' "
+            "(e.g. [Link](https://youtu.be/...&t=123)). "
+            "If the base URL already contains a '?', use '&t=' otherwise use '?t='. "
+            f"Base URL: {url}"
+            "\n\n"
+            f"Speakers detected: {speakers}"
+            "\n\n"
+            f"Content Transcript: {part}"
+        )
+        if part_reference:
+            prompt += f"\n\nTiming Reference (SRT): {part_reference}"
+        return prompt
+
+    chunks = split_transcript(transcript, chunk_budget(model_name))
+    if len(chunks) == 1:
+        response_text, input_tokens, output_tokens = _query_llm(
+            model_name, qa_prompt(transcript, timing_reference)
+        )
+    else:
+
+        def extract_part(index: int, chunk: str) -> Tuple[str, int, int]:
+            part_reference = None
+            if timing_reference:
+                part_reference = slice_timing_reference(
+                    timing_reference, chunk, index, len(chunks)
+                )
+            return _query_llm(model_name, qa_prompt(chunk, part_reference))
+
+        results = map_chunks(extract_part, chunks)
+        input_tokens = sum(r[1] for r in results)
+        output_tokens = sum(r[2] for r in results)
+        for text, _, _ in results:
+            if is_error_text(text):
+                return text, input_tokens, output_tokens
+        # The tables of the parts are joined without another model call
+        merged = merge_markdown_tables([text for text, _, _ in results])
+        response_text = merged if merged is not None else results[0][0]
 
     if (
         response_text.strip() != "nan"
@@ -733,6 +854,38 @@ def generate_qa(
     return response_text, input_tokens, output_tokens
 
 
+def _map_reduce(
+    model_name: str,
+    chunks: List[str],
+    map_part: Callable[[int, str], Tuple[str, int, int]],
+    combine_prompt: Callable[[List[str]], str],
+) -> Tuple[str, int, int]:
+    """
+    Runs map_part on every chunk concurrently, then combines the results with
+    combine_prompt, in rounds if they do not fit in one prompt.
+    Returns (text, input_tokens, output_tokens) summed over all calls.
+    """
+    input_tokens = 0
+    output_tokens = 0
+    results = map_chunks(map_part, chunks)
+    while True:
+        input_tokens += sum(r[1] for r in results)
+        output_tokens += sum(r[2] for r in results)
+        for text, _, _ in results:
+            if is_error_text(text):
+                return text, input_tokens, output_tokens
+        parts = [text for text, _, _ in results if not is_empty_result(text)]
+        if not parts:
+            return results[0][0], input_tokens, output_tokens
+        if len(parts) == 1:
+            return parts[0], input_tokens, output_tokens
+        groups = group_parts(parts, chunk_budget(model_name))
+        results = map_chunks(
+            lambda index, prompt: _query_llm(model_name, prompt),
+            [combine_prompt(group) for group in groups],
+        )
+
+
 def generate_tags(
     model_name: str, summary_text: str, language: str = "en"
 ) -> Tuple[str, int, int]:
@@ -754,6 +907,8 @@ def generate_tags(
     return _query_llm(model_name, prompt)
 
 
+@cached
+@rate_limited
 def generate_alt_text(
     model_name: str,
     image_bytes: bytes,
@@ -776,11 +931,10 @@ def generate_alt_text(
 
     if model_name.startswith("gemini"):
         try:
-            from google import genai
             from google.genai import types
 
             GEMINI_API_KEY = os.environ["GEMINI_API_KEY"]
-            client = genai.Client(api_key=GEMINI_API_KEY)
+            client = genai_client(api_key=GEMINI_API_KEY)
 
             contents = [
                 types.Content(
@@ -818,10 +972,10 @@ def generate_alt_text(
             return response_text, input_tokens, output_tokens
 
         except KeyError:
-            return "Error: GEMINI_API_KEY not found", 0, 0
+            return ErrorText("Error: GEMINI_API_KEY not found"), 0, 0
         except Exception as e:
             print(f"Gemini Alt Text Error: {e}")
-            return f"Error: {e}", 0, 0
+            return ErrorText(f"Error: {e}"), 0, 0
 
     elif model_name.startswith("bedrock"):
         try:
@@ -870,7 +1024,7 @@ def generate_alt_text(
                 "max_tokens": 2048,
             }
 
-            response = requests.post(
+            response = http_session().post(
                 endpoint,
                 headers={
                     "Content-Type": "application/json",
@@ -904,19 +1058,33 @@ def generate_alt_text(
                             usage.get("outputTokens", 0),
                         )
                     else:
-                        return f"Unexpected content format: {response.text}", 0, 0
+                        return (
+                            ErrorText(f"Unexpected content format: {response.text}"),
+                            0,
+                            0,
+                        )
                 except KeyError:
-                    return f"Unexpected response structure: {response.text}", 0, 0
+                    return (
+                        ErrorText(f"Unexpected response structure: {response.text}"),
+                        0,
+                        0,
+                    )
             else:
                 return (
-                    f"Bedrock API Error {response.status_code}: {response.text}",
+                    ErrorText(
+                        f"Bedrock API Error {response.status_code}: {response.text}"
+                    ),
                     0,
                     0,
                 )
         except KeyError:
-            return "Error: AWS_BEARER_TOKEN_BEDROCK required", 0, 0
+            return ErrorText("Error: AWS_BEARER_TOKEN_BEDROCK required"), 0, 0
         except Exception as e:
             print(f"Bedrock Alt Text Error: {e}")
-            return f"Error: {e}", 0, 0
+            return ErrorText(f"Error: {e}"), 0, 0
 
-    return f"Error: Multimodal alt text not yet implemented for {model_name}", 0, 0
+    return (
+        ErrorText(f"Error: Multimodal alt text not yet implemented for {model_name}"),
+        0,
+        0,
+    )
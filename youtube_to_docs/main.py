@@ -2,13 +2,30 @@ import argparse
 import logging
 import os
 import re
-import time
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any
 
 import polars as pl
 from rich import print as rprint
 from rich_argparse import RichHelpFormatter
 
 from youtube_to_docs.infographic import generate_infographic
+from youtube_to_docs.journal import (
+    JOURNAL_COMPACT_EVERY,
+    Journal,
+    journal_path,
+    merge_rows,
+)
+from youtube_to_docs.llm_cache import (
+    DEFAULT_MAX_MB,
+    DEFAULT_TTL_DAYS,
+    configure_llm_cache,
+    get_llm_cache,
+    reset_llm_cache,
+)
 from youtube_to_docs.llms import (
     extract_speakers,
     generate_alt_text,
@@ -16,29 +33,54 @@ from youtube_to_docs.llms import (
     generate_qa,
     generate_summary,
     generate_tags,
-    generate_transcript,
     get_model_pricing,
 )
+from youtube_to_docs.mapreduce import (
+    DEFAULT_CHUNK_WORKERS,
+    configure_map_reduce,
+    parse_chunk_tokens,
+)
 from youtube_to_docs.models import MODEL_SUITES
+from youtube_to_docs.ratelimit import (
+    concurrency_report,
+    configure_rate_limits,
+    parse_rate_limits,
+    reset_rate_limits,
+)
+from youtube_to_docs.stages import StageGraph
 from youtube_to_docs.storage import (
     GoogleDriveStorage,
     LocalStorage,
     M365Storage,
     NullStorage,
 )
+from youtube_to_docs.stt import (
+    DEFAULT_CHUNK_MINUTES,
+    DEFAULT_OVERLAP_SECONDS,
+    DEFAULT_STT_WORKERS,
+    transcribe_audio,
+)
 from youtube_to_docs.transcript import (
+    AudioPrefetcher,
     extract_audio,
     fetch_transcript,
     format_as_srt,
     get_video_details,
+    get_videos_details,
     get_youtube_service,
-    resolve_video_ids,
+    iter_pages,
+    iter_video_ids,
 )
 from youtube_to_docs.tts import process_tts
 from youtube_to_docs.utils import (
     format_clickable_path,
+    is_error_text,
     normalize_model_name,
     reorder_columns,
+    slim_dataframe,
+    srt_to_text,
+    text_digest,
+    text_file_column,
 )
 from youtube_to_docs.video import process_videos
 
@@ -58,6 +100,53 @@ class VerboseRow(dict):
             rprint(f"Updated column: {k}")
 
 
+def merge_branch_rows(row: dict, base: dict, branches: list[dict]) -> None:
+    """
+    Merges rows that were processed concurrently back into row.
+    Only values a branch changed relative to base are taken, and branches are
+    applied in order so the resulting column order is deterministic.
+    """
+    for branch in branches:
+        changes = {k: v for k, v in branch.items() if k not in base or base[k] is not v}
+        # Branch rows already reported their updates
+        dict.update(row, changes)
+
+
+class ManifestIndex:
+    """
+    O(1) lookup of manifest rows by URL. The index is built once from the URL
+    column and a row is only materialised as a dict when it is requested.
+    """
+
+    def __init__(self, df: pl.DataFrame | None):
+        self.df = df
+        self.positions: dict[str, int] = {}
+        if df is not None and "URL" in df.columns:
+            for i, url in enumerate(df["URL"].to_list()):
+                # Keep the first row for duplicated URLs, like a filter would
+                self.positions.setdefault(url, i)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self.positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def get(self, url: str) -> dict | None:
+        """Returns the row for url, or None if it is not in the manifest."""
+        i = self.positions.get(url)
+        if i is None or self.df is None:
+            return None
+        return self.df.row(i, named=True)
+
+    def value(self, url: str, column: str) -> object:
+        """Returns a single cell for url without materialising the whole row."""
+        i = self.positions.get(url)
+        if i is None or self.df is None or column not in self.df.columns:
+            return None
+        return self.df[column][i]
+
+
 def main(args_list: list[str] | None = None) -> None:
     # Define styles for the help output
     RichHelpFormatter.styles["argparse.args"] = "cyan italic"
@@ -194,6 +283,181 @@ def main(args_list: list[str] | None = None) -> None:
             "Also sets `--no-youtube-summary`."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of videos to process concurrently. Each worker uses its own "
+            "temporary directory and the manifest is only written by the main "
+            "thread. Default is `1` (sequential)."
+        ),
+    )
+    parser.add_argument(
+        "--fan-out",
+        type=int,
+        default=4,
+        help=(
+            "Maximum number of language and model branches that run at the same "
+            "time for a video. Default is `4`."
+        ),
+    )
+    parser.add_argument(
+        "--prefetch-audio",
+        type=int,
+        default=2,
+        help=(
+            "When using an AI transcript, download the audio of this many upcoming "
+            "videos in the background while the current one is transcribed. "
+            "`0` disables prefetching. Default is `2`."
+        ),
+    )
+    parser.add_argument(
+        "--prefetch-budget-mb",
+        type=int,
+        default=2048,
+        help=(
+            "Disk budget in MB for prefetched audio files. Prefetching pauses "
+            "while this much audio is waiting on disk. Default is `2048`."
+        ),
+    )
+    parser.add_argument(
+        "--stt-chunk-minutes",
+        type=float,
+        default=DEFAULT_CHUNK_MINUTES,
+        help=(
+            "When using an AI transcript, audio longer than this is cut into "
+            "windows of about this many minutes (at silences where possible) that "
+            "are transcribed concurrently and stitched back together. `0` sends "
+            f"the whole audio in one request. Default is `{DEFAULT_CHUNK_MINUTES}`."
+        ),
+    )
+    parser.add_argument(
+        "--stt-overlap-seconds",
+        type=float,
+        default=DEFAULT_OVERLAP_SECONDS,
+        help=(
+            "Seconds of audio shared by neighbouring STT windows, so words at a "
+            f"cut are not lost. Default is `{DEFAULT_OVERLAP_SECONDS}`."
+        ),
+    )
+    parser.add_argument(
+        "--stt-workers",
+        type=int,
+        default=DEFAULT_STT_WORKERS,
+        help=(
+            "Maximum number of STT windows of one video transcribed at the same "
+            f"time. Default is `{DEFAULT_STT_WORKERS}`."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        type=parse_chunk_tokens,
+        default=0,
+        help=(
+            "Transcripts estimated above this many tokens are split into chunks "
+            "of this size for summaries, speakers and Q&A. The chunks are sent "
+            "concurrently and the results combined (map-reduce). `auto` uses a "
+            "size per model (`youtube_to_docs/models.py`). Default is `0`, which "
+            "always sends the whole transcript."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=DEFAULT_CHUNK_WORKERS,
+        help=(
+            "Maximum number of transcript chunks of one call sent at the same "
+            f"time. Default is `{DEFAULT_CHUNK_WORKERS}`."
+        ),
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=parse_rate_limits,
+        default=None,
+        help=(
+            "Per-provider rate limits as a comma-separated list of "
+            "`PROVIDER=RPM[/TPM]` (requests and tokens per minute). Providers are "
+            "`gemini`, `vertex`, `bedrock`, `foundry`, `gcp`, `youtube` (Data API) "
+            "and `transcript` (transcript API, default `60`). "
+            "e.g. `gemini=1000/4000000,bedrock=50`"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Incremental sync for channels and playlists: page through the "
+            "uploads newest first and stop at a run of videos that are already "
+            "in the output file (by URL or `Data Published` date)."
+        ),
+    )
+    parser.add_argument(
+        "--manifest-format",
+        choices=["csv", "parquet", "arrow"],
+        default="csv",
+        help=(
+            "Format of the authoritative local manifest. With `parquet` or "
+            "`arrow` a zstd-compressed columnar file is kept next to the CSV and "
+            "loaded on start-up; the CSV is exported from it. Default is `csv`."
+        ),
+    )
+    parser.add_argument(
+        "--slim-manifest",
+        action="store_true",
+        help=(
+            "Keep long texts (summaries, Q&A, speakers) out of the output file. "
+            "Rows only store the artifact file links plus a hash and size of "
+            "each text, which is loaded from its file when a stage needs it."
+        ),
+    )
+    parser.add_argument(
+        "--save-every",
+        type=int,
+        default=JOURNAL_COMPACT_EVERY,
+        help=(
+            "Rewrite the full output file after this many finished videos. In "
+            "between, finished rows are appended to a journal next to it. `0` "
+            f"only rewrites it at the end of the run. Default is "
+            f"`{JOURNAL_COMPACT_EVERY}`."
+        ),
+    )
+    parser.add_argument(
+        "--save-interval",
+        type=float,
+        default=0,
+        help=(
+            "Also rewrite the output file once this many seconds have passed "
+            "since the last save and a finished video is pending. `0` disables "
+            "the time-based save. Default is `0`."
+        ),
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help=(
+            "Always query the model instead of reusing responses cached on disk "
+            "(in `.youtube-to-docs/llm-cache`) for the same model and prompt."
+        ),
+    )
+    parser.add_argument(
+        "--llm-cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_MB,
+        help=(
+            "Size cap of the LLM response cache in MB. The least recently used "
+            f"responses are evicted first. Default is `{DEFAULT_MAX_MB}`."
+        ),
+    )
+    parser.add_argument(
+        "--llm-cache-ttl-days",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help=(
+            "Number of days a cached LLM response is reused. `0` keeps responses "
+            f"until they are evicted. Default is `{DEFAULT_TTL_DAYS}`."
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -240,6 +504,28 @@ def main(args_list: list[str] | None = None) -> None:
     alt_text_model_arg = args.alt_text_model
     no_youtube_summary = args.no_youtube_summary
     language_arg = args.language
+    workers = max(1, args.workers)
+    fan_out = max(1, args.fan_out)
+    prefetch_audio = max(0, args.prefetch_audio)
+    prefetch_budget_mb = max(1, args.prefetch_budget_mb)
+    stt_chunk_minutes = max(0.0, args.stt_chunk_minutes)
+    stt_overlap_seconds = max(0.0, args.stt_overlap_seconds)
+    stt_workers = max(1, args.stt_workers)
+    slim_manifest = args.slim_manifest
+    save_every = max(0, args.save_every)
+    save_interval = max(0.0, args.save_interval)
+
+    reset_rate_limits()
+    if args.rate_limit:
+        configure_rate_limits(args.rate_limit)
+
+    configure_map_reduce(args.chunk_tokens, args.chunk_workers)
+
+    reset_llm_cache()
+    if not args.no_llm_cache:
+        configure_llm_cache(
+            max_mb=args.llm_cache_max_mb, ttl_days=args.llm_cache_ttl_days
+        )
 
     combine_info_audio = args.combine_infographic_audio
     model_names = model_names_arg.split(",") if model_names_arg else []
@@ -247,8 +533,6 @@ def main(args_list: list[str] | None = None) -> None:
 
     youtube_service = get_youtube_service()
 
-    video_ids = resolve_video_ids(video_id_input, youtube_service)
-
     # Setup Output Directories
     # Setup Storage
     if outfile.lower() in ("none", "n"):
@@ -274,7 +558,7 @@ def main(args_list: list[str] | None = None) -> None:
         base_dir = "."
     else:
         vprint(f"Using Local storage. Output: {outfile}")
-        storage = LocalStorage()
+        storage = LocalStorage(manifest_format=args.manifest_format)
         output_dir = os.path.dirname(outfile)
         storage.ensure_directory(output_dir)  # Ensure parent of CSV exists
         base_dir = output_dir if output_dir else "."
@@ -297,17 +581,21 @@ def main(args_list: list[str] | None = None) -> None:
     local_audio_dir = os.path.join(local_temp_dir, "audio-files")
     os.makedirs(local_audio_dir, exist_ok=True)
 
-    storage.ensure_directory(transcripts_dir)
-    storage.ensure_directory(summaries_dir)
-    storage.ensure_directory(infographics_dir)
-    storage.ensure_directory(speakers_dir)
-    storage.ensure_directory(qa_dir)
-    storage.ensure_directory(audio_dir)
-    storage.ensure_directory(video_dir)
-    storage.ensure_directory(one_sentence_summaries_dir)
-    storage.ensure_directory(tags_dir)
-    storage.ensure_directory(alt_text_dir)
-    storage.ensure_directory(srt_dir)
+    storage.ensure_directories(
+        [
+            transcripts_dir,
+            summaries_dir,
+            infographics_dir,
+            speakers_dir,
+            qa_dir,
+            audio_dir,
+            video_dir,
+            one_sentence_summaries_dir,
+            tags_dir,
+            alt_text_dir,
+            srt_dir,
+        ]
+    )
 
     # Load existing CSV if it exists
     existing_df = storage.load_dataframe(outfile_path)
@@ -316,8 +604,72 @@ def main(args_list: list[str] | None = None) -> None:
     else:
         vprint(f"No existing data found at {outfile}. Starting fresh.")
 
-    rprint(f"Processing {len(video_ids)} videos.")
-    rprint(f"Processing Videos: {video_ids}")
+    def manifest_frame(df: pl.DataFrame) -> pl.DataFrame:
+        """Returns the manifest as it is written (slimmed if requested)."""
+        if slim_manifest:
+            df = slim_dataframe(df)
+        return reorder_columns(df)
+
+    def write_manifest(df: pl.DataFrame, final: bool = True) -> str:
+        """
+        Sorts the manifest and writes it to storage in full (final=False for
+        a checkpoint, see Storage.save_dataframe).
+        """
+        if "Data Published" in df.columns:
+            df = df.sort("Data Published", descending=True)
+        return storage.save_dataframe(manifest_frame(df), outfile_path, final=final)
+
+    def keep_text(
+        row: dict, texts: dict, text_col: str, file_col: str, text: object
+    ) -> None:
+        """
+        Stores a text column of row. With a slim manifest a text that has an
+        artifact file is kept in texts for the later stages instead, and row
+        (and so the journal) only holds the file path and the text's hash and
+        size.
+        """
+        if slim_manifest and isinstance(text, str) and text and row.get(file_col):
+            texts[text_col] = text
+            row[f"{text_col} Hash"], row[f"{text_col} Size"] = text_digest(text)
+            row[text_col] = None
+        else:
+            row[text_col] = text
+
+    def artifact_text(row: dict, texts: dict, text_col: str, file_col: str) -> str:
+        """
+        Returns a text column of row, taking it from texts or loading it from
+        its artifact file when a slim manifest left it out.
+        """
+        text = row.get(text_col) or texts.get(text_col)
+        path = row.get(file_col)
+        if text or not path:
+            return text
+        try:
+            text = storage.read_text(str(path))
+        except Exception as e:
+            print(f"Warning: Failed to read {path}: {e}")
+            return text
+        texts[text_col] = text
+        return text
+
+    # Finished rows are appended to a journal and the manifest is only
+    # rewritten every save_every videos (or save_interval seconds) and at the
+    # end of the run.
+    # Rows left in the journal by a run that did not finish are replayed here.
+    journal = None
+    if not isinstance(storage, NullStorage):
+        is_local = isinstance(storage, LocalStorage)
+        journal = Journal(journal_path(outfile_path if is_local else outfile, is_local))
+        replayed = journal.replay()
+        if replayed:
+            rprint(f"Replaying {len(replayed)} rows from {journal.path}")
+            existing_df = merge_rows(existing_df, replayed)
+            try:
+                write_manifest(existing_df)
+                journal.clear()
+            except Exception as e:
+                print(f"Warning: Could not compact journal: {e}")
+
     display_outfile = "SharePoint" if outfile in ("s", "sharepoint") else outfile
     rprint(f"Saving to: {display_outfile}")
 
@@ -325,17 +677,98 @@ def main(args_list: list[str] | None = None) -> None:
         vprint(f"Summarizing using models: {model_names}")
     vprint(f"Target Languages: {languages}")
 
-    rows = []
+    # Index the manifest by URL once instead of filtering it for every video
+    manifest_index = ManifestIndex(existing_df)
+
+    # Incremental sync: stop paging a channel or playlist once we reach videos
+    # that are already in the manifest
+    known_video_ids = None
+    latest_published = None
+    if args.incremental:
+        known_video_ids = {
+            url.rsplit("v=", 1)[-1] for url in manifest_index.positions if url
+        }
+        if existing_df is not None and "Data Published" in existing_df.columns:
+            published = existing_df["Data Published"].drop_nulls().cast(pl.Utf8)
+            latest_published = published.max() if len(published) else None
+        vprint(
+            f"Incremental sync: {len(known_video_ids)} known videos, "
+            f"latest published {latest_published}"
+        )
+
+    # Resolve video IDs page by page on a background thread so processing
+    # starts before a long playlist or channel has been paged through. The
+    # reader gets its own YouTube service: a service is not thread-safe
+    reader_youtube_service = get_youtube_service() if youtube_service else None
+    video_id_pages = iter_pages(
+        iter_video_ids(
+            video_id_input,
+            reader_youtube_service,
+            known_video_ids=known_video_ids,
+            latest_published=latest_published,
+        )
+    )
+    first_page = next(video_id_pages, [])
+
+    video_details = {}
+
+    def fetch_page_details(page: list[str]) -> None:
+        """
+        Fetches metadata for the new videos of a page (50 videos per API call);
+        anything missing is fetched per video as before.
+        """
+        new_video_ids = [
+            v
+            for v in page
+            if f"https://www.youtube.com/watch?v={v}" not in manifest_index
+        ]
+        if not new_video_ids:
+            return
+        try:
+            video_details.update(get_videos_details(new_video_ids, youtube_service))
+        except Exception as e:
+            print(f"Warning: Batched metadata fetch failed: {e}")
+
+    # All video IDs resolved so far, in order
+    video_ids: list[str] = []
+    resolving = threading.Event()
+    resolving.set()
 
-    for i, video_id in enumerate(video_ids, 1):
+    rows = []
+    worker_state = threading.local()
+
+    def get_worker_audio_dir() -> str:
+        """Returns the local audio directory owned by the current worker."""
+        if workers == 1:
+            return local_audio_dir
+        if not hasattr(worker_state, "audio_dir"):
+            worker_state.audio_dir = os.path.join(
+                local_temp_dir, threading.current_thread().name, "audio-files"
+            )
+            os.makedirs(worker_state.audio_dir, exist_ok=True)
+        return worker_state.audio_dir
+
+    def get_worker_youtube_service() -> Any:
+        """
+        Returns the YouTube API service of the current thread. The service
+        wraps one httplib2 connection, which is not thread-safe, so each
+        worker builds its own.
+        """
+        if youtube_service is None:
+            return None
+        if threading.current_thread() is threading.main_thread():
+            return youtube_service
+        if not hasattr(worker_state, "youtube_service"):
+            worker_state.youtube_service = get_youtube_service()
+        return worker_state.youtube_service
+
+    def process_video_id(i: int, video_id: str) -> dict | None:
+        """Processes a single video and returns its row (None if skipped)."""
         url = f"https://www.youtube.com/watch?v={video_id}"
+        worker_audio_dir = get_worker_audio_dir()
         rprint(f"Processing Video ID: {video_id}")
         # Check if video already exists in CSV
-        existing_row = None
-        if existing_df is not None and "URL" in existing_df.columns:
-            matches = existing_df.filter(pl.col("URL") == url)
-            if not matches.is_empty():
-                existing_row = matches.to_dicts()[0]
+        existing_row = manifest_index.get(url)
 
         # Determine if we need to process this video at all
         needs_details = existing_row is None
@@ -350,9 +783,11 @@ def main(args_list: list[str] | None = None) -> None:
 
         # Get Details
         if needs_details:
-            details = get_video_details(video_id, youtube_service)
+            details = video_details.get(video_id) or get_video_details(
+                video_id, get_worker_youtube_service()
+            )
             if not details:
-                continue
+                return None
             (
                 video_title,
                 description,
@@ -381,37 +816,17 @@ def main(args_list: list[str] | None = None) -> None:
             video_duration = row.get("Duration", "")
 
         display_title = video_title if video_title else video_id
-        print(f"(Video {i} of {len(video_ids)}) Video Title: {display_title}")
+        total = f"{len(video_ids)}{'+' if resolving.is_set() else ''}"
+        print(f"(Video {i} of {total}) Video Title: {display_title}")
 
         safe_title = re.sub(r'[\\/*?:"><>|]', "_", video_title).replace("\n", " ")
         safe_title = safe_title.replace("\r", "")
 
-        # Initial Save: Create the sheet with basic metadata if it's a new video
-        if needs_details:
+        # Initial Save: Journal the basic metadata if it's a new video
+        if needs_details and journal is not None:
             try:
-                # Create a temporary DF with just this new row
-                temp_row_df = pl.DataFrame([row])
-
-                # Combine with existing data
-                # (excluding this video if it was somehow there, but we checked)
-                # existing_df contains all OTHER videos.
-                if existing_df is not None:
-                    # We might need to align columns if row has new keys
-                    # handled by diagonal concat
-                    current_save_df = pl.concat(
-                        [existing_df, temp_row_df], how="diagonal"
-                    )
-                else:
-                    current_save_df = temp_row_df
-
-                if "Data Published" in current_save_df.columns:
-                    current_save_df = current_save_df.sort(
-                        "Data Published", descending=True
-                    )
-
-                current_save_df = reorder_columns(current_save_df)
-                storage.save_dataframe(current_save_df, outfile_path)
-                vprint(f"Created/Updated {outfile} with initial details.")
+                journal.append(row, finished=False)
+                vprint(f"Journaled initial details for {video_id}.")
             except Exception as e:
                 print(f"Warning: Could not perform initial save: {e}")
 
@@ -444,7 +859,10 @@ def main(args_list: list[str] | None = None) -> None:
             else:
                 # Need to extract
                 rprint(f"Extracting audio for {transcript_arg}...")
-                local_audio_path = extract_audio(video_id, local_audio_dir)
+                if audio_prefetcher:
+                    local_audio_path = audio_prefetcher.get(video_id)
+                else:
+                    local_audio_path = extract_audio(video_id, worker_audio_dir)
                 if local_audio_path:
                     # Upload to storage
                     target_audio_path = os.path.join(audio_dir, f"{video_id}.m4a")
@@ -458,307 +876,334 @@ def main(args_list: list[str] | None = None) -> None:
                     row["Audio File"] = uploaded_path_or_link
                     audio_file_path = uploaded_path_or_link
 
+        # Texts of this video a slim manifest keeps out of the row (see
+        # keep_text), by column
+        texts: dict[str, str] = {}
+
         # --- Language Dependent Logic ---
-        for language in languages:
-            rprint(f"--- Processing Language: {language} ---")
-
-            col_suffix = f" ({language})" if language != "en" else ""
-            lang_str = f" ({language})" if language != "en" else ""
-
-            col_youtube = f"Transcript File youtube generated{col_suffix}"
-            col_human = f"Transcript File human generated{col_suffix}"
-            col_srt = f"SRT File youtube{col_suffix}"
-
-            # --- YouTube Transcript Fetching ---
-            youtube_transcript = ""
-            is_generated = False
-            srt_content = ""
-
-            # Check storage if not in row
-            if not row.get(col_youtube) and not row.get(col_human):
-                gen_path = os.path.join(
-                    transcripts_dir,
-                    f"youtube generated{lang_str} - {video_id} - {safe_title}.txt",
-                )
-                human_path = os.path.join(
-                    transcripts_dir,
-                    f"human generated{lang_str} - {video_id} - {safe_title}.txt",
-                )
-                if storage.exists(human_path):
-                    row[col_human] = human_path
-                elif storage.exists(gen_path):
-                    row[col_youtube] = gen_path
-
-            # Load from row
-            if row.get(col_youtube):
-                path = row[col_youtube]
-                if path and storage.exists(str(path)):
-                    youtube_transcript = storage.read_text(str(path))
-                    is_generated = True
-            elif row.get(col_human):
-                path = row[col_human]
-                if path and storage.exists(str(path)):
-                    youtube_transcript = storage.read_text(str(path))
-                    is_generated = False
-
-            # Load SRT if available
-            if youtube_transcript and row.get(col_srt):
-                srt_path = row[col_srt]
-                if srt_path and storage.exists(str(srt_path)):
-                    srt_content = storage.read_text(str(srt_path))
-            elif youtube_transcript and not srt_content:
-                # Try to find it on disk
-                expected_srt_path = os.path.join(
-                    srt_dir,
-                    f"{'youtube' if is_generated else 'human'} generated{lang_str} - "
-                    f"{video_id} - {safe_title}.srt",
-                )
-                if storage.exists(expected_srt_path):
-                    srt_content = storage.read_text(expected_srt_path)
-                    row[col_srt] = expected_srt_path
-
-            # If no existing transcript, fetch from YouTube
-            if not youtube_transcript:
-                result = fetch_transcript(video_id, language=language)
-                if result:
-                    youtube_transcript, is_generated, transcript_data = result
-                    prefix = (
-                        f"youtube generated{lang_str} - "
-                        if is_generated
-                        else f"human generated{lang_str} - "
-                    )
-                    filename = f"{prefix}{video_id} - {safe_title}.txt"
-                    srt_filename = f"{prefix}{video_id} - {safe_title}.srt"
-                    # Relative path for storage
-                    target_path = os.path.join(transcripts_dir, filename)
-                    srt_target_path = os.path.join(srt_dir, srt_filename)
-
-                    try:
-                        saved_path = storage.write_text(target_path, youtube_transcript)
-                        rprint(
-                            f"Saved YouTube transcript ({language}): "
-                            f"{format_clickable_path(saved_path)}"
-                        )
-                        # Update row with YouTube transcript info
-                        if is_generated:
-                            row[col_youtube] = saved_path
-                        else:
-                            row[col_human] = saved_path
+        # Language and model branches share one concurrency limit per video.
+        # Only leaf work holds a slot so nested fan-out cannot deadlock.
+        branch_slots = threading.BoundedSemaphore(fan_out)
 
-                        # Save SRT
-                        srt_content = format_as_srt(transcript_data)
-                        saved_srt_path = storage.write_text(
-                            srt_target_path, srt_content
-                        )
-                        rprint(
-                            "Saved YouTube SRT: "
-                            f"{format_clickable_path(saved_srt_path)}"
-                        )
-                        row[col_srt] = saved_srt_path
-                    except Exception as e:
-                        print(f"Error writing YouTube transcript/SRT: {e}")
-
-            # Update character counts
-            if youtube_transcript:
-                row[f"Transcript characters from youtube{col_suffix}"] = len(
-                    youtube_transcript
-                )
-            elif language != "en":
-                # Fallback to English transcript if available
-                en_path = row.get("Transcript File human generated") or row.get(
-                    "Transcript File youtube generated"
-                )
-                if en_path and storage.exists(str(en_path)):
-                    youtube_transcript = storage.read_text(str(en_path))
-                    vprint(
-                        "Using existing English transcript as fallback for "
-                        f"{language} processing."
-                    )
-                else:
-                    # Try fetching English fresh
-                    en_result = fetch_transcript(video_id, language="en")
-                    if en_result:
-                        youtube_transcript, en_is_generated, _ = en_result
-                        vprint(
-                            f"Fetched English transcript as fallback for {language} "
-                            "processing."
-                        )
-                        # Save English transcript if missing
-                        if not row.get(
-                            "Transcript File human generated"
-                        ) and not row.get("Transcript File youtube generated"):
-                            prefix = (
-                                "youtube generated - "
-                                if en_is_generated
-                                else "human generated - "
-                            )
-                            filename = f"{prefix}{video_id} - {safe_title}.txt"
-                            target_path = os.path.join(transcripts_dir, filename)
+        def process_language(language: str, row: dict) -> None:
+            """Runs the transcript and model stages for one language on row."""
+            with branch_slots:
+                rprint(f"--- Processing Language: {language} ---")
 
-                            try:
-                                saved_path = storage.write_text(
-                                    target_path, youtube_transcript
-                                )
-                                rprint(
-                                    f"Saved fallback English transcript: "
-                                    f"{format_clickable_path(saved_path)}"
-                                )
-                                if en_is_generated:
-                                    row["Transcript File youtube generated"] = (
-                                        saved_path
-                                    )
-                                else:
-                                    row["Transcript File human generated"] = saved_path
-                            except Exception as e:
-                                print(f"Error writing fallback English transcript: {e}")
+                col_suffix = f" ({language})" if language != "en" else ""
+                lang_str = f" ({language})" if language != "en" else ""
 
-                if youtube_transcript:
-                    row[f"Transcript characters from youtube{col_suffix}"] = len(
-                        youtube_transcript
-                    )
+                col_youtube = f"Transcript File youtube generated{col_suffix}"
+                col_human = f"Transcript File human generated{col_suffix}"
+                col_srt = f"SRT File youtube{col_suffix}"
 
-            # --- AI Transcript Generation (if requested) ---
-            ai_transcript = ""
-            ai_srt_content = ""
-            srt_transcript = ""
-            stt_cost = float("nan")
-            transcript = youtube_transcript  # Default to YouTube transcript
-
-            if transcript_arg != "youtube":
-                ai_col = f"Transcript File {transcript_arg} generated{col_suffix}"
-                ai_srt_col = f"SRT File {transcript_arg}{col_suffix}"
-                stt_cost_col = (
-                    f"{normalize_model_name(transcript_arg)} STT cost{col_suffix} ($)"
-                )
+                # --- YouTube Transcript Fetching ---
+                youtube_transcript = ""
+                is_generated = False
+                srt_content = ""
 
                 # Check storage if not in row
-                if not row.get(ai_col):
-                    expected_ai_path = os.path.join(
+                if not row.get(col_youtube) and not row.get(col_human):
+                    gen_path = os.path.join(
                         transcripts_dir,
-                        f"{transcript_arg} generated{lang_str} - "
-                        f"{video_id} - {safe_title}.txt",
+                        f"youtube generated{lang_str} - {video_id} - {safe_title}.txt",
                     )
-                    if storage.exists(expected_ai_path):
-                        row[ai_col] = expected_ai_path
-
-                # Check row for AI transcript
-                if row.get(ai_col):
-                    path = row[ai_col]
+                    human_path = os.path.join(
+                        transcripts_dir,
+                        f"human generated{lang_str} - {video_id} - {safe_title}.txt",
+                    )
+                    if storage.exists(human_path):
+                        row[col_human] = human_path
+                    elif storage.exists(gen_path):
+                        row[col_youtube] = gen_path
+
+                # Load from row
+                if row.get(col_youtube):
+                    path = row[col_youtube]
                     if path and storage.exists(str(path)):
-                        ai_transcript = storage.read_text(str(path))
+                        youtube_transcript = storage.read_text(str(path))
+                        is_generated = True
+                elif row.get(col_human):
+                    path = row[col_human]
+                    if path and storage.exists(str(path)):
+                        youtube_transcript = storage.read_text(str(path))
+                        is_generated = False
 
-                # Load AI SRT if available
-                if ai_transcript and row.get(ai_srt_col):
-                    srt_path = row[ai_srt_col]
+                # Load SRT if available
+                if youtube_transcript and row.get(col_srt):
+                    srt_path = row[col_srt]
                     if srt_path and storage.exists(str(srt_path)):
-                        ai_srt_content = storage.read_text(str(srt_path))
-                elif ai_transcript and not ai_srt_content:
+                        srt_content = storage.read_text(str(srt_path))
+                elif youtube_transcript and not srt_content:
                     # Try to find it on disk
-                    expected_ai_srt_path = os.path.join(
+                    expected_srt_path = os.path.join(
                         srt_dir,
-                        f"{transcript_arg} generated{lang_str} - "
+                        f"{'youtube' if is_generated else 'human'} generated"
+                        f"{lang_str} - "
                         f"{video_id} - {safe_title}.srt",
                     )
-                    if storage.exists(expected_ai_srt_path):
-                        ai_srt_content = storage.read_text(expected_ai_srt_path)
-                        row[ai_srt_col] = expected_ai_srt_path
-
-                # If no existing AI transcript, generate it
-                if not ai_transcript:
-                    audio_input_path = (
-                        local_audio_path
-                        if local_audio_path and os.path.exists(local_audio_path)
-                        else None
-                    )
-
-                    if not audio_input_path and audio_file_path:
-                        # Try to get it locally via storage abstraction
-                        vprint(f"Retrieving audio file locally: {audio_file_path}")
-                        audio_input_path = storage.get_local_file(
-                            audio_file_path, download_dir=local_audio_dir
-                        )
-
-                    if not audio_input_path:
-                        print(f"Error: Audio file not found for STT: {audio_file_path}")
-                    else:
-                        vprint(
-                            f"Generating transcript using model: {transcript_arg} "
-                            f"({language})..."
-                        )
-                        ai_transcript, stt_in, stt_out = generate_transcript(
-                            transcript_arg, audio_input_path, url, language=language
+                    if storage.exists(expected_srt_path):
+                        srt_content = storage.read_text(expected_srt_path)
+                        row[col_srt] = expected_srt_path
+
+                # If no existing transcript, fetch from YouTube
+                if not youtube_transcript:
+                    result = fetch_transcript(video_id, language=language)
+                    if result:
+                        youtube_transcript, is_generated, transcript_data = result
+                        prefix = (
+                            f"youtube generated{lang_str} - "
+                            if is_generated
+                            else f"human generated{lang_str} - "
                         )
-
-                        # Also generate SRT for AI transcript
-                        ai_srt_content, _, _ = generate_transcript(
-                            transcript_arg,
-                            audio_input_path,
-                            url,
-                            language=language,
-                            srt=True,
-                        )
-
-                        # Save AI transcript
-                        prefix = f"{transcript_arg} generated{lang_str} - "
                         filename = f"{prefix}{video_id} - {safe_title}.txt"
                         srt_filename = f"{prefix}{video_id} - {safe_title}.srt"
+                        # Relative path for storage
                         target_path = os.path.join(transcripts_dir, filename)
                         srt_target_path = os.path.join(srt_dir, srt_filename)
 
                         try:
-                            saved_path = storage.write_text(target_path, ai_transcript)
+                            saved_path = storage.write_text(
+                                target_path, youtube_transcript
+                            )
                             rprint(
-                                "Saved AI transcript: "
+                                f"Saved YouTube transcript ({language}): "
                                 f"{format_clickable_path(saved_path)}"
                             )
-                            row[ai_col] = saved_path
-
+                            # Update row with YouTube transcript info
+                            if is_generated:
+                                row[col_youtube] = saved_path
+                            else:
+                                row[col_human] = saved_path
+
+                            # Save SRT
+                            srt_content = format_as_srt(transcript_data)
                             saved_srt_path = storage.write_text(
-                                srt_target_path, ai_srt_content
+                                srt_target_path, srt_content
                             )
                             rprint(
-                                f"Saved AI SRT: {format_clickable_path(saved_srt_path)}"
+                                "Saved YouTube SRT: "
+                                f"{format_clickable_path(saved_srt_path)}"
                             )
-                            row[ai_srt_col] = saved_srt_path
+                            row[col_srt] = saved_srt_path
                         except Exception as e:
-                            print(f"Error writing AI transcript/SRT: {e}")
+                            print(f"Error writing YouTube transcript/SRT: {e}")
 
-                        # Calculate STT Cost
-                        if verbose:
-                            input_price, output_price = get_model_pricing(
-                                transcript_arg
+                # Update character counts
+                if youtube_transcript:
+                    row[f"Transcript characters from youtube{col_suffix}"] = len(
+                        youtube_transcript
+                    )
+                elif language != "en":
+                    # Fallback to English transcript if available
+                    en_path = row.get("Transcript File human generated") or row.get(
+                        "Transcript File youtube generated"
+                    )
+                    if en_path and storage.exists(str(en_path)):
+                        youtube_transcript = storage.read_text(str(en_path))
+                        vprint(
+                            "Using existing English transcript as fallback for "
+                            f"{language} processing."
+                        )
+                    else:
+                        # Try fetching English fresh
+                        en_result = fetch_transcript(video_id, language="en")
+                        if en_result:
+                            youtube_transcript, en_is_generated, _ = en_result
+                            vprint(
+                                "Fetched English transcript as fallback for "
+                                f"{language} "
+                                "processing."
                             )
-                            if input_price is not None and output_price is not None:
-                                stt_cost = (stt_in / 1_000_000) * input_price + (
-                                    stt_out / 1_000_000
-                                ) * output_price
-                                row[stt_cost_col] = round(stt_cost, 2)
-                                vprint(f"STT cost: ${row[stt_cost_col]:.2f}")
-
-            # If AI transcript exists (either found or generated),
-            # use it for summaries
-            if ai_transcript:
-                transcript = ai_transcript
-                # Use SRT for Q&A if available
-                srt_transcript = ai_srt_content if ai_srt_content else transcript
-            else:
-                transcript = youtube_transcript
-                srt_transcript = srt_content if srt_content else transcript
+                            # Save English transcript if missing
+                            if not row.get(
+                                "Transcript File human generated"
+                            ) and not row.get("Transcript File youtube generated"):
+                                prefix = (
+                                    "youtube generated - "
+                                    if en_is_generated
+                                    else "human generated - "
+                                )
+                                filename = f"{prefix}{video_id} - {safe_title}.txt"
+                                target_path = os.path.join(transcripts_dir, filename)
 
-            if transcript_arg != "youtube":
-                row[f"Transcript characters from {transcript_arg}{col_suffix}"] = len(
-                    ai_transcript
-                )
+                                try:
+                                    saved_path = storage.write_text(
+                                        target_path, youtube_transcript
+                                    )
+                                    rprint(
+                                        f"Saved fallback English transcript: "
+                                        f"{format_clickable_path(saved_path)}"
+                                    )
+                                    if en_is_generated:
+                                        row["Transcript File youtube generated"] = (
+                                            saved_path
+                                        )
+                                    else:
+                                        row["Transcript File human generated"] = (
+                                            saved_path
+                                        )
+                                except Exception as e:
+                                    print(
+                                        "Error writing fallback English transcript: "
+                                        f"{e}"
+                                    )
 
-            if not transcript:
-                vprint(
-                    f"No transcript (YouTube or AI) available for {video_id} "
-                    f"({language}). Skipping further processing for this language."
-                )
-                continue
+                    if youtube_transcript:
+                        row[f"Transcript characters from youtube{col_suffix}"] = len(
+                            youtube_transcript
+                        )
+
+                # --- AI Transcript Generation (if requested) ---
+                ai_transcript = ""
+                ai_srt_content = ""
+                srt_transcript = ""
+                stt_cost = float("nan")
+                transcript = youtube_transcript  # Default to YouTube transcript
+
+                if transcript_arg != "youtube":
+                    ai_col = f"Transcript File {transcript_arg} generated{col_suffix}"
+                    ai_srt_col = f"SRT File {transcript_arg}{col_suffix}"
+                    stt_cost_col = (
+                        f"{normalize_model_name(transcript_arg)} "
+                        f"STT cost{col_suffix} ($)"
+                    )
+
+                    # Check storage if not in row
+                    if not row.get(ai_col):
+                        expected_ai_path = os.path.join(
+                            transcripts_dir,
+                            f"{transcript_arg} generated{lang_str} - "
+                            f"{video_id} - {safe_title}.txt",
+                        )
+                        if storage.exists(expected_ai_path):
+                            row[ai_col] = expected_ai_path
+
+                    # Check row for AI transcript
+                    if row.get(ai_col):
+                        path = row[ai_col]
+                        if path and storage.exists(str(path)):
+                            ai_transcript = storage.read_text(str(path))
+
+                    # Load AI SRT if available
+                    if ai_transcript and row.get(ai_srt_col):
+                        srt_path = row[ai_srt_col]
+                        if srt_path and storage.exists(str(srt_path)):
+                            ai_srt_content = storage.read_text(str(srt_path))
+                    elif ai_transcript and not ai_srt_content:
+                        # Try to find it on disk
+                        expected_ai_srt_path = os.path.join(
+                            srt_dir,
+                            f"{transcript_arg} generated{lang_str} - "
+                            f"{video_id} - {safe_title}.srt",
+                        )
+                        if storage.exists(expected_ai_srt_path):
+                            ai_srt_content = storage.read_text(expected_ai_srt_path)
+                            row[ai_srt_col] = expected_ai_srt_path
+
+                    # If no existing AI transcript, generate it
+                    if not ai_transcript:
+                        audio_input_path = (
+                            local_audio_path
+                            if local_audio_path and os.path.exists(local_audio_path)
+                            else None
+                        )
+
+                        if not audio_input_path and audio_file_path:
+                            # Try to get it locally via storage abstraction
+                            vprint(f"Retrieving audio file locally: {audio_file_path}")
+                            audio_input_path = storage.get_local_file(
+                                audio_file_path, download_dir=worker_audio_dir
+                            )
+
+                        if not audio_input_path:
+                            print(
+                                "Error: Audio file not found for STT: "
+                                f"{audio_file_path}"
+                            )
+                        else:
+                            vprint(
+                                f"Generating transcript using model: {transcript_arg} "
+                                f"({language})..."
+                            )
+                            # One timed transcription; the plain transcript is
+                            # derived from its cues
+                            ai_srt_content, stt_in, stt_out = transcribe_audio(
+                                transcript_arg,
+                                audio_input_path,
+                                url,
+                                language=language,
+                                chunk_minutes=stt_chunk_minutes,
+                                overlap_seconds=stt_overlap_seconds,
+                                workers=stt_workers,
+                            )
+                            ai_transcript = srt_to_text(ai_srt_content)
+
+                            # Save AI transcript
+                            prefix = f"{transcript_arg} generated{lang_str} - "
+                            filename = f"{prefix}{video_id} - {safe_title}.txt"
+                            srt_filename = f"{prefix}{video_id} - {safe_title}.srt"
+                            target_path = os.path.join(transcripts_dir, filename)
+                            srt_target_path = os.path.join(srt_dir, srt_filename)
+
+                            try:
+                                saved_path = storage.write_text(
+                                    target_path, ai_transcript
+                                )
+                                rprint(
+                                    "Saved AI transcript: "
+                                    f"{format_clickable_path(saved_path)}"
+                                )
+                                row[ai_col] = saved_path
+
+                                saved_srt_path = storage.write_text(
+                                    srt_target_path, ai_srt_content
+                                )
+                                rprint(
+                                    "Saved AI SRT: "
+                                    f"{format_clickable_path(saved_srt_path)}"
+                                )
+                                row[ai_srt_col] = saved_srt_path
+                            except Exception as e:
+                                print(f"Error writing AI transcript/SRT: {e}")
+
+                            # Calculate STT Cost
+                            if verbose:
+                                input_price, output_price = get_model_pricing(
+                                    transcript_arg
+                                )
+                                if input_price is not None and output_price is not None:
+                                    stt_cost = (stt_in / 1_000_000) * input_price + (
+                                        stt_out / 1_000_000
+                                    ) * output_price
+                                    row[stt_cost_col] = round(stt_cost, 2)
+                                    vprint(f"STT cost: ${row[stt_cost_col]:.2f}")
+
+                # If AI transcript exists (either found or generated),
+                # use it for summaries
+                if ai_transcript:
+                    transcript = ai_transcript
+                    # Use SRT for Q&A if available
+                    srt_transcript = ai_srt_content if ai_srt_content else transcript
+                else:
+                    transcript = youtube_transcript
+                    srt_transcript = srt_content if srt_content else transcript
+
+                if transcript_arg != "youtube":
+                    row[f"Transcript characters from {transcript_arg}{col_suffix}"] = (
+                        len(ai_transcript)
+                    )
+
+                if not transcript:
+                    vprint(
+                        f"No transcript (YouTube or AI) available for {video_id} "
+                        f"({language}). Skipping further processing for this language."
+                    )
+                    return
 
             # Summarize for each requested model
-            for model_name in model_names:
+            def process_model(model_name: str, row: dict) -> None:
+                """Runs the per-model stages for the current language on row."""
                 summary_col_name = (
                     f"Summary Text {model_name} from {transcript_arg}{col_suffix}"
                 )
@@ -778,33 +1223,51 @@ def main(args_list: list[str] | None = None) -> None:
                     f"Speaker extraction cost from {transcript_arg} ($)"
                 )
 
-                # Speaker Extraction
+                # Values shared between stages
                 speakers_text = ""
                 speakers_input = 0
                 speakers_output = 0
-                speaker_cost = float("nan")
+                summary_text = ""
+                summary_input = 0
+                summary_output = 0
+                summary_generated = False
+                yt_speakers_text = 'float("nan")'
+                yt_summary_text = ""
 
-                # Check disk for speakers file
-                if not row.get(speakers_file_col_name):
-                    speakers_filename = (
-                        f"{model_name} - {video_id} - {safe_title} - "
-                        f"speakers (from {transcript_arg}).txt"
-                    )
-                    expected_path = os.path.join(speakers_dir, speakers_filename)
-                    if storage.exists(expected_path):
-                        row[speakers_file_col_name] = expected_path
+                def speakers_stage() -> None:
+                    nonlocal speakers_text, speakers_input, speakers_output
+                    speaker_cost = float("nan")
 
-                # Load speakers from file/row
-                if row.get(speakers_file_col_name):
-                    path = row[speakers_file_col_name]
-                    if path and storage.exists(str(path)):
-                        speakers_text = storage.read_text(str(path))
-                        row[speakers_col_name] = speakers_text
-                elif row.get(speakers_col_name):
-                    speakers_text = row[speakers_col_name]
+                    # Check disk for speakers file
+                    if not row.get(speakers_file_col_name):
+                        speakers_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"speakers (from {transcript_arg}).txt"
+                        )
+                        expected_path = os.path.join(speakers_dir, speakers_filename)
+                        if storage.exists(expected_path):
+                            row[speakers_file_col_name] = expected_path
+
+                    # Load speakers from file/row
+                    if row.get(speakers_file_col_name):
+                        path = row[speakers_file_col_name]
+                        if path and storage.exists(str(path)):
+                            speakers_text = storage.read_text(str(path))
+                            keep_text(
+                                row,
+                                texts,
+                                speakers_col_name,
+                                speakers_file_col_name,
+                                speakers_text,
+                            )
+                    elif row.get(speakers_col_name):
+                        speakers_text = row[speakers_col_name]
 
-                if not speakers_text:
-                    # For speaker extraction, try to use English transcript if available
+                    if speakers_text:
+                        return
+
+                    # For speaker extraction, try to use English transcript if
+                    # available
                     speaker_source_transcript = transcript
                     if language != "en":
                         en_path = row.get("Transcript File human generated") or row.get(
@@ -841,6 +1304,13 @@ def main(args_list: list[str] | None = None) -> None:
                                 f"Saved speakers: {format_clickable_path(saved_path)}"
                             )
                             row[speakers_file_col_name] = saved_path
+                            keep_text(
+                                row,
+                                texts,
+                                speakers_col_name,
+                                speakers_file_col_name,
+                                speakers_text,
+                            )
                         except Exception as e:
                             print(f"Error writing speakers file: {e}")
 
@@ -856,36 +1326,46 @@ def main(args_list: list[str] | None = None) -> None:
                             row[speaker_cost_col_name] = round(speaker_cost, 2)
                             vprint(f"Speaker extraction cost: ${speaker_cost:.2f}")
 
-                # QA Generation
-                qa_col_name = f"QA Text {model_name} from {transcript_arg}{col_suffix}"
-                qa_file_col_name = (
-                    f"QA File {model_name} from {transcript_arg}{col_suffix}"
-                )
-                qa_cost_col_name = (
-                    f"{normalize_model_name(model_name)} QA cost from "
-                    f"{transcript_arg}{col_suffix} ($)"
-                )
-
-                # Determine the best transcript for QA (prefer SRT for timestamps)
-                qa_transcript_to_use = srt_transcript if srt_transcript else transcript
+                def qa_stage() -> None:
+                    qa_col_name = (
+                        f"QA Text {model_name} from {transcript_arg}{col_suffix}"
+                    )
+                    qa_file_col_name = (
+                        f"QA File {model_name} from {transcript_arg}{col_suffix}"
+                    )
+                    qa_cost_col_name = (
+                        f"{normalize_model_name(model_name)} QA cost from "
+                        f"{transcript_arg}{col_suffix} ($)"
+                    )
 
-                # Check disk for QA file
-                if not row.get(qa_file_col_name):
-                    qa_filename = (
-                        f"{model_name} - {video_id} - {safe_title} - "
-                        f"qa (from {transcript_arg}){lang_str}.md"
+                    # Determine the best transcript for QA (prefer SRT for
+                    # timestamps)
+                    qa_transcript_to_use = (
+                        srt_transcript if srt_transcript else transcript
                     )
-                    expected_path = os.path.join(qa_dir, qa_filename)
-                    if storage.exists(expected_path):
-                        row[qa_file_col_name] = expected_path
 
-                # Load QA from file/row
-                if row.get(qa_file_col_name):
-                    path = row[qa_file_col_name]
-                    if path and storage.exists(str(path)):
-                        row[qa_col_name] = storage.read_text(str(path))
+                    # Check disk for QA file
+                    if not row.get(qa_file_col_name):
+                        qa_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"qa (from {transcript_arg}){lang_str}.md"
+                        )
+                        expected_path = os.path.join(qa_dir, qa_filename)
+                        if storage.exists(expected_path):
+                            row[qa_file_col_name] = expected_path
+
+                    # Load QA from file/row
+                    if row.get(qa_file_col_name):
+                        path = row[qa_file_col_name]
+                        if path and storage.exists(str(path)):
+                            if slim_manifest:
+                                # The manifest only references the Q&A file
+                                return
+                            row[qa_col_name] = storage.read_text(str(path))
+
+                    if row.get(qa_col_name):
+                        return
 
-                if not row.get(qa_col_name):
                     rprint(f"Generating Q&A using model: {model_name} ({language})")
 
                     qa_text, qa_input, qa_output = generate_qa(
@@ -914,6 +1394,9 @@ def main(args_list: list[str] | None = None) -> None:
                             saved_path = storage.write_text(target_path, qa_text)
                             rprint(f"Saved Q&A: {format_clickable_path(saved_path)}")
                             row[qa_file_col_name] = saved_path
+                            keep_text(
+                                row, texts, qa_col_name, qa_file_col_name, qa_text
+                            )
                         except Exception as e:
                             print(f"Error writing Q&A file: {e}")
 
@@ -930,9 +1413,7 @@ def main(args_list: list[str] | None = None) -> None:
                             row[qa_cost_col_name] = qa_cost
                             vprint(f"Q&A cost: ${qa_cost:.2f}")
 
-                # Check if we already have it in the row (from existing_row
-                # or just loaded)
-                if summary_col_name in row and row[summary_col_name]:
+                def backfill_summary_cost_stage() -> None:
                     # Check if cost is missing and backfill if possible
                     if (
                         summary_cost_col_name not in row
@@ -948,7 +1429,10 @@ def main(args_list: list[str] | None = None) -> None:
                             if input_price is not None and output_price is not None:
                                 # Estimate tokens: ~4 chars per token
                                 est_input_tokens = len(transcript) / 4
-                                est_output_tokens = len(row[summary_col_name]) / 4
+                                summary_text = artifact_text(
+                                    row, texts, summary_col_name, summary_file_col_name
+                                )
+                                est_output_tokens = len(summary_text or "") / 4
                                 summary_cost = (
                                     est_input_tokens / 1_000_000
                                 ) * input_price + (
@@ -990,49 +1474,50 @@ def main(args_list: list[str] | None = None) -> None:
                                     "Updated cost with speakers: "
                                     f"${row[summary_cost_col_name]:.2f}"
                                 )
-                    continue
 
-                # Check disk for summary file
-                if not row.get(summary_file_col_name):
-                    summary_filename = (
-                        f"{model_name} - {video_id} - {safe_title} - "
-                        f"summary (from {transcript_arg}){lang_str}.md"
-                    )
-                    expected_path = os.path.join(summaries_dir, summary_filename)
-                    if storage.exists(expected_path):
-                        row[summary_file_col_name] = expected_path
+                def summary_stage() -> None:
+                    nonlocal summary_text, summary_input, summary_output
+                    nonlocal summary_generated
 
-                # Load Summary from file/row
-                if row.get(summary_file_col_name):
-                    path = row[summary_file_col_name]
-                    if path:
-                        # We try to read.
-                        try:
-                            row[summary_col_name] = storage.read_text(str(path))
-                        except Exception as e:
-                            print(f"Warning: Failed to read summary file {path}: {e}")
+                    # Check disk for summary file
+                    if not row.get(summary_file_col_name):
+                        summary_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"summary (from {transcript_arg}){lang_str}.md"
+                        )
+                        expected_path = os.path.join(summaries_dir, summary_filename)
+                        if storage.exists(expected_path):
+                            row[summary_file_col_name] = expected_path
+
+                    # Load Summary from file/row
+                    if row.get(summary_file_col_name):
+                        path = row[summary_file_col_name]
+                        if path:
+                            # We try to read.
+                            try:
+                                summary_text = storage.read_text(str(path))
+                                keep_text(
+                                    row,
+                                    texts,
+                                    summary_col_name,
+                                    summary_file_col_name,
+                                    summary_text,
+                                )
+                            except Exception as e:
+                                print(
+                                    f"Warning: Failed to read summary file {path}: {e}"
+                                )
+
+                    summary_text = summary_text or row.get(summary_col_name) or ""
+                    if summary_text:
+                        return
 
-                if not row.get(summary_col_name):
                     rprint(f"Summarizing using model: {model_name} ({language})")
 
-                    summary_text, input_tokens, output_tokens = generate_summary(
+                    summary_text, summary_input, summary_output = generate_summary(
                         model_name, transcript, video_title, url, language=language
                     )
-
-                    summary_cost = float("nan")
-                    if verbose:
-                        input_price, output_price = get_model_pricing(model_name)
-                        if input_price is not None and output_price is not None:
-                            # Add speaker tokens
-                            total_input = input_tokens + speakers_input
-                            total_output = output_tokens + speakers_output
-
-                            summary_cost = (total_input / 1_000_000) * input_price + (
-                                total_output / 1_000_000
-                            ) * output_price
-                            summary_cost = round(summary_cost, 2)
-                            vprint(f"Summary cost: ${summary_cost:.2f}")
-                            row[summary_cost_col_name] = summary_cost
+                    summary_generated = True
 
                     summary_full_path = ""
                     if summaries_dir and summary_text:
@@ -1053,19 +1538,43 @@ def main(args_list: list[str] | None = None) -> None:
                             print(f"Error writing summary: {e}")
 
                     row[summary_file_col_name] = summary_full_path
-                    row[summary_col_name] = summary_text
+                    keep_text(
+                        row,
+                        texts,
+                        summary_col_name,
+                        summary_file_col_name,
+                        summary_text,
+                    )
 
-                # One Sentence Summary Generation
-                one_sentence_col_name = (
-                    f"One Sentence Summary {model_name} from "
-                    f"{transcript_arg}{col_suffix}"
-                )
-                one_sentence_cost_col_name = (
-                    f"{normalize_model_name(model_name)} one sentence summary cost "
-                    f"from {transcript_arg}{col_suffix} ($)"
-                )
+                def summary_cost_stage() -> None:
+                    if not summary_generated or not verbose:
+                        return
+                    input_price, output_price = get_model_pricing(model_name)
+                    if input_price is not None and output_price is not None:
+                        # Add speaker tokens
+                        total_input = summary_input + speakers_input
+                        total_output = summary_output + speakers_output
+
+                        summary_cost = (total_input / 1_000_000) * input_price + (
+                            total_output / 1_000_000
+                        ) * output_price
+                        summary_cost = round(summary_cost, 2)
+                        vprint(f"Summary cost: ${summary_cost:.2f}")
+                        row[summary_cost_col_name] = summary_cost
+
+                def one_sentence_stage() -> None:
+                    one_sentence_col_name = (
+                        f"One Sentence Summary {model_name} from "
+                        f"{transcript_arg}{col_suffix}"
+                    )
+                    one_sentence_cost_col_name = (
+                        f"{normalize_model_name(model_name)} one sentence summary cost "
+                        f"from {transcript_arg}{col_suffix} ($)"
+                    )
+
+                    if not summary_text or row.get(one_sentence_col_name):
+                        return
 
-                if row.get(summary_col_name) and not row.get(one_sentence_col_name):
                     vprint(
                         f"Generating one sentence summary using model: {model_name} "
                         f"({language})"
@@ -1075,7 +1584,7 @@ def main(args_list: list[str] | None = None) -> None:
                         os_input,
                         os_output,
                     ) = generate_one_sentence_summary(
-                        model_name, row[summary_col_name], language=language
+                        model_name, summary_text, language=language
                     )
                     row[one_sentence_col_name] = one_sentence_text
 
@@ -1115,15 +1624,19 @@ def main(args_list: list[str] | None = None) -> None:
                             row[one_sentence_cost_col_name] = cost
                             vprint(f"One sentence summary cost: ${cost:.2f}")
 
-                # Tag Generation
-                tags_col_name = f"Tags {transcript_arg} {model_name} model{col_suffix}"
-                tags_cost_col_name = (
-                    f"{normalize_model_name(model_name)} "
-                    f"tags cost from {transcript_arg}{col_suffix} ($)"
-                )
+                def tags_stage() -> None:
+                    tags_col_name = (
+                        f"Tags {transcript_arg} {model_name} model{col_suffix}"
+                    )
+                    tags_cost_col_name = (
+                        f"{normalize_model_name(model_name)} "
+                        f"tags cost from {transcript_arg}{col_suffix} ($)"
+                    )
+
+                    if row.get(tags_col_name) or not summary_text:
+                        return
 
-                if not row.get(tags_col_name) and row.get(summary_col_name):
-                    summary_for_tags = row[summary_col_name]
+                    summary_for_tags = summary_text
                     rprint(f"Generating tags using model: {model_name} ({language})")
 
                     tags_text, tags_input, tags_output = generate_tags(
@@ -1178,15 +1691,11 @@ def main(args_list: list[str] | None = None) -> None:
                                 print(f"Error writing tags: {e}")
 
                 # --- Secondary Speaker Extraction from YouTube (if applicable) ---
-                yt_speakers_text = 'float("nan")'
-                yt_speakers_input = 0
-                yt_speakers_output = 0
+                def yt_speakers_stage() -> None:
+                    nonlocal yt_speakers_text
+                    yt_speakers_input = 0
+                    yt_speakers_output = 0
 
-                if (
-                    transcript_arg != "youtube"
-                    and youtube_transcript
-                    and not no_youtube_summary
-                ):
                     yt_speakers_col_name = f"Speakers {model_name} from youtube"
                     yt_speakers_file_col_name = (
                         f"Speakers File {model_name} from youtube"
@@ -1212,7 +1721,13 @@ def main(args_list: list[str] | None = None) -> None:
                         if path and storage.exists(str(path)):
                             try:
                                 yt_speakers_text = storage.read_text(str(path))
-                                row[yt_speakers_col_name] = yt_speakers_text
+                                keep_text(
+                                    row,
+                                    texts,
+                                    yt_speakers_col_name,
+                                    yt_speakers_file_col_name,
+                                    yt_speakers_text,
+                                )
                             except Exception as e:
                                 vprint(
                                     "Warning: Failed to read YouTube speakers file "
@@ -1222,87 +1737,88 @@ def main(args_list: list[str] | None = None) -> None:
                     elif row.get(yt_speakers_col_name):
                         yt_speakers_text = row[yt_speakers_col_name]
 
-                    # Generate if missing (checking specifically if it is 'float("nan")'
-                    # default or actual text)
-                    if yt_speakers_text == 'float("nan")' and (
-                        not row.get(yt_speakers_col_name)
+                    # Generate if missing (checking specifically if it is
+                    # 'float("nan")' default or actual text)
+                    if yt_speakers_text != 'float("nan")' or row.get(
+                        yt_speakers_col_name
                     ):
-                        # Try to use English transcript for YT speaker extraction
-                        # if available
-                        yt_speaker_source_transcript = youtube_transcript
-                        if language != "en":
-                            en_path = row.get(
-                                "Transcript File human generated"
-                            ) or row.get("Transcript File youtube generated")
-                            if en_path and os.path.exists(str(en_path)):
-                                with open(str(en_path), "r", encoding="utf-8") as f:
-                                    yt_speaker_source_transcript = f.read()
-                                    vprint(
-                                        "Using English transcript for YouTube speaker "
-                                        f"extraction ({model_name})."
-                                    )
-                        rprint(
-                            f"Extracting speakers using model: {model_name} "
-                            "(Source: YouTube Transcript)"
+                        return
+
+                    # Try to use English transcript for YT speaker extraction
+                    # if available
+                    yt_speaker_source_transcript = youtube_transcript
+                    if language != "en":
+                        en_path = row.get("Transcript File human generated") or row.get(
+                            "Transcript File youtube generated"
                         )
-                        (
-                            yt_speakers_text,
-                            yt_speakers_input,
-                            yt_speakers_output,
-                        ) = extract_speakers(model_name, yt_speaker_source_transcript)
-
-                        row[yt_speakers_col_name] = yt_speakers_text
-                        if (
-                            yt_speakers_text.strip() == "nan"
-                            or yt_speakers_text.strip() == 'float("nan")'
-                        ):
-                            row[yt_speakers_col_name] = float("nan")
-
-                        # Save YouTube Speakers File
-                        if yt_speakers_text and not isinstance(
-                            row[yt_speakers_col_name], float
-                        ):
-                            yt_speakers_filename = (
-                                f"{model_name} - {video_id} - {safe_title} - "
-                                f"speakers (from youtube).txt"
+                        if en_path and os.path.exists(str(en_path)):
+                            with open(str(en_path), "r", encoding="utf-8") as f:
+                                yt_speaker_source_transcript = f.read()
+                                vprint(
+                                    "Using English transcript for YouTube speaker "
+                                    f"extraction ({model_name})."
+                                )
+                    rprint(
+                        f"Extracting speakers using model: {model_name} "
+                        "(Source: YouTube Transcript)"
+                    )
+                    (
+                        yt_speakers_text,
+                        yt_speakers_input,
+                        yt_speakers_output,
+                    ) = extract_speakers(model_name, yt_speaker_source_transcript)
+
+                    row[yt_speakers_col_name] = yt_speakers_text
+                    if (
+                        yt_speakers_text.strip() == "nan"
+                        or yt_speakers_text.strip() == 'float("nan")'
+                    ):
+                        row[yt_speakers_col_name] = float("nan")
+
+                    # Save YouTube Speakers File
+                    if yt_speakers_text and not isinstance(
+                        row[yt_speakers_col_name], float
+                    ):
+                        yt_speakers_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"speakers (from youtube).txt"
+                        )
+                        target_path = os.path.join(speakers_dir, yt_speakers_filename)
+
+                        try:
+                            saved_path = storage.write_text(
+                                target_path, yt_speakers_text
                             )
-                            target_path = os.path.join(
-                                speakers_dir, yt_speakers_filename
+                            rprint(f"Saved YouTube speakers: {yt_speakers_filename}")
+                            row[yt_speakers_file_col_name] = saved_path
+                            keep_text(
+                                row,
+                                texts,
+                                yt_speakers_col_name,
+                                yt_speakers_file_col_name,
+                                yt_speakers_text,
                             )
+                        except Exception as e:
+                            print(f"Error writing YouTube speakers file: {e}")
 
-                            try:
-                                saved_path = storage.write_text(
-                                    target_path, yt_speakers_text
-                                )
-                                rprint(
-                                    f"Saved YouTube speakers: {yt_speakers_filename}"
-                                )
-                                row[yt_speakers_file_col_name] = saved_path
-                            except Exception as e:
-                                print(f"Error writing YouTube speakers file: {e}")
-
-                        # Calculate YouTube Speaker Cost
-                        if verbose:
-                            input_price, output_price = get_model_pricing(model_name)
-                            if input_price is not None and output_price is not None:
-                                yt_speaker_cost = (
-                                    yt_speakers_input / 1_000_000
-                                ) * input_price + (
-                                    yt_speakers_output / 1_000_000
-                                ) * output_price
-                                yt_speaker_cost = round(yt_speaker_cost, 2)
-                                row[yt_speaker_cost_col_name] = yt_speaker_cost
-                                vprint(
-                                    "YouTube Speaker extraction cost: "
-                                    f"${yt_speaker_cost:.2f}"
-                                )
+                    # Calculate YouTube Speaker Cost
+                    if verbose:
+                        input_price, output_price = get_model_pricing(model_name)
+                        if input_price is not None and output_price is not None:
+                            yt_speaker_cost = (
+                                yt_speakers_input / 1_000_000
+                            ) * input_price + (
+                                yt_speakers_output / 1_000_000
+                            ) * output_price
+                            yt_speaker_cost = round(yt_speaker_cost, 2)
+                            row[yt_speaker_cost_col_name] = yt_speaker_cost
+                            vprint(
+                                "YouTube Speaker extraction cost: "
+                                f"${yt_speaker_cost:.2f}"
+                            )
 
                 # --- Secondary Q&A from YouTube (if applicable) ---
-                if (
-                    transcript_arg != "youtube"
-                    and youtube_transcript
-                    and not no_youtube_summary
-                ):
+                def yt_qa_stage() -> None:
                     yt_qa_col_name = f"QA Text {model_name} from youtube{col_suffix}"
                     yt_qa_file_col_name = (
                         f"QA File {model_name} from youtube{col_suffix}"
@@ -1325,6 +1841,9 @@ def main(args_list: list[str] | None = None) -> None:
                     # Load YT QA from file/row
                     if row.get(yt_qa_file_col_name):
                         path = row[yt_qa_file_col_name]
+                        if path and slim_manifest and storage.exists(str(path)):
+                            # The manifest only references the Q&A file
+                            return
                         if path:
                             try:
                                 row[yt_qa_col_name] = storage.read_text(str(path))
@@ -1333,70 +1852,75 @@ def main(args_list: list[str] | None = None) -> None:
                                     "Warning: Failed to read YouTube Q&A file "
                                     f"{path}: {e}"
                                 )
-                    if not row.get(yt_qa_col_name):
-                        rprint(
-                            f"Generating Q&A using model: {model_name} "
-                            "(Source: YouTube Transcript)"
-                        )
-                        yt_qa_text, yt_qa_in, yt_qa_out = generate_qa(
-                            model_name,
-                            youtube_transcript,
-                            yt_speakers_text,
-                            url,
-                            language=language,
-                        )
+                    if row.get(yt_qa_col_name):
+                        return
 
-                        row[yt_qa_col_name] = yt_qa_text
-                        if (
-                            yt_qa_text.strip() == "nan"
-                            or yt_qa_text.strip() == 'float("nan")'
-                        ):
-                            row[yt_qa_col_name] = float("nan")
+                    rprint(
+                        f"Generating Q&A using model: {model_name} "
+                        "(Source: YouTube Transcript)"
+                    )
+                    yt_qa_text, yt_qa_in, yt_qa_out = generate_qa(
+                        model_name,
+                        youtube_transcript,
+                        yt_speakers_text,
+                        url,
+                        language=language,
+                    )
 
-                        yt_qa_cost = float("nan")
-                        if verbose:
-                            input_price, output_price = get_model_pricing(model_name)
-                            if input_price is not None and output_price is not None:
-                                # Pure QA cost
-                                cost = (yt_qa_in / 1_000_000) * input_price + (
-                                    yt_qa_out / 1_000_000
-                                ) * output_price
-                                yt_qa_cost = round(cost, 2)
-                                vprint(f"YouTube Q&A cost: ${yt_qa_cost:.2f}")
-                                row[yt_qa_cost_col_name] = yt_qa_cost
-
-                        yt_qa_full_path = ""
-                        if row[yt_qa_col_name] and not isinstance(
-                            row[yt_qa_col_name], float
-                        ):
-                            qa_filename = (
-                                f"{model_name} - {video_id} - {safe_title} - "
-                                f"qa (from youtube){lang_str}.md"
-                            )
-                            target_path = os.path.join(qa_dir, qa_filename)
+                    row[yt_qa_col_name] = yt_qa_text
+                    if (
+                        yt_qa_text.strip() == "nan"
+                        or yt_qa_text.strip() == 'float("nan")'
+                    ):
+                        row[yt_qa_col_name] = float("nan")
 
-                            try:
-                                yt_qa_full_path = storage.write_text(
-                                    target_path, row[yt_qa_col_name]
-                                )
-                                rprint(
-                                    f"Saved YouTube Q&A: "
-                                    f"{format_clickable_path(yt_qa_full_path)}"
-                                )
-                            except Exception as e:
-                                print(f"Error writing YouTube Q&A: {e}")
+                    yt_qa_cost = float("nan")
+                    if verbose:
+                        input_price, output_price = get_model_pricing(model_name)
+                        if input_price is not None and output_price is not None:
+                            # Pure QA cost
+                            cost = (yt_qa_in / 1_000_000) * input_price + (
+                                yt_qa_out / 1_000_000
+                            ) * output_price
+                            yt_qa_cost = round(cost, 2)
+                            vprint(f"YouTube Q&A cost: ${yt_qa_cost:.2f}")
+                            row[yt_qa_cost_col_name] = yt_qa_cost
+
+                    yt_qa_full_path = ""
+                    if row[yt_qa_col_name] and not isinstance(
+                        row[yt_qa_col_name], float
+                    ):
+                        qa_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"qa (from youtube){lang_str}.md"
+                        )
+                        target_path = os.path.join(qa_dir, qa_filename)
 
-                        row[yt_qa_file_col_name] = yt_qa_full_path
+                        try:
+                            yt_qa_full_path = storage.write_text(
+                                target_path, row[yt_qa_col_name]
+                            )
+                            rprint(
+                                f"Saved YouTube Q&A: "
+                                f"{format_clickable_path(yt_qa_full_path)}"
+                            )
+                        except Exception as e:
+                            print(f"Error writing YouTube Q&A: {e}")
+
+                    row[yt_qa_file_col_name] = yt_qa_full_path
+                    keep_text(
+                        row,
+                        texts,
+                        yt_qa_col_name,
+                        yt_qa_file_col_name,
+                        row[yt_qa_col_name],
+                    )
 
                 # --- Secondary Summary from YouTube (if applicable) ---
-                if (
-                    transcript_arg != "youtube"
-                    and youtube_transcript
-                    and not no_youtube_summary
-                ):
-                    yt_sum_col_name = (
-                        f"Summary Text {model_name} from youtube{col_suffix}"
-                    )
+                yt_sum_col_name = f"Summary Text {model_name} from youtube{col_suffix}"
+
+                def yt_summary_stage() -> None:
+                    nonlocal yt_summary_text
                     yt_sum_file_col_name = (
                         f"Summary File {model_name} from youtube{col_suffix}"
                     )
@@ -1420,73 +1944,84 @@ def main(args_list: list[str] | None = None) -> None:
                         path = row[yt_sum_file_col_name]
                         if path:
                             try:
-                                row[yt_sum_col_name] = storage.read_text(str(path))
+                                yt_summary_text = storage.read_text(str(path))
+                                keep_text(
+                                    row,
+                                    texts,
+                                    yt_sum_col_name,
+                                    yt_sum_file_col_name,
+                                    yt_summary_text,
+                                )
                             except Exception as e:
                                 vprint(
                                     "Warning: Failed to read YouTube summary file "
                                     f"{path}: {e}"
                                 )
 
-                    if not row.get(yt_sum_col_name):
-                        rprint(
-                            f"Generating summary using model: {model_name} "
-                            "(Source: YouTube Transcript)"
-                        )
-                        (
-                            yt_summary_text,
-                            yt_input_tokens,
-                            yt_output_tokens,
-                        ) = generate_summary(
-                            model_name,
-                            youtube_transcript,
-                            video_title,
-                            url,
-                            language=language,
-                        )
+                    yt_summary_text = yt_summary_text or row.get(yt_sum_col_name) or ""
+                    if yt_summary_text:
+                        return
 
-                        yt_summary_cost = float("nan")
-                        if verbose:
-                            input_price, output_price = get_model_pricing(model_name)
-                            if input_price is not None and output_price is not None:
-                                # We don't include speaker tokens here
-                                # as we didn't extract
-                                # speakers from the YouTube transcript
-                                # specifically for this
-                                # summary.
-                                # If we wanted to be precise,
-                                # we'd need to extract speakers
-                                # from YT transcript too.
-                                # For now, just the summary cost.
-                                cost = (yt_input_tokens / 1_000_000) * input_price + (
-                                    yt_output_tokens / 1_000_000
-                                ) * output_price
-                                yt_summary_cost = round(cost, 2)
-                                vprint(f"YouTube Summary cost: ${yt_summary_cost:.2f}")
-                                row[yt_sum_cost_col_name] = yt_summary_cost
+                    rprint(
+                        f"Generating summary using model: {model_name} "
+                        "(Source: YouTube Transcript)"
+                    )
+                    (
+                        yt_summary_text,
+                        yt_input_tokens,
+                        yt_output_tokens,
+                    ) = generate_summary(
+                        model_name,
+                        youtube_transcript,
+                        video_title,
+                        url,
+                        language=language,
+                    )
 
-                        yt_summary_full_path = ""
-                        if summaries_dir and yt_summary_text:
-                            summary_filename = (
-                                f"{model_name} - {video_id} - {safe_title} - "
-                                f"summary (from youtube){lang_str}.md"
-                            )
-                            target_path = os.path.join(summaries_dir, summary_filename)
+                    yt_summary_cost = float("nan")
+                    if verbose:
+                        input_price, output_price = get_model_pricing(model_name)
+                        if input_price is not None and output_price is not None:
+                            # We don't include speaker tokens here as we didn't
+                            # extract speakers from the YouTube transcript
+                            # specifically for this summary.
+                            cost = (yt_input_tokens / 1_000_000) * input_price + (
+                                yt_output_tokens / 1_000_000
+                            ) * output_price
+                            yt_summary_cost = round(cost, 2)
+                            vprint(f"YouTube Summary cost: ${yt_summary_cost:.2f}")
+                            row[yt_sum_cost_col_name] = yt_summary_cost
 
-                            try:
-                                yt_sum_full_path = storage.write_text(
-                                    target_path, row[yt_sum_col_name]
-                                )
-                                rprint(
-                                    f"Saved YouTube summary: "
-                                    f"{format_clickable_path(yt_sum_full_path)}"
-                                )
-                            except Exception as e:
-                                print(f"Error writing YouTube summary: {e}")
+                    yt_summary_full_path = ""
+                    if summaries_dir and yt_summary_text:
+                        summary_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"summary (from youtube){lang_str}.md"
+                        )
+                        target_path = os.path.join(summaries_dir, summary_filename)
 
-                        row[yt_sum_file_col_name] = yt_summary_full_path
-                        row[yt_sum_col_name] = yt_summary_text
+                        try:
+                            yt_summary_full_path = storage.write_text(
+                                target_path, yt_summary_text
+                            )
+                            rprint(
+                                f"Saved YouTube summary: "
+                                f"{format_clickable_path(yt_summary_full_path)}"
+                            )
+                        except Exception as e:
+                            print(f"Error writing YouTube summary: {e}")
+
+                    row[yt_sum_file_col_name] = yt_summary_full_path
+                    keep_text(
+                        row,
+                        texts,
+                        yt_sum_col_name,
+                        yt_sum_file_col_name,
+                        yt_summary_text,
+                    )
 
-                    # One Sentence Summary for YouTube Summary
+                # One Sentence Summary for YouTube Summary
+                def yt_one_sentence_stage() -> None:
                     yt_one_sentence_col_name = (
                         f"One Sentence Summary {model_name} from youtube{col_suffix}"
                     )
@@ -1495,89 +2030,148 @@ def main(args_list: list[str] | None = None) -> None:
                         f"cost from youtube{col_suffix} ($)"
                     )
 
-                    if row.get(yt_sum_col_name) and not row.get(
-                        yt_one_sentence_col_name
-                    ):
-                        rprint(
-                            "Generating one sentence summary using model: "
-                            f"{model_name} (Source: YouTube Transcript)"
-                        )
-                        (
-                            yt_one_sentence_text,
-                            yt_os_input,
-                            yt_os_output,
-                        ) = generate_one_sentence_summary(
-                            model_name, row[yt_sum_col_name], language=language
-                        )
-                        row[yt_one_sentence_col_name] = yt_one_sentence_text
+                    if not yt_summary_text or row.get(yt_one_sentence_col_name):
+                        return
 
-                        # Cost
-                        if verbose:
-                            input_price, output_price = get_model_pricing(model_name)
-                            if input_price is not None and output_price is not None:
-                                cost = (yt_os_input / 1_000_000) * input_price + (
-                                    yt_os_output / 1_000_000
-                                ) * output_price
-                                cost = round(cost, 2)
-                                row[yt_one_sentence_cost_col_name] = cost
-                                vprint(
-                                    f"YouTube one sentence summary cost: ${cost:.2f}"
-                                )
+                    rprint(
+                        "Generating one sentence summary using model: "
+                        f"{model_name} (Source: YouTube Transcript)"
+                    )
+                    (
+                        yt_one_sentence_text,
+                        yt_os_input,
+                        yt_os_output,
+                    ) = generate_one_sentence_summary(
+                        model_name, yt_summary_text, language=language
+                    )
+                    row[yt_one_sentence_col_name] = yt_one_sentence_text
 
-                        # Save YT One Sentence Summary File
-                        if yt_one_sentence_text and one_sentence_summaries_dir:
-                            os_filename = (
-                                f"{model_name} - {video_id} - {safe_title} - "
-                                f"one-sentence-summary (from youtube){lang_str}.md"
+                    # Cost
+                    if verbose:
+                        input_price, output_price = get_model_pricing(model_name)
+                        if input_price is not None and output_price is not None:
+                            cost = (yt_os_input / 1_000_000) * input_price + (
+                                yt_os_output / 1_000_000
+                            ) * output_price
+                            cost = round(cost, 2)
+                            row[yt_one_sentence_cost_col_name] = cost
+                            vprint(f"YouTube one sentence summary cost: ${cost:.2f}")
+
+                    # Save YT One Sentence Summary File
+                    if yt_one_sentence_text and one_sentence_summaries_dir:
+                        os_filename = (
+                            f"{model_name} - {video_id} - {safe_title} - "
+                            f"one-sentence-summary (from youtube){lang_str}.md"
+                        )
+                        target_path = os.path.join(
+                            one_sentence_summaries_dir, os_filename
+                        )
+                        try:
+                            os_full_path = storage.write_text(
+                                target_path, yt_one_sentence_text
                             )
-                            target_path = os.path.join(
-                                one_sentence_summaries_dir, os_filename
+                            rprint(
+                                "Saved YouTube one sentence summary: "
+                                f"{format_clickable_path(os_full_path)}"
                             )
-                            try:
-                                os_full_path = storage.write_text(
-                                    target_path, yt_one_sentence_text
-                                )
-                                rprint(
-                                    "Saved YouTube one sentence summary: "
-                                    f"{format_clickable_path(os_full_path)}"
-                                )
-                                os_col = (
-                                    f"One Sentence Summary File {model_name} from "
-                                    f"youtube{col_suffix}"
-                                )
-                                row[os_col] = os_full_path
-                            except Exception as e:
-                                print(
-                                    f"Error writing YouTube one sentence summary: {e}"
-                                )
+                            os_col = (
+                                f"One Sentence Summary File {model_name} from "
+                                f"youtube{col_suffix}"
+                            )
+                            row[os_col] = os_full_path
+                        except Exception as e:
+                            print(f"Error writing YouTube one sentence summary: {e}")
+
+                # Stage graph: summary and speakers are independent, Q&A needs
+                # the speakers, and the one sentence summary and tags only need
+                # the summary.
+                graph = StageGraph()
+                graph.add("speakers", speakers_stage)
+                graph.add("qa", qa_stage, inputs=["speakers"])
+
+                if row.get(summary_col_name) or (
+                    slim_manifest and row.get(summary_file_col_name)
+                ):
+                    # Summary already present: only backfill its cost
+                    graph.add(
+                        "summary_cost",
+                        backfill_summary_cost_stage,
+                        inputs=["speakers"],
+                    )
+                    graph.run()
+                    return
+
+                graph.add("summary", summary_stage)
+                graph.add(
+                    "summary_cost", summary_cost_stage, inputs=["speakers", "summary"]
+                )
+                graph.add("one_sentence", one_sentence_stage, inputs=["summary"])
+                graph.add("tags", tags_stage, inputs=["summary"])
+
+                if (
+                    transcript_arg != "youtube"
+                    and youtube_transcript
+                    and not no_youtube_summary
+                ):
+                    graph.add("yt_speakers", yt_speakers_stage)
+                    graph.add("yt_qa", yt_qa_stage, inputs=["yt_speakers"])
+                    graph.add("yt_summary", yt_summary_stage)
+                    graph.add(
+                        "yt_one_sentence", yt_one_sentence_stage, inputs=["yt_summary"]
+                    )
+
+                graph.run()
+
+            def run_model(model_name: str, row: dict) -> None:
+                with branch_slots:
+                    process_model(model_name, row)
+
+            # Each model is a different provider with its own quota, so the
+            # models run concurrently on copies of the row
+            if len(model_names) > 1:
+                base_row = dict(row)
+                model_rows = [type(row)(row) for _ in model_names]
+                with ThreadPoolExecutor(
+                    max_workers=len(model_names), thread_name_prefix="model"
+                ) as executor:
+                    list(executor.map(run_model, model_names, model_rows))
+                merge_branch_rows(row, base_row, model_rows)
+            elif model_names:
+                run_model(model_names[0], row)
 
             # Infographic Generation
             if infographic_arg:
-                summary_targets = []
+                summary_targets = {}
 
                 # Target ALL summaries in the row (both existing and newly created)
                 # This includes normal summaries and "from youtube" summaries
                 for k in list(row.keys()):
                     if k.startswith("Summary Text ") and row[k]:
-                        # Check language
-                        if language != "en" and not k.endswith(f" ({language})"):
-                            continue
-                        if language == "en" and k.endswith(")"):
-                            # Skip other languages
-                            continue
-
                         m_name = k[len("Summary Text ") :]
-                        # m_name might be "gemini-2.0-flash" or
-                        # "gemini-2.0-flash from youtube"
-                        # or "gemini-2.0-flash (es)" or
-                        # "gemini-2.0-flash from youtube (es)"
-
-                        summary_targets.append((k, m_name, row[k]))
+                    elif slim_manifest and k.startswith("Summary File ") and row[k]:
+                        # A slim manifest only references the summary file
+                        m_name = k[len("Summary File ") :]
+                    else:
+                        continue
+                    sum_col = f"Summary Text {m_name}"
+                    # Skip the hash and size columns of a slim manifest
+                    if not text_file_column(sum_col):
+                        continue
 
-                for sum_col, m_name, s_text in summary_targets:
-                    if not s_text:
+                    # Check language
+                    if language != "en" and not k.endswith(f" ({language})"):
                         continue
+                    if language == "en" and k.endswith(")"):
+                        # Skip other languages
+                        continue
+
+                    # m_name might be "gemini-2.0-flash" or
+                    # "gemini-2.0-flash from youtube"
+                    # or "gemini-2.0-flash (es)" or
+                    # "gemini-2.0-flash from youtube (es)"
+                    summary_targets[sum_col] = m_name
 
+                for sum_col, m_name in summary_targets.items():
                     info_col = f"Summary Infographic File {m_name} {infographic_arg}"
 
                     alt_text_col = (
@@ -1592,10 +2186,6 @@ def main(args_list: list[str] | None = None) -> None:
                         continue
 
                     # 2. Check disk for infographic
-                    safe_title = re.sub(r"[\\/*?:\"<>|]", "_", video_title).replace(
-                        "\n", " "
-                    )
-                    safe_title = safe_title.replace("\r", "")
 
                     infographic_filename = (
                         f"{m_name} - {infographic_arg} - {video_id} - "
@@ -1625,6 +2215,11 @@ def main(args_list: list[str] | None = None) -> None:
                             f"Generating infographic using model {infographic_arg} "
                             f"from {summary_filename}"
                         )
+                        s_text = artifact_text(
+                            row, texts, sum_col, f"Summary File {m_name}"
+                        )
+                        if not s_text:
+                            continue
                         image_bytes, input_tokens, output_tokens = generate_infographic(
                             infographic_arg, s_text, video_title, language=language
                         )
@@ -1666,9 +2261,10 @@ def main(args_list: list[str] | None = None) -> None:
 
                     # 4. Alt Text Generation
                     if image_bytes and not row.get(alt_text_col):
-                        alt_text_model = (
-                            alt_text_model_arg or model_name
-                        )  # model_name is the current summary model
+                        # Default to the last summary model
+                        alt_text_model = alt_text_model_arg or (
+                            model_names[-1] if model_names else None
+                        )
                         rprint(
                             "Generating multimodal alt text using model: "
                             f"{alt_text_model}"
@@ -1679,7 +2275,7 @@ def main(args_list: list[str] | None = None) -> None:
                         row[alt_text_col] = alt_text
 
                         # Save Alt Text File
-                        if alt_text and not alt_text.startswith("Error"):
+                        if alt_text and not is_error_text(alt_text):
                             alt_text_filename = (
                                 f"{m_name} - {infographic_arg} - {video_id} - "
                                 f"{safe_title} - alt-text.md"
@@ -1712,6 +2308,35 @@ def main(args_list: list[str] | None = None) -> None:
                                 row[at_cost_col] = at_cost
                                 vprint(f"Alt text cost: ${at_cost:.2f}")
 
+        if len(languages) == 1:
+            process_language(languages[0], row)
+        else:
+            # Other languages fall back to the English transcript, so English
+            # runs first on the row itself and the rest run concurrently on
+            # copies that are merged back in language order
+            language_rows: dict[str, dict] = {}
+            language_graph = StageGraph()
+            for language in languages:
+                if language == "en":
+                    language_graph.add(language, partial(process_language, "en", row))
+                    continue
+
+                def run_language(language: str = language) -> None:
+                    language_rows[language] = type(row)(row)
+                    process_language(language, language_rows[language])
+
+                language_graph.add(
+                    language,
+                    run_language,
+                    inputs=["en"] if "en" in languages else (),
+                )
+            language_graph.run(max_workers=len(languages))
+            merge_branch_rows(
+                row,
+                dict(row),
+                [language_rows[lang] for lang in languages if lang in language_rows],
+            )
+
         if not verbose:
             oss = next(
                 (
@@ -1741,53 +2366,149 @@ def main(args_list: list[str] | None = None) -> None:
                 if value and not str(value).lower() == "nan":
                     rprint(f"[bold]{key}:[/bold] {value}")
 
-        rows.append(row)
+        return row
 
-        # Save progress after each video
+    def save_progress(final: bool = False) -> None:
+        """
+        Merges the rows processed so far into the manifest and saves it, as a
+        checkpoint unless final (e.g. when the run is interrupted).
+        """
         try:
-            # Create a DataFrame from the rows processed so far
-            current_rows_df = pl.DataFrame(rows)
-
-            # Combine with existing data
-            if existing_df is not None:
-                # Identify URLs processed in this session
-                processed_urls = current_rows_df["URL"].to_list()
-                # Keep rows from existing_df that haven't been re-processed
-                existing_remaining = existing_df.filter(
-                    ~pl.col("URL").is_in(processed_urls)
-                )
-                current_save_df = pl.concat(
-                    [existing_remaining, current_rows_df], how="diagonal"
-                )
-            else:
-                current_save_df = current_rows_df
-
-            if "Data Published" in current_save_df.columns:
-                current_save_df = current_save_df.sort(
-                    "Data Published", descending=True
-                )
-
-            current_save_df = reorder_columns(current_save_df)
-            storage.save_dataframe(current_save_df, outfile_path)
+            # Rows processed in this session replace their existing entries
+            write_manifest(merge_rows(existing_df, rows), final=final)
+            if journal is not None:
+                # Videos still in flight on other workers keep their entries
+                journal.compact(row["URL"] for row in rows)
             vprint(f"Progress saved to {outfile}")
         except Exception as e:
             print(f"Warning: Could not save progress: {e}")
 
-        time.sleep(1)
-        print()
+    def checkpoint(row: dict) -> None:
+        """Journals a finished row, compacting the manifest when it is due."""
+        if journal is None:
+            return
+        try:
+            journal.append(row)
+        except Exception as e:
+            print(f"Warning: Could not write journal: {e}")
+            save_progress()
+            return
+        if journal.due(save_every, save_interval):
+            save_progress()
+
+    def flush_on_signal(signum, frame) -> None:
+        # Unwind like Ctrl+C so the pending rows are saved on the way out
+        raise SystemExit(128 + signum)
+
+    def audio_missing(video_id: str) -> bool:
+        """Returns True if the audio for video_id is not in storage yet."""
+        url = f"https://www.youtube.com/watch?v={video_id}"
+        audio_file = manifest_index.value(url, "Audio File")
+        if audio_file and storage.exists(str(audio_file)):
+            return False
+        return not storage.exists(os.path.join(audio_dir, f"{video_id}.m4a"))
+
+    # Download audio for upcoming videos while the current one is transcribed
+    audio_prefetcher = None
+    if transcript_arg != "youtube" and prefetch_audio > 0:
+        audio_prefetcher = AudioPrefetcher(
+            [],
+            local_audio_dir,
+            lookahead=prefetch_audio,
+            max_bytes=prefetch_budget_mb * 1024 * 1024,
+            extract=extract_audio,
+            needs_audio=audio_missing,
+        )
+        audio_prefetcher.start()
+
+    def run_video(i: int, video_id: str) -> dict | None:
+        """Processes a video and frees its prefetched audio afterwards."""
+        try:
+            return process_video_id(i, video_id)
+        finally:
+            if audio_prefetcher:
+                audio_prefetcher.release(video_id)
+
+    def iter_all_pages():
+        yield first_page
+        yield from video_id_pages
+
+    executor = None
+    completed: dict[int, dict] = {}
+    if workers > 1:
+        rprint(f"Processing with {workers} workers.")
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="video-worker"
+        )
+
+    previous_sigterm = None
+    if threading.current_thread() is threading.main_thread():
+        previous_sigterm = signal.signal(signal.SIGTERM, flush_on_signal)
+
+    try:
+        # The next page is resolved in the background while this one is processed
+        for page in iter_all_pages():
+            if not page:
+                continue
+            start = len(video_ids) + 1
+            video_ids.extend(page)
+            rprint(f"Processing Videos: {page}")
+            fetch_page_details(page)
+            if audio_prefetcher:
+                audio_prefetcher.add(page)
+
+            if executor is None:
+                for i, video_id in enumerate(page, start):
+                    row = run_video(i, video_id)
+                    if row is None:
+                        continue
+
+                    rows.append(row)
+                    # Checkpoint progress after each video
+                    checkpoint(row)
+                    print()
+                continue
+
+            futures = {
+                executor.submit(run_video, i, video_id): (i, video_id)
+                for i, video_id in enumerate(page, start)
+            }
+            # The coordinator (this thread) is the only writer of the manifest
+            for future in as_completed(futures):
+                i, video_id = futures[future]
+                try:
+                    row = future.result()
+                except Exception as e:
+                    print(f"Error processing video {video_id}: {e}")
+                    continue
+                if row is None:
+                    continue
+
+                completed[i] = row
+                rows[:] = [completed[k] for k in sorted(completed)]
+                checkpoint(row)
+                print()
+    except BaseException:
+        # Interrupted (Ctrl+C, SIGTERM or an error): save the finished rows
+        if rows and journal is not None and journal.pending:
+            rprint("Interrupted, saving finished videos...")
+            save_progress(final=True)
+        raise
+    finally:
+        if previous_sigterm is not None:
+            signal.signal(signal.SIGTERM, previous_sigterm)
+        resolving.clear()
+        if executor is not None:
+            executor.shutdown()
+        if audio_prefetcher:
+            audio_prefetcher.close()
+
+    rprint(f"Processed {len(video_ids)} videos.")
 
     final_df = None
 
     if rows:
-        new_df = pl.DataFrame(rows)
-        if existing_df is not None:
-            processed_urls = new_df["URL"].to_list()
-            existing_remaining = existing_df.filter(
-                ~pl.col("URL").is_in(processed_urls)
-            )
-            final_df = pl.concat([existing_remaining, new_df], how="diagonal")
-        else:
-            final_df = new_df
+        final_df = merge_rows(existing_df, rows)
     elif existing_df is not None:
         final_df = existing_df
 
@@ -1797,11 +2518,14 @@ def main(args_list: list[str] | None = None) -> None:
         if "Data Published" in final_df.columns:
             final_df = final_df.sort("Data Published", descending=True)
 
-        # Intermediate save
-        if should_save:
-            temp_df = reorder_columns(final_df)
+        # Intermediate save before the slow TTS/video steps. With a journal
+        # the rows are already safe on disk, so only the final save is needed.
+        if should_save and journal is None and (tts_arg or combine_info_audio):
+            temp_df = manifest_frame(final_df)
             # We use the same path, updating the sheet
-            intermediate_path = storage.save_dataframe(temp_df, outfile_path)
+            intermediate_path = storage.save_dataframe(
+                temp_df, outfile_path, final=False
+            )
             vprint(f"Intermediate save (pre-TTS/Video): {intermediate_path}")
 
         if tts_arg:
@@ -1819,7 +2543,7 @@ def main(args_list: list[str] | None = None) -> None:
             should_save = True
 
         if should_save:
-            final_df = reorder_columns(final_df)
+            final_df = manifest_frame(final_df)
             saved_path = storage.save_dataframe(final_df, outfile_path)
             rprint(
                 f"Successfully wrote {len(rows)} new rows to storage. "
@@ -1830,6 +2554,24 @@ def main(args_list: list[str] | None = None) -> None:
     else:
         vprint("No new data to gather or all videos already processed.")
 
+    # Everything journaled is now part of the manifest
+    if journal is not None:
+        journal.clear()
+
+    llm_cache = get_llm_cache()
+    if llm_cache is not None and llm_cache.hits:
+        rprint(
+            f"LLM cache: {llm_cache.hits} responses reused, "
+            f"{llm_cache.misses} requested"
+        )
+
+    # Report where the adaptive concurrency settled for each provider
+    for provider, (current, peak, throttled) in concurrency_report().items():
+        rprint(
+            f"{provider} concurrency: {current} (peak {peak}, "
+            f"throttled {throttled} times)"
+        )
+
     # Cleanup local temp dir
     if os.path.exists(local_temp_dir):
         import shutil
@@ -0,0 +1,192 @@
+"""
+Map-reduce helpers for transcripts that are too long for one prompt.
+
+When map-reduce is enabled (--chunk-tokens), a transcript estimated above
+the chunk size (a fixed size, or models.MODEL_CHUNK_TOKENS for "auto") is
+split into chunks, at SRT cue boundaries where the transcript is SRT and at
+sentence boundaries otherwise. Each chunk is sent to the model concurrently
+(map) and the partial results are then combined (reduce), so the latency of
+one call is bounded by the chunk size instead of the length of the meeting.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from youtube_to_docs.models import CHARS_PER_TOKEN, chunk_tokens, estimate_tokens
+from youtube_to_docs.utils import parse_srt
+
+DEFAULT_CHUNK_WORKERS = 4
+
+# Seconds of timing reference kept on each side of an SRT chunk
+TIMING_MARGIN_SECONDS = 30
+
+# 0 (the default) disables map-reduce, None uses the per-model chunk size
+_chunk_tokens: Optional[int] = 0
+_workers = DEFAULT_CHUNK_WORKERS
+
+
+def configure_map_reduce(
+    chunk_size: Optional[int] = 0, workers: int = DEFAULT_CHUNK_WORKERS
+) -> None:
+    """
+    Sets the chunk size in tokens for every model (0 to disable map-reduce,
+    None for the per-model size) and how many chunks run at once.
+    """
+    global _chunk_tokens, _workers
+    _chunk_tokens = chunk_size
+    _workers = max(1, workers)
+
+
+def reset_map_reduce() -> None:
+    """Disables map-reduce again and restores the default concurrency."""
+    configure_map_reduce()
+
+
+def parse_chunk_tokens(spec: str) -> Optional[int]:
+    """
+    Parses a --chunk-tokens value: a chunk size in tokens (0 disables
+    map-reduce) or "auto" for the per-model size (returned as None).
+    """
+    if spec.strip().lower() == "auto":
+        return None
+    try:
+        tokens = int(spec)
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid chunk size {spec!r}, expected a number of tokens or auto"
+        ) from e
+    if tokens < 0:
+        raise ValueError(f"Invalid chunk size {spec!r}, expected 0 or more")
+    return tokens
+
+
+def chunk_budget(model_name: str) -> int:
+    """Returns the chunk size in tokens for model_name (0: no chunking)."""
+    if _chunk_tokens is not None:
+        return max(0, _chunk_tokens)
+    return chunk_tokens(model_name)
+
+
+def _srt_blocks(srt: str) -> List[str]:
+    return [b.strip() for b in re.split(r"\n\s*\n", srt.strip()) if b.strip()]
+
+
+def _pack(units: List[str], max_chars: int, separator: str) -> List[str]:
+    """Joins consecutive units into chunks of at most max_chars."""
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for unit in units:
+        # A single unit longer than a chunk is cut into pieces
+        for i in range(0, len(unit), max_chars):
+            piece = unit[i : i + max_chars]
+            if current and size + len(separator) + len(piece) > max_chars:
+                chunks.append(separator.join(current))
+                current, size = [], 0
+            size += (len(separator) if current else 0) + len(piece)
+            current.append(piece)
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+def split_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """
+    Splits transcript into chunks of at most max_tokens (estimated). SRT is
+    split between cues, plain text between sentences. A transcript that fits
+    (or max_tokens 0) is returned as a single chunk.
+    """
+    if max_tokens <= 0 or estimate_tokens(transcript) <= max_tokens:
+        return [transcript]
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if parse_srt(transcript):
+        return _pack(_srt_blocks(transcript), max_chars, "\n\n")
+    sentences = re.split(r"(?<=[.!?])\s+", transcript.strip())
+    return _pack(sentences, max_chars, " ")
+
+
+def slice_timing_reference(
+    timing_reference: str, chunk: str, index: int, count: int
+) -> str:
+    """
+    Returns the part of an SRT timing reference that covers chunk, the
+    index-th of count chunks: the cues within the chunk's time span if it is
+    SRT, else the same share of the reference's cues.
+    """
+    blocks = _srt_blocks(timing_reference)
+    chunk_cues = parse_srt(chunk)
+    if chunk_cues:
+        start = chunk_cues[0][0] - TIMING_MARGIN_SECONDS
+        end = chunk_cues[-1][1] + TIMING_MARGIN_SECONDS
+        kept = []
+        for block in blocks:
+            cues = parse_srt(block)
+            if cues and cues[0][1] >= start and cues[0][0] <= end:
+                kept.append(block)
+        return "\n\n".join(kept)
+    # Plain text: assume the chunk covers the same share of the time, with
+    # a few cues of slack on each side
+    slack = max(1, len(blocks) // (count * 10))
+    low = max(0, len(blocks) * index // count - slack)
+    high = min(len(blocks), len(blocks) * (index + 1) // count + slack)
+    return "\n\n".join(blocks[low:high])
+
+
+def map_chunks(
+    func: Callable[[int, str], Tuple[str, int, int]], chunks: List[str]
+) -> List[Tuple[str, int, int]]:
+    """Calls func(index, chunk) for every chunk, up to the worker limit at once."""
+    if len(chunks) == 1:
+        return [func(0, chunks[0])]
+    with ThreadPoolExecutor(
+        max_workers=min(_workers, len(chunks)), thread_name_prefix="chunk"
+    ) as executor:
+        return list(executor.map(func, range(len(chunks)), chunks))
+
+
+def group_parts(parts: List[str], max_tokens: int) -> List[List[str]]:
+    """
+    Groups consecutive parts so each group fits in max_tokens, with at
+    least two parts per group so repeated reduction always converges.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    groups: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for part in parts:
+        if len(current) >= 2 and size + len(part) > max_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(part)
+        size += len(part)
+    if len(current) == 1 and groups:
+        groups[-1].append(current[0])
+    elif current:
+        groups.append(current)
+    return groups
+
+
+def is_empty_result(text: str) -> bool:
+    """True for the placeholders models return when nothing was found."""
+    return text.strip() in ("", "nan", 'float("nan")')
+
+
+def merge_markdown_tables(tables: List[str]) -> Optional[str]:
+    """
+    Concatenates the rows of markdown tables under the first table's
+    header. Returns None if none of the texts contains a table.
+    """
+    header: List[str] = []
+    rows: List[str] = []
+    for table in tables:
+        lines = [line.strip() for line in table.strip().split("\n")]
+        for i in range(len(lines) - 1):
+            if "|" in lines[i] and ("---" in lines[i + 1] or "-|-" in lines[i + 1]):
+                if not header:
+                    header = lines[i : i + 2]
+                rows.extend(line for line in lines[i + 2 :] if "|" in line)
+                break
+    if not header:
+        return None
+    return "\n".join(header + rows)
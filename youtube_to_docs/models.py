@@ -24,3 +24,32 @@ MODEL_SUITES = {
         "transcript": "gcp-chirp3",
     },
 }
+
+# Rough number of characters per token, used to estimate prompt sizes
+CHARS_PER_TOKEN = 4
+
+# With --chunk-tokens auto, transcripts estimated above this many tokens are
+# split into chunks of about this size that are summarized concurrently and
+# then combined (map-reduce). Matched against the model name; the first
+# matching key wins.
+MODEL_CHUNK_TOKENS = {
+    "gemini": 100_000,
+    "claude": 60_000,
+    "gpt": 60_000,
+    "nova": 60_000,
+    "llama": 20_000,
+}
+DEFAULT_CHUNK_TOKENS = 30_000
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the number of tokens in text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def chunk_tokens(model_name: str) -> int:
+    """Returns the map-reduce chunk size in tokens for model_name."""
+    for key, tokens in MODEL_CHUNK_TOKENS.items():
+        if key in model_name:
+            return tokens
+    return DEFAULT_CHUNK_TOKENS
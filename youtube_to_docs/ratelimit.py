@@ -0,0 +1,318 @@
+"""
+Per-provider token-bucket rate limiting and adaptive (AIMD) concurrency for
+the external APIs we call.
+"""
+
+import functools
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple, TypeVar, cast
+
+from youtube_to_docs.utils import is_error_text
+
+T = TypeVar("T")
+
+# Limits applied when nothing is configured: (requests/minute, tokens/minute).
+# The transcript API is not an official quota-backed API and blocks IPs that
+# request too quickly, so it is limited to one request per second.
+DEFAULT_LIMITS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "transcript": (60, None),
+}
+
+# Requests a provider may make back to back before being paced (a full
+# minute's worth when not listed). The transcript API gets a small burst so a
+# cold start cannot fire a minute of requests at once.
+REQUEST_BURST: Dict[str, float] = {
+    "transcript": 2,
+}
+
+# Bounds for the number of in-flight calls per provider
+INITIAL_CONCURRENCY = 4
+MAX_CONCURRENCY = 64
+
+# Error text returned by providers when we exceed a quota or overload them
+THROTTLE_PATTERN = re.compile(
+    r"\b(429|503)\b|RESOURCE_EXHAUSTED|Too Many Requests|ThrottlingException|"
+    r"rate limit",
+    re.IGNORECASE,
+)
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket refilled continuously at rate_per_minute.
+    The bucket starts full and holds at most burst tokens (default: one
+    minute's worth). The balance may go
+    negative when usage is only known after a call (e.g. LLM tokens), in which
+    case later callers wait until the debt has been refilled.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[float] = None):
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = float(burst) if burst else self.rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        self.tokens = min(
+            self.capacity, self.tokens + elapsed * self.rate_per_minute / 60
+        )
+
+    def acquire(self, amount: float = 1) -> float:
+        """
+        Blocks until amount tokens are available and takes them.
+        Requests larger than the bucket only wait for a full bucket.
+        Returns the number of seconds spent waiting.
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) * 60 / self.rate_per_minute
+            time.sleep(delay)
+            waited += delay
+
+    def consume(self, amount: float) -> None:
+        """Takes amount tokens without waiting (the balance may go negative)."""
+        with self.lock:
+            self._refill()
+            self.tokens -= amount
+
+
+class RateLimiter:
+    """Request and token budgets for a single provider."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        request_burst: Optional[float] = None,
+    ):
+        self.requests = (
+            TokenBucket(requests_per_minute, request_burst)
+            if requests_per_minute
+            else None
+        )
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    def acquire(self) -> float:
+        """
+        Waits for a request slot and for any token debt to be repaid.
+        Returns the number of seconds spent waiting.
+        """
+        waited = 0.0
+        if self.requests:
+            waited += self.requests.acquire(1)
+        if self.tokens:
+            waited += self.tokens.acquire(0)
+        return waited
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charges the tokens a finished call actually used."""
+        if self.tokens and tokens:
+            self.tokens.consume(tokens)
+
+
+class AdaptiveConcurrency:
+    """
+    Limits the number of in-flight calls to a provider using additive
+    increase / multiplicative decrease: each successful call grows the limit
+    by 1/limit (about one per round of calls) and each throttled call halves it.
+    """
+
+    def __init__(
+        self,
+        initial: int = INITIAL_CONCURRENCY,
+        maximum: int = MAX_CONCURRENCY,
+    ):
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.in_flight = 0
+        self.peak = int(self.limit)
+        self.throttled = 0
+        self.condition = threading.Condition()
+
+    @property
+    def current(self) -> int:
+        """The number of calls currently allowed to run at once."""
+        return max(1, int(self.limit))
+
+    def acquire(self) -> None:
+        """Blocks until fewer than the current limit of calls are in flight."""
+        with self.condition:
+            while self.in_flight >= self.current:
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        """Finishes a call and adjusts the limit based on its outcome."""
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+                self.peak = max(self.peak, self.current)
+            self.condition.notify_all()
+
+
+def is_throttled(result: object) -> bool:
+    """
+    Returns True if a call result is an error caused by throttling, e.g.
+    "Error: 429 RESOURCE_EXHAUSTED" or "Bedrock API Error 429: ...".
+    Successful responses are never inspected so their text cannot match.
+    """
+    if not is_error_text(result):
+        return False
+    return bool(THROTTLE_PATTERN.search(cast(str, result)))
+
+
+_limits: Dict[str, Tuple[Optional[float], Optional[float]]] = dict(DEFAULT_LIMITS)
+_limiters: Dict[str, RateLimiter] = {}
+_concurrency: Dict[str, AdaptiveConcurrency] = {}
+_lock = threading.Lock()
+
+
+def get_provider(model_name: str) -> str:
+    """
+    Maps a model name to the provider whose quota it counts against, e.g.
+    "gemini-3-flash-preview" -> "gemini", "bedrock-claude-..." -> "bedrock".
+    """
+    if model_name.startswith("nova") or model_name.startswith("claude"):
+        return "bedrock"
+    if "titan-image-generator" in model_name or "nova-canvas" in model_name:
+        return "bedrock"
+    if model_name.startswith("imagen"):
+        return "gemini"
+    return model_name.split("-", 1)[0]
+
+
+def parse_rate_limits(
+    spec: str,
+) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """
+    Parses a comma-separated list of PROVIDER=RPM[/TPM] entries, e.g.
+    "gemini=1000/4000000,bedrock=50,transcript=/". An empty value means
+    unlimited.
+    """
+    limits: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        if "=" not in entry:
+            raise ValueError(
+                f"Invalid rate limit {entry!r}, expected PROVIDER=RPM[/TPM]"
+            )
+        provider, value = entry.split("=", 1)
+        rpm, _, tpm = value.partition("/")
+        try:
+            limits[provider.strip()] = (
+                float(rpm) if rpm.strip() else None,
+                float(tpm) if tpm.strip() else None,
+            )
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid rate limit {entry!r}, expected PROVIDER=RPM[/TPM]"
+            ) from e
+    return limits
+
+
+def configure_rate_limits(
+    limits: Dict[str, Tuple[Optional[float], Optional[float]]],
+) -> None:
+    """Overrides the limits for the given providers (on top of the defaults)."""
+    with _lock:
+        _limits.update(limits)
+        for provider in limits:
+            _limiters.pop(provider, None)
+
+
+def reset_rate_limits() -> None:
+    """Restores the default limits and forgets all limiter state."""
+    with _lock:
+        _limits.clear()
+        _limits.update(DEFAULT_LIMITS)
+        _limiters.clear()
+        _concurrency.clear()
+
+
+def get_limiter(provider: str) -> RateLimiter:
+    """Returns the shared limiter for provider, creating it on first use."""
+    with _lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            rpm, tpm = _limits.get(provider, (None, None))
+            limiter = RateLimiter(rpm, tpm, REQUEST_BURST.get(provider))
+            _limiters[provider] = limiter
+        return limiter
+
+
+def get_concurrency(provider: str) -> AdaptiveConcurrency:
+    """Returns the shared concurrency controller for provider."""
+    with _lock:
+        controller = _concurrency.get(provider)
+        if controller is None:
+            controller = AdaptiveConcurrency()
+            _concurrency[provider] = controller
+        return controller
+
+
+def concurrency_report() -> Dict[str, Tuple[int, int, int]]:
+    """
+    Returns provider -> (current concurrency, peak concurrency, throttled
+    calls) for every provider called during the run.
+    """
+    with _lock:
+        return {
+            provider: (c.current, c.peak, c.throttled)
+            for provider, c in sorted(_concurrency.items())
+        }
+
+
+def acquire(provider: str) -> None:
+    """Waits until a call to provider is allowed."""
+    get_limiter(provider).acquire()
+
+
+def rate_limited(
+    func: Callable[..., Tuple[T, int, int]],
+) -> Callable[..., Tuple[T, int, int]]:
+    """
+    Decorator for provider calls that take the model name as their first
+    argument and return (result, input_tokens, output_tokens). The call waits
+    for a concurrency slot and its provider's limiter, its token usage is
+    charged afterwards, and throttling errors shrink the provider's
+    concurrency.
+    """
+
+    @functools.wraps(func)
+    def wrapper(model_name, *args, **kwargs):
+        if not model_name:
+            return func(model_name, *args, **kwargs)
+        provider = get_provider(model_name)
+        controller = get_concurrency(provider)
+        limiter = get_limiter(provider)
+
+        controller.acquire()
+        throttled = False
+        try:
+            limiter.acquire()
+            result = func(model_name, *args, **kwargs)
+            throttled = is_throttled(result[0])
+        finally:
+            controller.release(throttled)
+        limiter.record_tokens(result[1] + result[2])
+        return result
+
+    return wrapper
@@ -0,0 +1,118 @@
+"""A small dependency-aware scheduler for the per-video processing stages."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+class Stage:
+    """A unit of work with declared inputs and outputs."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        inputs: Iterable[str] = (),
+        outputs: Optional[Iterable[str]] = None,
+    ):
+        self.name = name
+        self.func = func
+        self.inputs: Tuple[str, ...] = tuple(inputs)
+        # By default a stage produces a single output named after itself
+        self.outputs: Tuple[str, ...] = (
+            tuple(outputs) if outputs is not None else (name,)
+        )
+
+
+class StageGraph:
+    """
+    Runs stages as soon as the stages producing their inputs have finished.
+    Independent stages run concurrently on a thread pool.
+    Inputs that no stage produces are treated as already available.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        inputs: Iterable[str] = (),
+        outputs: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Registers a stage. Stage names must be unique."""
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage name: {name}")
+        self.stages[name] = Stage(name, func, inputs, outputs)
+
+    def dependencies(self) -> Dict[str, set]:
+        """Returns a mapping of stage name -> names of the stages it waits for."""
+        producers: Dict[str, str] = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                if output in producers:
+                    raise ValueError(
+                        f"Output {output!r} is produced by both "
+                        f"{producers[output]!r} and {stage.name!r}"
+                    )
+                producers[output] = stage.name
+
+        return {
+            stage.name: {producers[i] for i in stage.inputs if i in producers}
+            for stage in self.stages.values()
+        }
+
+    def run(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Executes all stages and returns a mapping of stage name -> return value.
+        If a stage raises, no new stages are started and the first error is
+        re-raised once the running stages have finished.
+        """
+        sorter = TopologicalSorter(self.dependencies())
+        sorter.prepare()  # Raises graphlib.CycleError on cycles
+
+        results: Dict[str, Any] = {}
+
+        if max_workers == 1:
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    results[name] = self.stages[name].func()
+                    sorter.done(name)
+            return results
+
+        workers = max_workers or max(1, len(self.stages))
+        errors: list[BaseException] = []
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="stage"
+        ) as executor:
+            while sorter.is_active() and not errors:
+                for name in sorter.get_ready():
+                    running[executor.submit(self.stages[name].func)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+                    sorter.done(name)
+
+            # Let stages that are already in flight finish before reporting
+            for future in list(running):
+                try:
+                    results[running[future]] = future.result()
+                except Exception as e:
+                    errors.append(e)
+
+        if errors:
+            raise errors[0]
+
+        return results
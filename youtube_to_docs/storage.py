@@ -1,11 +1,15 @@
 import atexit
 import base64
+import contextlib
+import functools
 import io
 import json
 import os
 import re
 import shutil
 import tempfile
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional
@@ -57,8 +61,12 @@ class Storage(ABC):
         pass
 
     @abstractmethod
-    def save_dataframe(self, df: pl.DataFrame, path: str) -> str:
-        """Saves a DataFrame to a CSV file (or Sheet). Returns the path or link."""
+    def save_dataframe(self, df: pl.DataFrame, path: str, final: bool = True) -> str:
+        """
+        Saves a DataFrame to a CSV file (or Sheet). Returns the path or link.
+        final=False marks an intermediate (checkpoint) save, which a backend
+        may make cheaper as long as the data can be loaded again.
+        """
         pass
 
     @abstractmethod
@@ -66,6 +74,14 @@ class Storage(ABC):
         """Ensures a directory exists."""
         pass
 
+    def ensure_directories(self, paths: list[str]) -> None:
+        """
+        Ensures several directories exist. Remote backends override this to
+        look up and create them in batched requests.
+        """
+        for path in paths:
+            self.ensure_directory(path)
+
     @abstractmethod
     def upload_file(
         self, local_path: str, target_path: str, content_type: Optional[str] = None
@@ -97,8 +113,32 @@ class Storage(ABC):
         pass
 
 
+# Columnar formats for the authoritative local manifest: file suffix for each
+MANIFEST_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
 class LocalStorage(Storage):
-    """Implementation of Storage for the local filesystem."""
+    """
+    Implementation of Storage for the local filesystem.
+
+    With manifest_format "parquet" or "arrow" the manifest is kept in a
+    zstd-compressed columnar file next to the CSV (e.g. youtube-docs.parquet).
+    That file is authoritative and is what gets loaded; the CSV is exported
+    from it on the final save of a run, not on checkpoints. If the CSV was
+    edited after the columnar file was written, the CSV is loaded instead.
+    """
+
+    def __init__(self, manifest_format: str = "csv"):
+        if manifest_format != "csv" and manifest_format not in MANIFEST_FORMATS:
+            raise ValueError(f"Unsupported manifest format: {manifest_format}")
+        self.manifest_format = manifest_format
+
+    def manifest_path(self, path: str) -> Optional[str]:
+        """Returns the columnar manifest path for a CSV path (None for CSV)."""
+        suffix = MANIFEST_FORMATS.get(self.manifest_format)
+        if suffix is None:
+            return None
+        return os.path.splitext(path)[0] + suffix
 
     def exists(self, path: str) -> bool:
         return os.path.exists(path)
@@ -122,13 +162,40 @@ class LocalStorage(Storage):
         return os.path.abspath(path)
 
     def load_dataframe(self, path: str) -> Optional[pl.DataFrame]:
+        columnar_path = self.manifest_path(path)
+        if columnar_path and os.path.exists(columnar_path):
+            csv_edited = os.path.exists(path) and os.path.getmtime(
+                path
+            ) > os.path.getmtime(columnar_path)
+            if not csv_edited:
+                # Not memory-mapped: the files are compressed, and a mapped
+                # file cannot be replaced on Windows by the next save
+                try:
+                    if self.manifest_format == "arrow":
+                        return pl.read_ipc(columnar_path, memory_map=False)
+                    return pl.read_parquet(columnar_path, memory_map=False)
+                except Exception as e:
+                    print(f"Warning: Could not read {columnar_path}: {e}")
+            else:
+                print(f"{path} is newer than {columnar_path}, loading the CSV.")
         try:
             return pl.read_csv(path)
         except Exception:
             return None
 
-    def save_dataframe(self, df: pl.DataFrame, path: str) -> str:
-        df.write_csv(path)
+    def save_dataframe(self, df: pl.DataFrame, path: str, final: bool = True) -> str:
+        columnar_path = self.manifest_path(path)
+        # Checkpoints only write the columnar manifest; the CSV is exported at
+        # the final save, first so the columnar manifest stays the newer file
+        if final or not columnar_path:
+            df.write_csv(path)
+        if columnar_path:
+            tmp_path = f"{columnar_path}.tmp"
+            if self.manifest_format == "arrow":
+                df.write_ipc(tmp_path, compression="zstd")
+            else:
+                df.write_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, columnar_path)
         return os.path.abspath(path)
 
     def ensure_directory(self, path: str) -> None:
@@ -156,9 +223,135 @@ class LocalStorage(Storage):
         return None
 
 
+def _is_blank(value: Any) -> bool:
+    """Returns whether a cell is empty in a CSV export (None or NaN)."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _sheet_values(df: pl.DataFrame) -> list[list[str]]:
+    """Returns the cells of df as strings, the way they are written to a Sheet."""
+    return [["" if _is_blank(v) else str(v) for v in row] for row in df.iter_rows()]
+
+
+def _json_cell(value: Any) -> Any:
+    """Returns a cell value that can be sent as JSON (numbers stay numbers)."""
+    if _is_blank(value):
+        return ""
+    if isinstance(value, bool) or isinstance(value, (int, str)):
+        return value
+    if isinstance(value, float) and value == value and abs(value) != float("inf"):
+        return value
+    return str(value)
+
+
+def _column_letter(index: int) -> str:
+    """Returns the A1 column letter for a 0-based column index (0 -> A)."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _insert_positions(old: list, new: list) -> Optional[list[int]]:
+    """
+    Returns the indices in new of the items that are not in old, provided
+    old is new with those items removed (in order). Returns None otherwise.
+    """
+    if len(set(new)) != len(new):
+        return None
+    positions = []
+    j = 0
+    for i, item in enumerate(new):
+        if j < len(old) and old[j] == item:
+            j += 1
+        else:
+            positions.append(i)
+    if j != len(old) or set(old) & {new[i] for i in positions}:
+        return None
+    return positions
+
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+
+def _synchronized(method):
+    """
+    Runs a storage method under the storage's lock, so threads sharing the
+    storage see consistent caches. Only methods that make no API call hold it.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _KeyedLocks:
+    """
+    One re-entrant lock per key, e.g. so each folder is listed or created by
+    one thread at a time while other folders are looked up concurrently.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.locks: dict[Any, threading.RLock] = {}
+
+    def __call__(self, key: Any) -> threading.RLock:
+        with self.lock:
+            return self.locks.setdefault(key, threading.RLock())
+
+    def all(self, keys: list) -> contextlib.ExitStack:
+        """Holds the locks of several keys, taken in a fixed order."""
+        stack = contextlib.ExitStack()
+        for key in sorted(set(keys)):
+            stack.enter_context(self(key))
+        return stack
+
+
+def _load_id_cache(path: Path, key: str) -> dict:
+    """Returns the entry for key in a persisted ID cache file ({} if missing)."""
+    try:
+        entry = json.loads(Path(path).read_text(encoding="utf-8")).get(key)
+    except Exception:
+        return {}
+    return entry if isinstance(entry, dict) else {}
+
+
+def _save_id_cache(path: Path, key: str, entry: dict) -> None:
+    """Stores entry under key in a persisted ID cache file, keeping other keys."""
+    path = Path(path)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    data[key] = entry
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class _Lease:
+    """Marks the services a thread holds; see GoogleDriveStorage._services."""
+
+
 class GoogleDriveStorage(Storage):
     """Implementation of Storage for Google Drive."""
 
+    # Minimum number of rows of the manifest Sheet
+    MIN_SHEET_ROWS = 1000
+    # Folder IDs and listings kept across runs, refreshed with the changes API
+    ID_CACHE_FILE = Path.home() / ".youtube_to_docs_drive_cache.json"
+    # Maximum number of requests in a single Drive batch call
+    DRIVE_BATCH_SIZE = 100
+    # Service sets of finished threads kept for reuse by later threads
+    MAX_IDLE_SERVICES = 16
+
     SCOPES = [
         "https://www.googleapis.com/auth/drive.file",
         "https://www.googleapis.com/auth/documents",
@@ -166,14 +359,87 @@ class GoogleDriveStorage(Storage):
 
     def __init__(self, output_arg: str):
         self.creds = self._get_creds()
-        self.service = build("drive", "v3", credentials=self.creds)
-        self.docs_service = build("docs", "v1", credentials=self.creds)
-        self.sheets_service = build("sheets", "v4", credentials=self.creds)
-        self.root_folder_id = self._resolve_root_folder_id(output_arg)
+        # Video workers share the storage, but an API service wraps a single
+        # httplib2 connection, which is not thread-safe: each thread uses its
+        # own services, handed on to a later thread when it finishes
+        self.thread_services = threading.local()
+        self.idle_services: list[tuple[Any, Any, Any]] = []
+        self._services()
+        # Guards the caches below (never held during an API call)
+        self.lock = threading.RLock()
+        # Serialise listing and creating the same folder
+        self.folder_locks = _KeyedLocks()
         # Cache for folder IDs to avoid constant lookups
         self.folder_cache: dict[str, str] = {}
         # Cache for file metadata (path -> dict)
         self.file_cache: dict[str, dict] = {}
+        # Contents of each folder listed so far (folder id -> name -> dict),
+        # kept up to date by writes, so existence checks need no API call
+        self.folder_listings: dict[str, dict[str, dict]] = {}
+        # Where each file in the listings is (file id -> (folder id, name)),
+        # so a change is applied without scanning every listing
+        self.file_index: dict[str, tuple[str, str]] = {}
+        # Last saved (or loaded) state of each manifest Sheet (path -> dict),
+        # used to write only the rows that changed
+        self.sheet_snapshots: dict[str, dict] = {}
+
+        # Folder IDs and listings from earlier runs are brought up to date with
+        # the changes since their page token instead of being looked up again
+        self.id_cache_key = output_arg
+        self.changes_token: Optional[str] = None
+        cached = _load_id_cache(self.ID_CACHE_FILE, output_arg)
+        if cached.get("root_folder_id") and cached.get("page_token"):
+            self.root_folder_id = cached["root_folder_id"]
+            self.folder_cache = cached.get("folders", {})
+            for folder_id, listing in cached.get("listings", {}).items():
+                self._set_listing(folder_id, listing)
+            self.changes_token = cached["page_token"]
+            if not self._sync_changes():
+                self.folder_cache, self.folder_listings = {}, {}
+                self.file_index = {}
+                self.changes_token = None
+        if self.changes_token is None:
+            self.root_folder_id = self._resolve_root_folder_id(output_arg)
+            # Taken before anything is listed, so later changes are not missed
+            self.changes_token = self._start_page_token()
+        atexit.register(self._save_id_cache)
+
+    def _services(self) -> Any:
+        """
+        Returns the Drive, Docs and Sheets services of the current thread,
+        reusing those of a finished thread when there are any.
+        """
+        services = self.thread_services
+        if not hasattr(services, "drive"):
+            try:
+                built = self.idle_services.pop()
+            except IndexError:
+                built = (
+                    build("drive", "v3", credentials=self.creds),
+                    build("docs", "v1", credentials=self.creds),
+                    build("sheets", "v4", credentials=self.creds),
+                )
+            services.drive, services.docs, services.sheets = built
+            # The lease is dropped with the thread's locals when it ends
+            services.lease = _Lease()
+            weakref.finalize(services.lease, self._release_services, built)
+        return services
+
+    def _release_services(self, built: tuple[Any, Any, Any]) -> None:
+        if len(self.idle_services) < self.MAX_IDLE_SERVICES:
+            self.idle_services.append(built)
+
+    @property
+    def service(self) -> Any:
+        return self._services().drive
+
+    @property
+    def docs_service(self) -> Any:
+        return self._services().docs
+
+    @property
+    def sheets_service(self) -> Any:
+        return self._services().sheets
 
     def _get_creds(self):
         from google.auth.transport.requests import Request
@@ -236,6 +502,168 @@ class GoogleDriveStorage(Storage):
             # Assume it is a Folder ID
             return output_arg
 
+    def _start_page_token(self) -> Optional[str]:
+        try:
+            return (
+                self.service.changes().getStartPageToken().execute()["startPageToken"]
+            )
+        except Exception as e:
+            print(f"Warning: Could not get a Drive changes token: {e}")
+            return None
+
+    def _sync_changes(self) -> bool:
+        """
+        Applies the Drive changes since the persisted page token to the cached
+        folder IDs and listings. Returns False if the cache cannot be trusted.
+        """
+        page_token = self.changes_token
+        try:
+            while page_token:
+                results = (
+                    self.service.changes()
+                    .list(
+                        pageToken=page_token,
+                        spaces="drive",
+                        pageSize=1000,
+                        fields=(
+                            "nextPageToken, newStartPageToken, changes(fileId, "
+                            "removed, file(id, name, parents, mimeType, "
+                            "webViewLink, trashed))"
+                        ),
+                    )
+                    .execute()
+                )
+                for change in results.get("changes", []):
+                    if not self._apply_change(change):
+                        return False
+                if results.get("newStartPageToken"):
+                    self.changes_token = results["newStartPageToken"]
+                    break
+                page_token = results.get("nextPageToken")
+        except Exception as e:
+            print(f"Warning: Could not sync Drive changes: {e}")
+            return False
+        return True
+
+    @_synchronized
+    def _apply_change(self, change: dict) -> bool:
+        """Applies one Drive change. Returns False if the root folder is gone."""
+        file_id = change.get("fileId")
+        file = change.get("file") or {}
+        gone = change.get("removed") or file.get("trashed")
+        if file_id == self.root_folder_id and gone:
+            return False
+
+        # Drop the old entry (the file may have been renamed, moved or removed)
+        if file_id in self.file_index:
+            folder_id, name = self.file_index.pop(file_id)
+            listing = self.folder_listings.get(folder_id, {})
+            if listing.get(name, {}).get("id") == file_id:
+                del listing[name]
+            if self.folder_cache.get(f"{folder_id}/{name}") == file_id:
+                del self.folder_cache[f"{folder_id}/{name}"]
+        if gone:
+            self.folder_listings.pop(file_id, None)
+            return True
+
+        for parent_id in file.get("parents", []):
+            self._index_file(
+                parent_id,
+                file["name"],
+                {k: file[k] for k in ("id", "webViewLink", "mimeType") if k in file},
+            )
+        return True
+
+    @_synchronized
+    def _save_id_cache(self) -> None:
+        """Persists the folder IDs and listings for the next run."""
+        if not self.changes_token:
+            return
+        try:
+            _save_id_cache(
+                self.ID_CACHE_FILE,
+                self.id_cache_key,
+                {
+                    "root_folder_id": self.root_folder_id,
+                    "page_token": self.changes_token,
+                    "folders": self.folder_cache,
+                    "listings": self.folder_listings,
+                },
+            )
+        except Exception as e:
+            print(f"Warning: Could not save the Drive ID cache: {e}")
+
+    def _list_folder(self, folder_id: str) -> dict[str, dict]:
+        """
+        Returns the files and folders in folder_id by name. Each folder is
+        listed (page by page) once; later lookups, also in later runs, use
+        the listing.
+        """
+        listing = self.folder_listings.get(folder_id)
+        if listing is not None:
+            return listing
+
+        with self.folder_locks(("list", folder_id)):
+            # Another thread may have listed it in the meantime
+            listing = self.folder_listings.get(folder_id)
+            if listing is not None:
+                return listing
+            listing = {}
+            page_token = None
+            while True:
+                results = self._list_request(folder_id, page_token).execute()
+                for file in results.get("files", []):
+                    listing.setdefault(file["name"], file)
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
+            self._set_listing(folder_id, listing)
+        return listing
+
+    @_synchronized
+    def _set_listing(self, folder_id: str, listing: dict[str, dict]) -> None:
+        """Stores the listing of folder_id and indexes the files in it."""
+        self.folder_listings[folder_id] = listing
+        for name, file in listing.items():
+            if file.get("id"):
+                self.file_index[file["id"]] = (folder_id, name)
+
+    def _list_request(self, folder_id: str, page_token: Optional[str] = None) -> Any:
+        return self.service.files().list(
+            q=f"'{folder_id}' in parents and trashed=false",
+            fields="nextPageToken, files(id, name, webViewLink, mimeType)",
+            pageSize=1000,
+            pageToken=page_token,
+        )
+
+    def _execute_batch(self, batch_requests: dict[str, Any]) -> dict[str, Any]:
+        """
+        Executes independent Drive API requests (request id -> request) as
+        batch HTTP requests of up to DRIVE_BATCH_SIZE. Returns the response,
+        or the exception, for each request id.
+        """
+        results: dict[str, Any] = {}
+
+        def callback(request_id, response, exception):
+            results[request_id] = exception if exception is not None else response
+
+        items = list(batch_requests.items())
+        for start in range(0, len(items), self.DRIVE_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for request_id, request in items[start : start + self.DRIVE_BATCH_SIZE]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
+        return results
+
+    @_synchronized
+    def _index_file(self, parent_id: str, filename: str, file: dict) -> None:
+        """Records a written file in the listing of its folder."""
+        listing = self.folder_listings.get(parent_id)
+        if listing is not None:
+            listing[filename] = {"name": filename, **file}
+            if file.get("id"):
+                self.file_index[file["id"]] = (parent_id, filename)
+
     def _get_parent_id(self, path: str) -> str:
         """
         Given a 'path' which mimics os.path.join(base_dir, subfolder, filename),
@@ -260,35 +688,37 @@ class GoogleDriveStorage(Storage):
                 parent_id = self.folder_cache[cache_key]
                 continue
 
-            # Search for folder in parent_id
-            query = (
-                "mimeType='application/vnd.google-apps.folder' and "
-                f"name='{part}' and '{parent_id}' in parents and trashed=false"
-            )
-            results = self.service.files().list(q=query, fields="files(id)").execute()
-            files = results.get("files", [])
-
-            if files:
-                current_id = files[0]["id"]
-            else:
-                # Create it
-                file_metadata = {
-                    "name": part,
-                    "mimeType": "application/vnd.google-apps.folder",
-                    "parents": [parent_id],
-                }
-                folder = (
-                    self.service.files()
-                    .create(body=file_metadata, fields="id")
-                    .execute()
-                )
-                current_id = folder.get("id")
-
-            self.folder_cache[cache_key] = current_id
+            # One thread finds or creates the folder, the others wait for it
+            with self.folder_locks(("folder", cache_key)):
+                current_id = self.folder_cache.get(cache_key)
+                if current_id is None:
+                    current_id = self._find_or_create_folder(parent_id, part)
+                    self.folder_cache[cache_key] = current_id
             parent_id = current_id
 
         return parent_id
 
+    def _find_or_create_folder(self, parent_id: str, name: str) -> str:
+        """Returns the ID of folder name in parent_id, creating it if missing."""
+        # Look for the folder in the listing of parent_id
+        folder = self._list_folder(parent_id).get(name)
+        if folder and folder.get("mimeType") == FOLDER_MIME_TYPE:
+            return folder["id"]
+
+        file_metadata = {
+            "name": name,
+            "mimeType": FOLDER_MIME_TYPE,
+            "parents": [parent_id],
+        }
+        folder = self.service.files().create(body=file_metadata, fields="id").execute()
+        folder_id = folder.get("id")
+        # A new folder is empty, so it does not need to be listed
+        self._set_listing(folder_id, {})
+        self._index_file(
+            parent_id, name, {"id": folder_id, "mimeType": FOLDER_MIME_TYPE}
+        )
+        return folder_id
+
     def _get_file_metadata(self, path: str) -> Optional[dict]:
         if path in self.file_cache:
             return self.file_cache[path]
@@ -303,17 +733,10 @@ class GoogleDriveStorage(Storage):
         if filename == "youtube-docs.csv":
             filename = "youtube-docs"  # We store it as a Sheet
 
-        query = f"name='{filename}' and '{parent_id}' in parents and trashed=false"
-        results = (
-            self.service.files()
-            .list(q=query, fields="files(id, webViewLink, mimeType)")
-            .execute()
-        )
-        files = results.get("files", [])
-        if files:
-            self.file_cache[path] = files[0]
-            return files[0]
-        return None
+        file = self._list_folder(parent_id).get(filename)
+        if file:
+            self.file_cache[path] = file
+        return file
 
     def _get_file_id(self, path: str) -> Optional[str]:
         metadata = self._get_file_metadata(path)
@@ -474,6 +897,7 @@ class GoogleDriveStorage(Storage):
         # Update cache
         if doc_id:
             self.file_cache[path] = file
+            self._index_file(parent_id, filename, file)
 
         return file.get("webViewLink")
 
@@ -518,6 +942,7 @@ class GoogleDriveStorage(Storage):
         # Update cache
         if file.get("id"):
             self.file_cache[path] = file
+            self._index_file(parent_id, filename, file)
 
         return file.get("webViewLink")
 
@@ -535,12 +960,155 @@ class GoogleDriveStorage(Storage):
                 .export(fileId=file_id, mimeType="text/csv")
                 .execute()
             )
-            return pl.read_csv(io.BytesIO(csv_content))
+            df = pl.read_csv(io.BytesIO(csv_content))
         except Exception as e:
             print(f"Error loading dataframe from drive: {e}")
             return None
+        self._set_snapshot(path, file_id, df)
+        return df
+
+    def _set_snapshot(
+        self,
+        path: str,
+        spreadsheet_id: str,
+        df: pl.DataFrame,
+        sheet: Optional[dict] = None,
+    ) -> None:
+        previous = self.sheet_snapshots.get(path, {})
+        if previous.get("spreadsheet_id") != spreadsheet_id:
+            previous = {}
+        self.sheet_snapshots[path] = {
+            "spreadsheet_id": spreadsheet_id,
+            "columns": list(df.columns),
+            "urls": df["URL"].to_list() if "URL" in df.columns else None,
+            "values": _sheet_values(df),
+            "sheet": sheet or previous.get("sheet"),
+        }
+
+    def _get_sheet_properties(self, spreadsheet_id: str) -> Optional[dict]:
+        """Returns the properties of the first sheet of a spreadsheet."""
+        spreadsheet = (
+            self.sheets_service.spreadsheets()
+            .get(spreadsheetId=spreadsheet_id, fields="sheets.properties")
+            .execute()
+        )
+        sheets = spreadsheet.get("sheets", [])
+        return sheets[0].get("properties", {}) if sheets else None
+
+    def _upsert_sheet(self, df: pl.DataFrame, path: str) -> Optional[str]:
+        """
+        Writes only the rows and columns that changed since the last save via
+        the Sheets values API. New rows and columns are inserted in place so
+        the Sheet keeps the manifest order. Returns None (without writing) if
+        the change cannot be expressed as inserts and updates, e.g. when rows
+        were removed or reordered.
+        """
+        snapshot = self.sheet_snapshots.get(path)
+        if not snapshot or not snapshot["urls"] or "URL" not in df.columns:
+            return None
+        spreadsheet_id = snapshot["spreadsheet_id"]
+
+        new_columns = list(df.columns)
+        new_urls = df["URL"].to_list()
+        column_inserts = _insert_positions(snapshot["columns"], new_columns)
+        row_inserts = _insert_positions(snapshot["urls"], new_urls)
+        if column_inserts is None or row_inserts is None:
+            return None
+
+        sheet = snapshot["sheet"] or self._get_sheet_properties(spreadsheet_id)
+        if not sheet:
+            return None
+        snapshot["sheet"] = sheet
+        sheet_id = sheet.get("sheetId")
+        title = sheet.get("title", "Sheet1").replace("'", "''")
+
+        # Previous values aligned to the new columns and rows ("" for inserts)
+        old_columns = {c: i for i, c in enumerate(snapshot["columns"])}
+        old_rows = dict(zip(snapshot["urls"], snapshot["values"]))
+        new_values = _sheet_values(df)
+        changed_rows = []
+        for i, (url, values) in enumerate(zip(new_urls, new_values)):
+            old = old_rows.get(url)
+            old_aligned = [
+                old[old_columns[c]] if old is not None and c in old_columns else ""
+                for c in new_columns
+            ]
+            if old_aligned != values:
+                changed_rows.append(i)
+
+        if not changed_rows and not column_inserts:
+            return self.file_cache.get(path, {}).get("webViewLink", "")
+
+        # Insert blank rows/columns where new ones appear (top to bottom, so
+        # each index already accounts for the previous inserts)
+        requests = []
+        for dimension, positions in (
+            ("COLUMNS", column_inserts),
+            ("ROWS", [i + 1 for i in row_inserts]),
+        ):
+            for index in positions:
+                requests.append(
+                    {
+                        "insertDimension": {
+                            "range": {
+                                "sheetId": sheet_id,
+                                "dimension": dimension,
+                                "startIndex": index,
+                                "endIndex": index + 1,
+                            },
+                            "inheritFromBefore": False,
+                        }
+                    }
+                )
+        if requests:
+            self.sheets_service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id, body={"requests": requests}
+            ).execute()
+            grid = sheet.setdefault("gridProperties", {})
+            grid["rowCount"] = grid.get("rowCount", 0) + len(row_inserts)
+            grid["columnCount"] = grid.get("columnCount", 0) + len(column_inserts)
+
+        # Write the header (if columns changed) and each run of changed rows
+        rows = list(df.iter_rows())
+        last_column = _column_letter(len(new_columns) - 1)
+        data = []
+        if column_inserts:
+            data.append(
+                {"range": f"'{title}'!A1:{last_column}1", "values": [new_columns]}
+            )
+        start = None
+        for k, i in enumerate(changed_rows):
+            if start is None:
+                start = i
+            if k + 1 == len(changed_rows) or changed_rows[k + 1] != i + 1:
+                data.append(
+                    {
+                        "range": f"'{title}'!A{start + 2}:{last_column}{i + 2}",
+                        "values": [
+                            [_json_cell(v) for v in row] for row in rows[start : i + 1]
+                        ],
+                    }
+                )
+                start = None
+        # RAW stores the values as they are, so text such as "=1+1" or "1/2"
+        # is not parsed as a formula or date (numbers are sent as numbers)
+        self.sheets_service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": "RAW", "data": data},
+        ).execute()
+
+        self._set_snapshot(path, spreadsheet_id, df)
+        return self.file_cache.get(path, {}).get("webViewLink", "")
+
+    def save_dataframe(self, df: pl.DataFrame, path: str, final: bool = True) -> str:
+        # Only write what changed since the last save when possible
+        try:
+            link = self._upsert_sheet(df, path)
+            if link is not None:
+                return link
+        except Exception as e:
+            print(f"Warning: Incremental Sheet update failed, re-uploading: {e}")
 
-    def save_dataframe(self, df: pl.DataFrame, path: str) -> str:
         parent_id = self._get_parent_id(path)
         filename = Path(path).stem  # youtube-docs
 
@@ -584,24 +1152,21 @@ class GoogleDriveStorage(Storage):
             )
 
         # Update sheet properties (freeze header and ensure min rows)
+        sheet = None
         try:
             spreadsheet_id = file.get("id")
-            # Fetch the spreadsheet to get the actual sheetId of the first sheet
-            spreadsheet = (
-                self.sheets_service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
-                .execute()
-            )
-            sheets = spreadsheet.get("sheets", [])
-            if sheets:
-                sheet = sheets[0]
-                sheet_id = sheet.get("properties", {}).get("sheetId")
-                grid_props = sheet.get("properties", {}).get("gridProperties", {})
-                current_rows = grid_props.get("rowCount", 0)
-
-                if sheet_id is not None:
-                    requests = []
-                    # Freeze rows/cols
+            # Fetch the first sheet to get its sheetId and current properties
+            sheet = self._get_sheet_properties(spreadsheet_id)
+            sheet_id = sheet.get("sheetId") if sheet else None
+
+            if sheet_id is not None:
+                grid_props = sheet.setdefault("gridProperties", {})
+                requests = []
+                # Freeze rows/cols (only if not frozen already)
+                if (
+                    grid_props.get("frozenRowCount") != 1
+                    or grid_props.get("frozenColumnCount") != 1
+                ):
                     requests.append(
                         {
                             "updateSheetProperties": {
@@ -618,23 +1183,26 @@ class GoogleDriveStorage(Storage):
                             }
                         }
                     )
+                    grid_props.update(frozenRowCount=1, frozenColumnCount=1)
 
-                    # Ensure minimum rows (1000) for better UX
-                    if current_rows < 1000:
-                        requests.append(
-                            {
-                                "updateSheetProperties": {
-                                    "properties": {
-                                        "sheetId": sheet_id,
-                                        "gridProperties": {
-                                            "rowCount": 1000,
-                                        },
+                # Ensure minimum rows (1000) for better UX
+                if grid_props.get("rowCount", 0) < self.MIN_SHEET_ROWS:
+                    requests.append(
+                        {
+                            "updateSheetProperties": {
+                                "properties": {
+                                    "sheetId": sheet_id,
+                                    "gridProperties": {
+                                        "rowCount": self.MIN_SHEET_ROWS,
                                     },
-                                    "fields": "gridProperties(rowCount)",
-                                }
+                                },
+                                "fields": "gridProperties(rowCount)",
                             }
-                        )
+                        }
+                    )
+                    grid_props["rowCount"] = self.MIN_SHEET_ROWS
 
+                if requests:
                     self.sheets_service.spreadsheets().batchUpdate(
                         spreadsheetId=spreadsheet_id, body={"requests": requests}
                     ).execute()
@@ -644,6 +1212,8 @@ class GoogleDriveStorage(Storage):
         # Update cache
         if file.get("id"):
             self.file_cache[path] = file
+            self._index_file(parent_id, filename, file)
+            self._set_snapshot(path, file["id"], df, sheet)
 
         return file.get("webViewLink")
 
@@ -651,6 +1221,85 @@ class GoogleDriveStorage(Storage):
         # _get_parent_id creates directories as side effect
         self._get_parent_id(os.path.join(path, "dummy"))
 
+    def ensure_directories(self, paths: list[str]) -> None:
+        """
+        Creates the missing folders in one batch and lists the existing ones
+        (that are not listed yet) in another, instead of one request each.
+        """
+        folders: dict[str, tuple[str, str]] = {}
+        for path in paths:
+            parts = [
+                p
+                for p in Path(path).parts
+                if p not in (".", "youtube-to-docs-artifacts")
+            ]
+            if parts:
+                # Parent folders are resolved (and listed) as usual
+                folders[path] = (self._get_parent_id(path), parts[-1])
+
+        # Other threads wait while these folders are found or created
+        keys = [
+            ("folder", f"{parent_id}/{name}") for parent_id, name in folders.values()
+        ]
+        with self.folder_locks.all(keys):
+            missing: dict[str, tuple[str, str]] = {}
+            for path, (parent_id, name) in folders.items():
+                if f"{parent_id}/{name}" in self.folder_cache:
+                    continue
+                folder = self._list_folder(parent_id).get(name)
+                if folder and folder.get("mimeType") == FOLDER_MIME_TYPE:
+                    self.folder_cache[f"{parent_id}/{name}"] = folder["id"]
+                elif (parent_id, name) not in missing.values():
+                    missing[path] = (parent_id, name)
+
+            created = self._execute_batch(
+                {
+                    path: self.service.files().create(
+                        body={
+                            "name": name,
+                            "mimeType": FOLDER_MIME_TYPE,
+                            "parents": [parent_id],
+                        },
+                        fields="id",
+                    )
+                    for path, (parent_id, name) in missing.items()
+                }
+            )
+            for path, (parent_id, name) in missing.items():
+                folder = created.get(path)
+                if not isinstance(folder, dict) or not folder.get("id"):
+                    # Retry the failed ones one request at a time (only the
+                    # locks held here are taken, so threads cannot deadlock)
+                    self.folder_cache[f"{parent_id}/{name}"] = (
+                        self._find_or_create_folder(parent_id, name)
+                    )
+                    continue
+                # A new folder is empty, so it does not need to be listed
+                self._set_listing(folder["id"], {})
+                self._index_file(
+                    parent_id, name, {"id": folder["id"], "mimeType": FOLDER_MIME_TYPE}
+                )
+                self.folder_cache[f"{parent_id}/{name}"] = folder["id"]
+
+        unlisted = {
+            self.folder_cache[f"{parent_id}/{name}"]
+            for parent_id, name in folders.values()
+            if f"{parent_id}/{name}" in self.folder_cache
+        } - set(self.folder_listings)
+        listed = self._execute_batch(
+            {folder_id: self._list_request(folder_id) for folder_id in unlisted}
+        )
+        for folder_id, results in listed.items():
+            # Folders with more than one page are listed in full when needed
+            if isinstance(results, dict) and not results.get("nextPageToken"):
+                listing: dict[str, dict] = {}
+                for file in results.get("files", []):
+                    listing.setdefault(file["name"], file)
+                with self.lock:
+                    # Keep a listing another thread made (and wrote to) meanwhile
+                    if folder_id not in self.folder_listings:
+                        self._set_listing(folder_id, listing)
+
     def upload_file(
         self, local_path: str, target_path: str, content_type: Optional[str] = None
     ) -> str:
@@ -685,6 +1334,7 @@ class GoogleDriveStorage(Storage):
         # Update cache
         if file.get("id"):
             self.file_cache[target_path] = file
+            self._index_file(parent_id, filename, file)
 
         return file.get("webViewLink")
 
@@ -753,12 +1403,49 @@ class M365Storage(Storage):
     TOKEN_CACHE_FILE = Path.home() / ".msal_token_cache.json"
     SCOPES = ["Files.ReadWrite"]
     ROOT_FOLDER_NAME = "youtube-to-docs-artifacts"
+    # Graph endpoint; the GRAPH_BASE_URL environment variable overrides it
+    # (e.g. to run against a local Graph stand-in)
+    GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
+    # Maximum number of requests in a single Graph JSON $batch call
+    GRAPH_BATCH_SIZE = 20
+    # Folder listings kept across runs, refreshed with a Graph delta query
+    ID_CACHE_FILE = Path.home() / ".youtube_to_docs_graph_cache.json"
 
     def __init__(self):
+        # Video workers share the storage: lock guards the caches below (never
+        # held during an API call) and folder_locks serialise listing and
+        # creating the same folder
+        self.lock = threading.RLock()
+        self.folder_locks = _KeyedLocks()
+        self.graph_base_url = os.environ.get(
+            "GRAPH_BASE_URL", self.GRAPH_BASE_URL
+        ).rstrip("/")
         self.token = self._get_access_token()
         # Cache for folder paths to avoid constant lookups
         # Map path (relative to root) to webUrl or item metadata
         self.item_cache: dict[str, dict] = {}
+        # Contents of each folder listed so far (remote folder -> lowercase
+        # name -> item), kept up to date by writes, so existence checks need no
+        # API call
+        self.folder_listings: dict[str, dict[str, dict]] = {}
+        # Last saved (or loaded) state of each manifest workbook (path -> dict),
+        # used to patch only the rows that changed
+        self.workbook_snapshots: dict[str, dict] = {}
+
+        # Folder listings from earlier runs are brought up to date with one
+        # delta query instead of being listed again
+        self.delta_link: Optional[str] = None
+        cached = _load_id_cache(self.ID_CACHE_FILE, self.graph_base_url)
+        if cached.get("delta_link"):
+            self.folder_listings = cached.get("listings", {})
+            self.delta_link = cached["delta_link"]
+            if not self._sync_delta():
+                self.folder_listings = {}
+                self.delta_link = None
+        if self.delta_link is None:
+            # Taken before anything is listed, so later changes are not missed
+            self.delta_link = self._latest_delta_link()
+        atexit.register(self._save_id_cache)
 
     def _get_client_config(self) -> dict:
         if not self.CLIENT_CONFIG_FILE.exists():
@@ -853,7 +1540,7 @@ class M365Storage(Storage):
         # 2. Make URL safe
         encoded_url = "u!" + b64.rstrip("=").replace("/", "_").replace("+", "-")
 
-        api_url = f"https://graph.microsoft.com/v1.0/shares/{encoded_url}/driveItem"
+        api_url = f"{self.graph_base_url}/shares/{encoded_url}/driveItem"
         headers = {"Authorization": f"Bearer {self.token}"}
 
         try:
@@ -865,6 +1552,193 @@ class M365Storage(Storage):
 
         return None
 
+    def _latest_delta_link(self) -> Optional[str]:
+        try:
+            resp = requests.get(
+                f"{self.graph_base_url}/me/drive/root/delta",
+                headers={"Authorization": f"Bearer {self.token}"},
+                params={"token": "latest"},
+            )
+            resp.raise_for_status()
+            return resp.json().get("@odata.deltaLink")
+        except Exception as e:
+            print(f"Warning: Could not get a Graph delta link: {e}")
+            return None
+
+    def _sync_delta(self) -> bool:
+        """
+        Applies the drive changes since the persisted delta link to the cached
+        folder listings. Returns False if the cache cannot be trusted (e.g. the
+        delta token expired and Graph asks for a full resync).
+        """
+        url = self.delta_link
+        headers = {"Authorization": f"Bearer {self.token}"}
+        items, folders = self._index_listings()
+        try:
+            while url:
+                resp = requests.get(url, headers=headers)
+                if not resp.ok:
+                    return False
+                data = resp.json()
+                for item in data.get("value", []):
+                    if not self._apply_delta_item(item, items, folders):
+                        return False
+                if data.get("@odata.deltaLink"):
+                    self.delta_link = data["@odata.deltaLink"]
+                    break
+                url = data.get("@odata.nextLink")
+        except Exception as e:
+            print(f"Warning: Could not sync Graph delta: {e}")
+            return False
+        return True
+
+    def _index_listings(
+        self,
+    ) -> tuple[dict[str, tuple[str, str]], dict[str, str]]:
+        """
+        Returns where each listed item is (item id -> (folder, lowercase
+        name)) and the path of each known folder (folder id -> remote path),
+        taken from the folders in the listings and the parents of listed items.
+        """
+        items: dict[str, tuple[str, str]] = {}
+        folders: dict[str, str] = {}
+        for folder, listing in self.folder_listings.items():
+            for key, item in listing.items():
+                if item.get("id"):
+                    items[item["id"]] = (folder, key)
+                    if "folder" in item:
+                        folders[item["id"]] = f"{folder}/{item['name']}"
+                parent_id = item.get("parentReference", {}).get("id")
+                if parent_id:
+                    folders[parent_id] = folder
+        return items, folders
+
+    def _apply_delta_item(
+        self,
+        item: dict,
+        items: dict[str, tuple[str, str]],
+        folders: dict[str, str],
+    ) -> bool:
+        """
+        Applies one changed drive item to the cached listings, keeping the
+        indexes from _index_listings up to date. Delta items carry their
+        parent's id but not its path, so the parent is resolved by id.
+        Returns False if a deleted folder cannot be located in the listings.
+        """
+        item_id = item.get("id")
+        old_path = None
+        if item_id in items:
+            folder, key = items.pop(item_id)
+            listing = self.folder_listings.get(folder, {})
+            if listing.get(key, {}).get("id") == item_id:
+                old_path = f"{folder}/{listing.pop(key)['name']}"
+
+        new_path = None
+        if "deleted" not in item and "root" not in item and item.get("name"):
+            parent_id = item.get("parentReference", {}).get("id")
+            folder = folders.get(parent_id)
+            if folder is None:
+                # Any listing of a folder whose id is unknown may be the parent
+                for unknown in set(self.folder_listings) - set(folders.values()):
+                    del self.folder_listings[unknown]
+            else:
+                new_path = f"{folder}/{item['name']}"
+                self._index_item(new_path, item)
+                if folder in self.folder_listings:
+                    items[item_id] = (folder, item["name"].lower())
+
+        if "folder" in item or "deleted" in item:
+            if old_path is None and "deleted" in item and "folder" in item:
+                return False
+            # A moved, renamed or deleted folder takes its listings with it
+            if old_path is not None and old_path != new_path:
+                for folder in list(self.folder_listings):
+                    if folder == old_path or folder.startswith(f"{old_path}/"):
+                        del self.folder_listings[folder]
+                for folder_id, path in list(folders.items()):
+                    if path == old_path or path.startswith(f"{old_path}/"):
+                        del folders[folder_id]
+            if "folder" in item and new_path is not None:
+                folders[item_id] = new_path
+        return True
+
+    @_synchronized
+    def _save_id_cache(self) -> None:
+        """Persists the folder listings for the next run."""
+        if not self.delta_link:
+            return
+        # Download URLs expire, so they are not kept across runs
+        listings = {
+            folder: {
+                name: {
+                    k: v for k, v in item.items() if k != "@microsoft.graph.downloadUrl"
+                }
+                for name, item in listing.items()
+            }
+            for folder, listing in self.folder_listings.items()
+        }
+        try:
+            _save_id_cache(
+                self.ID_CACHE_FILE,
+                self.graph_base_url,
+                {"delta_link": self.delta_link, "listings": listings},
+            )
+        except Exception as e:
+            print(f"Warning: Could not save the Graph ID cache: {e}")
+
+    def _list_folder(self, remote_folder: str) -> Optional[dict[str, dict]]:
+        """
+        Returns the items in remote_folder by lowercase name (OneDrive names are
+        case-insensitive). Each folder is listed (page by page) once; later
+        lookups, also in later runs, use the listing. A missing folder is
+        empty. Returns None if the folder cannot be listed.
+        """
+        listing = self.folder_listings.get(remote_folder)
+        if listing is not None:
+            return listing
+        with self.folder_locks(("list", remote_folder)):
+            # Another thread may have listed it in the meantime
+            listing = self.folder_listings.get(remote_folder)
+            if listing is not None:
+                return listing
+            return self._fetch_listing(remote_folder)
+
+    def _fetch_listing(self, remote_folder: str) -> Optional[dict[str, dict]]:
+        headers = {"Authorization": f"Bearer {self.token}"}
+        url = f"{self.graph_base_url}/me/drive/root:/{quote(remote_folder)}:/children"
+        params: Optional[dict] = {"$top": 999}
+        listing: dict[str, dict] = {}
+        while url:
+            try:
+                resp = requests.get(url, headers=headers, params=params)
+            except Exception as e:
+                print(f"Warning: Failed to list {remote_folder}: {e}")
+                return None
+            if resp.status_code == 404:
+                break
+            if not resp.ok:
+                return None
+            data = resp.json()
+            for item in data.get("value", []):
+                listing.setdefault(item["name"].lower(), item)
+            # The next link already carries the query parameters
+            url = data.get("@odata.nextLink")
+            params = None
+
+        with self.lock:
+            self.folder_listings.setdefault(remote_folder, listing)
+            return self.folder_listings[remote_folder]
+
+    @_synchronized
+    def _index_item(self, remote_path: str, item: dict) -> None:
+        """Records a written item in the listing of its folder."""
+        if "/" not in remote_path:
+            return
+        folder, name = remote_path.rsplit("/", 1)
+        listing = self.folder_listings.get(folder)
+        if listing is not None:
+            listing[item.get("name", name).lower()] = item
+
     def _get_item(self, path: str) -> Optional[dict]:
         """Gets item metadata from Graph API."""
         if path.startswith("http"):
@@ -876,15 +1750,34 @@ class M365Storage(Storage):
 
         # Handle special case: csv file might be stored as xlsx
         filename = Path(path).name
+
+        # Answer from the listing of the parent folder when possible
+        if "/" in remote_path:
+            folder, name = remote_path.rsplit("/", 1)
+            if filename == "youtube-docs.csv":
+                names = [Path(name).with_suffix(".xlsx").name]
+            elif path.endswith(".md"):
+                names = [name, Path(name).with_suffix(".docx").name]
+            else:
+                names = [name]
+            listing = self._list_folder(folder)
+            if listing is not None:
+                for candidate in names:
+                    item = listing.get(candidate.lower())
+                    if item:
+                        self.item_cache[remote_path] = item
+                        return item
+                return None
+
         if filename == "youtube-docs.csv":
             # Check for .xlsx version
             xlsx_path = str(Path(path).with_suffix(".xlsx"))
             remote_xlsx_path = self._get_full_remote_path(xlsx_path)
             encoded_xlsx = quote(remote_xlsx_path)
-            url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{encoded_xlsx}"
+            url = f"{self.graph_base_url}/me/drive/root:/{encoded_xlsx}"
         else:
             encoded_remote = quote(remote_path)
-            url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{encoded_remote}"
+            url = f"{self.graph_base_url}/me/drive/root:/{encoded_remote}"
 
         headers = {"Authorization": f"Bearer {self.token}"}
         resp = requests.get(url, headers=headers)
@@ -899,9 +1792,7 @@ class M365Storage(Storage):
                 docx_path = str(Path(path).with_suffix(".docx"))
                 remote_docx_path = self._get_full_remote_path(docx_path)
                 encoded_docx = quote(remote_docx_path)
-                url_docx = (
-                    f"https://graph.microsoft.com/v1.0/me/drive/root:/{encoded_docx}"
-                )
+                url_docx = f"{self.graph_base_url}/me/drive/root:/{encoded_docx}"
                 resp_docx = requests.get(url_docx, headers=headers)
                 if resp_docx.status_code == 200:
                     data = resp_docx.json()
@@ -927,9 +1818,7 @@ class M365Storage(Storage):
         download_url = item.get("@microsoft.graph.downloadUrl")
         if not download_url:
             item_id = item["id"]
-            download_url = (
-                f"https://graph.microsoft.com/v1.0/me/drive/items/{item_id}/content"
-            )
+            download_url = f"{self.graph_base_url}/me/drive/items/{item_id}/content"
 
         resp = requests.get(download_url)
         resp.raise_for_status()
@@ -961,9 +1850,7 @@ class M365Storage(Storage):
         download_url = item.get("@microsoft.graph.downloadUrl")
         if not download_url:
             item_id = item["id"]
-            download_url = (
-                f"https://graph.microsoft.com/v1.0/me/drive/items/{item_id}/content"
-            )
+            download_url = f"{self.graph_base_url}/me/drive/items/{item_id}/content"
 
         resp = requests.get(download_url)
         resp.raise_for_status()
@@ -971,7 +1858,10 @@ class M365Storage(Storage):
 
     def _upload(self, remote_path: str, content: bytes, content_type: str) -> dict:
         encoded_path = quote(remote_path)
-        url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{encoded_path}:/content?@microsoft.graph.conflictBehavior=replace"
+        url = (
+            f"{self.graph_base_url}/me/drive/root:/{encoded_path}:/content"
+            "?@microsoft.graph.conflictBehavior=replace"
+        )
         headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": content_type,
@@ -979,7 +1869,9 @@ class M365Storage(Storage):
         resp = requests.put(url, headers=headers, data=content)
         if not resp.ok:
             raise RuntimeError(f"Upload failed ({resp.status_code}): {resp.text}")
-        return resp.json()
+        item = resp.json()
+        self._index_item(remote_path, item)
+        return item
 
     def write_text(self, path: str, content: str) -> str:
         filename = Path(path).name
@@ -1046,17 +1938,211 @@ class M365Storage(Storage):
             xlsx_path = str(Path(path).with_suffix(".xlsx"))
             try:
                 xlsx_bytes = self.read_bytes(xlsx_path)
-                return pl.read_excel(io.BytesIO(xlsx_bytes))
+                df = pl.read_excel(io.BytesIO(xlsx_bytes))
             except FileNotFoundError:
                 return None
             except Exception as e:
                 print(f"Error loading dataframe from OneDrive: {e}")
                 return None
+            item = self._get_item(xlsx_path)
+            if item and "id" in item:
+                self._set_workbook_snapshot(path, item, df)
+            return df
         return None
 
-    def save_dataframe(self, df: pl.DataFrame, path: str) -> str:
+    def _set_workbook_snapshot(
+        self,
+        path: str,
+        item: dict,
+        df: pl.DataFrame,
+        worksheet: Optional[str] = None,
+    ) -> None:
+        previous = self.workbook_snapshots.get(path, {})
+        if previous.get("item_id") != item["id"]:
+            previous = {}
+        self.workbook_snapshots[path] = {
+            "item_id": item["id"],
+            "web_url": item.get("webUrl", ""),
+            "columns": list(df.columns),
+            "urls": df["URL"].to_list() if "URL" in df.columns else None,
+            "values": _sheet_values(df),
+            "worksheet": worksheet or previous.get("worksheet"),
+        }
+
+    def _graph_batch(
+        self, graph_requests: list[dict], sequential: bool = True
+    ) -> list[dict]:
+        """
+        Sends requests ({"method", "url", "body"}) through Graph JSON batching,
+        GRAPH_BATCH_SIZE per call, and returns their responses in order.
+        Sequential requests run in order (each one depends on the previous
+        request of its batch) and a failed request raises; otherwise the
+        requests are independent and failures are left to the caller.
+        """
+        responses: list[dict] = []
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        }
+        for start in range(0, len(graph_requests), self.GRAPH_BATCH_SIZE):
+            batch = []
+            chunk = graph_requests[start : start + self.GRAPH_BATCH_SIZE]
+            for k, request in enumerate(chunk, 1):
+                entry = {
+                    "id": str(k),
+                    "method": request["method"],
+                    "url": request["url"],
+                }
+                if "body" in request:
+                    entry["body"] = request["body"]
+                    entry["headers"] = {"Content-Type": "application/json"}
+                if sequential and k > 1:
+                    entry["dependsOn"] = [str(k - 1)]
+                batch.append(entry)
+
+            resp = requests.post(
+                f"{self.graph_base_url}/$batch",
+                headers=headers,
+                json={"requests": batch},
+            )
+            if not resp.ok:
+                raise RuntimeError(f"Batch failed ({resp.status_code}): {resp.text}")
+            by_id = {r.get("id"): r for r in resp.json().get("responses", [])}
+            for k in range(1, len(chunk) + 1):
+                response = by_id.get(str(k), {"id": str(k), "status": 500})
+                if sequential and response.get("status", 500) >= 400:
+                    raise RuntimeError(
+                        f"Batch request {response.get('id')} failed "
+                        f"({response.get('status')}): {response.get('body')}"
+                    )
+                responses.append(response)
+        return responses
+
+    def _upsert_workbook(self, df: pl.DataFrame, path: str) -> Optional[str]:
+        """
+        Patches only the rows and columns that changed since the last save
+        through the Graph workbook range API, batched with $batch. New rows
+        and columns are inserted in place so the workbook keeps the manifest
+        order. Returns None (without writing) if the change cannot be expressed
+        as inserts and updates, e.g. when rows were removed or reordered.
+        """
+        snapshot = self.workbook_snapshots.get(path)
+        if not snapshot or not snapshot["urls"] or "URL" not in df.columns:
+            return None
+        item_id = snapshot["item_id"]
+
+        new_columns = list(df.columns)
+        new_urls = df["URL"].to_list()
+        column_inserts = _insert_positions(snapshot["columns"], new_columns)
+        row_inserts = _insert_positions(snapshot["urls"], new_urls)
+        if column_inserts is None or row_inserts is None:
+            return None
+
+        # Previous values aligned to the new columns and rows ("" for inserts)
+        old_columns = {c: i for i, c in enumerate(snapshot["columns"])}
+        old_rows = dict(zip(snapshot["urls"], snapshot["values"]))
+        new_values = _sheet_values(df)
+        changed_rows = []
+        for i, (url, values) in enumerate(zip(new_urls, new_values)):
+            old = old_rows.get(url)
+            old_aligned = [
+                old[old_columns[c]] if old is not None and c in old_columns else ""
+                for c in new_columns
+            ]
+            if old_aligned != values:
+                changed_rows.append(i)
+
+        if not changed_rows and not column_inserts:
+            return snapshot["web_url"]
+
+        worksheet = snapshot["worksheet"]
+        if not worksheet:
+            resp = requests.get(
+                f"{self.graph_base_url}/me/drive/items/{item_id}/workbook/worksheets",
+                headers={"Authorization": f"Bearer {self.token}"},
+                params={"$select": "name", "$top": 1},
+            )
+            resp.raise_for_status()
+            worksheets = resp.json().get("value", [])
+            if not worksheets:
+                return None
+            worksheet = worksheets[0]["name"]
+            snapshot["worksheet"] = worksheet
+
+        sheet_url = f"/me/drive/items/{item_id}/workbook/worksheets/{quote(worksheet)}"
+
+        def range_url(address: str) -> str:
+            return f"{sheet_url}/range(address='{address}')"
+
+        # Insert blank columns/rows where new ones appear (left to right and
+        # top to bottom, so each index already accounts for previous inserts)
+        graph_requests: list[dict] = []
+        for index in column_inserts:
+            letter = _column_letter(index)
+            graph_requests.append(
+                {
+                    "method": "POST",
+                    "url": range_url(f"{letter}:{letter}") + "/insert",
+                    "body": {"shift": "Right"},
+                }
+            )
+        for index in row_inserts:
+            graph_requests.append(
+                {
+                    "method": "POST",
+                    "url": range_url(f"{index + 2}:{index + 2}") + "/insert",
+                    "body": {"shift": "Down"},
+                }
+            )
+
+        # Write the header (if columns changed) and each run of changed rows
+        rows = list(df.iter_rows())
+        last_column = _column_letter(len(new_columns) - 1)
+        if column_inserts:
+            graph_requests.append(
+                {
+                    "method": "PATCH",
+                    "url": range_url(f"A1:{last_column}1"),
+                    "body": {"values": [new_columns]},
+                }
+            )
+        start = None
+        for k, i in enumerate(changed_rows):
+            if start is None:
+                start = i
+            if k + 1 == len(changed_rows) or changed_rows[k + 1] != i + 1:
+                graph_requests.append(
+                    {
+                        "method": "PATCH",
+                        "url": range_url(f"A{start + 2}:{last_column}{i + 2}"),
+                        "body": {
+                            "values": [
+                                [_json_cell(v) for v in row]
+                                for row in rows[start : i + 1]
+                            ]
+                        },
+                    }
+                )
+                start = None
+
+        self._graph_batch(graph_requests)
+
+        self.workbook_snapshots[path].update(
+            columns=new_columns, urls=new_urls, values=new_values
+        )
+        return snapshot["web_url"]
+
+    def save_dataframe(self, df: pl.DataFrame, path: str, final: bool = True) -> str:
         filename = Path(path).name
         if filename == "youtube-docs.csv":
+            # Only patch what changed since the last save when possible
+            try:
+                link = self._upsert_workbook(df, path)
+                if link is not None:
+                    return link
+            except Exception as e:
+                print(f"Warning: Incremental workbook update failed, re-uploading: {e}")
+
             xlsx_path = str(Path(path).with_suffix(".xlsx"))
             remote_path = self._get_full_remote_path(xlsx_path)
 
@@ -1072,6 +2158,8 @@ class M365Storage(Storage):
 
             self.item_cache[self._get_full_remote_path(path)] = item
             self.item_cache[remote_path] = item
+            if "id" in item:
+                self._set_workbook_snapshot(path, item, df)
 
             return item.get("webUrl", "")
 
@@ -1093,40 +2181,137 @@ class M365Storage(Storage):
 
             if current_path in self.item_cache:
                 continue
+            # One thread finds or creates the folder, the others wait for it
+            with self.folder_locks(("folder", current_path)):
+                if current_path not in self.item_cache:
+                    self._find_or_create_folder(current_path, part)
+
+    def _find_or_create_folder(self, current_path: str, part: str) -> None:
+        """Looks up the folder current_path (named part), creating it if missing."""
+        # Folders already in a (cached) listing need no lookup
+        parent_path = current_path.rpartition("/")[0]
+        listed = self.folder_listings.get(parent_path, {}).get(part.lower())
+        if listed and "folder" in listed:
+            self.item_cache[current_path] = listed
+            return
+
+        encoded_current = quote(current_path)
+        url = f"{self.graph_base_url}/me/drive/root:/{encoded_current}"
+        resp = requests.get(url, headers={"Authorization": f"Bearer {self.token}"})
+        if resp.status_code == 200:
+            self.item_cache[current_path] = resp.json()
+            return
 
-            encoded_current = quote(current_path)
-            url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{encoded_current}"
-            resp = requests.get(url, headers={"Authorization": f"Bearer {self.token}"})
+        if not parent_path:
+            post_url = f"{self.graph_base_url}/me/drive/root/children"
+        else:
+            post_url = (
+                f"{self.graph_base_url}/me/drive/root:/{quote(parent_path)}:/children"
+            )
+        body = {
+            "name": part,
+            "folder": {},
+            "@microsoft.graph.conflictBehavior": "rename",
+        }
+        resp_create = requests.post(
+            post_url,
+            headers={"Authorization": f"Bearer {self.token}"},
+            json=body,
+        )
+        if resp_create.status_code in (200, 201):
+            self.item_cache[current_path] = resp_create.json()
+            self._index_item(current_path, resp_create.json())
+            # A new folder is empty, so it does not need to be listed
+            self.folder_listings[current_path] = {}
+        elif resp_create.status_code != 409:
+            print(
+                f"Warning: Could not create folder {current_path}: {resp_create.text}"
+            )
 
-            if resp.status_code == 200:
-                self.item_cache[current_path] = resp.json()
+    def ensure_directories(self, paths: list[str]) -> None:
+        """
+        Creates the missing folders and lists the existing ones (that are not
+        listed yet) through Graph $batch instead of one request each.
+        """
+        folders: dict[str, tuple[str, str]] = {}
+        for path in paths:
+            remote_path = self._get_full_remote_path(path)
+            if "/" in remote_path:
+                folders[remote_path] = tuple(remote_path.rsplit("/", 1))
             else:
-                parent_path = current_path.rsplit("/", 1)[0]
-                if parent_path == current_path:
-                    post_url = "https://graph.microsoft.com/v1.0/me/drive/root/children"
-                else:
-                    encoded_parent = quote(parent_path)
-                    post_url = f"https://graph.microsoft.com/v1.0/me/drive/root:/{encoded_parent}:/children"
+                self.ensure_directory(path)
+        for parent, _ in folders.values():
+            # Parent folders are resolved (and listed) as usual
+            self.ensure_directory(parent)
 
-                body = {
-                    "name": part,
-                    "folder": {},
-                    "@microsoft.graph.conflictBehavior": "rename",
-                }
-                resp_create = requests.post(
-                    post_url,
-                    headers={"Authorization": f"Bearer {self.token}"},
-                    json=body,
+        # Other threads wait while these folders are found or created
+        with self.folder_locks.all([("folder", p) for p in folders]):
+            self._batch_directories(folders)
+
+    def _batch_directories(self, folders: dict[str, tuple[str, str]]) -> None:
+        graph_requests: list[dict] = []
+        pending: list[tuple[str, str]] = []
+        for remote_path, (parent, name) in folders.items():
+            listing = self._list_folder(parent)
+            if listing is None:
+                # The parent cannot be listed, so check one folder at a time
+                if remote_path not in self.item_cache:
+                    self._find_or_create_folder(remote_path, name)
+                continue
+            folder = listing.get(name.lower())
+            if folder is None:
+                graph_requests.append(
+                    {
+                        "method": "POST",
+                        "url": f"/me/drive/root:/{quote(parent)}:/children",
+                        "body": {
+                            "name": name,
+                            "folder": {},
+                            "@microsoft.graph.conflictBehavior": "rename",
+                        },
+                    }
                 )
-                if resp_create.status_code in (200, 201):
-                    self.item_cache[current_path] = resp_create.json()
-                elif resp_create.status_code == 409:
-                    pass
+                pending.append(("create", remote_path))
+                continue
+            self.item_cache[remote_path] = folder
+            if remote_path not in self.folder_listings:
+                graph_requests.append(
+                    {
+                        "method": "GET",
+                        "url": f"/me/drive/root:/{quote(remote_path)}:/children"
+                        "?$top=999",
+                    }
+                )
+                pending.append(("list", remote_path))
+
+        if not graph_requests:
+            return
+        try:
+            responses = self._graph_batch(graph_requests, sequential=False)
+        except Exception as e:
+            print(f"Warning: Batched folder lookup failed: {e}")
+            responses = [{"status": 500}] * len(graph_requests)
+
+        for (action, remote_path), response in zip(pending, responses):
+            status = response.get("status", 500)
+            body = response.get("body") or {}
+            if action == "create":
+                if status in (200, 201):
+                    self.item_cache[remote_path] = body
+                    self._index_item(remote_path, body)
+                    # A new folder is empty, so it does not need to be listed
+                    self.folder_listings[remote_path] = {}
                 else:
-                    print(
-                        f"Warning: Could not create folder {current_path}: "
-                        f"{resp_create.text}"
-                    )
+                    # Only the locks held here are taken, so no deadlock
+                    self._find_or_create_folder(remote_path, folders[remote_path][1])
+            elif status == 200 and not body.get("@odata.nextLink"):
+                # Folders with more than one page are listed in full when needed
+                listing = {}
+                for item in body.get("value", []):
+                    listing.setdefault(item["name"].lower(), item)
+                with self.lock:
+                    # Keep a listing another thread made (and wrote to) meanwhile
+                    self.folder_listings.setdefault(remote_path, listing)
 
     def upload_file(
         self, local_path: str, target_path: str, content_type: Optional[str] = None
@@ -1205,7 +2390,7 @@ class NullStorage(Storage):
     def load_dataframe(self, path: str) -> Optional[pl.DataFrame]:
         return None
 
-    def save_dataframe(self, df: pl.DataFrame, path: str) -> str:
+    def save_dataframe(self, df: pl.DataFrame, path: str, final: bool = True) -> str:
         return ""
 
     def ensure_directory(self, path: str) -> None:
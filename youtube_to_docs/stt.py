@@ -0,0 +1,266 @@
+"""
+Chunked speech-to-text for long audio.
+
+A multi-hour recording sent as one request is slow, can exceed the model's
+output limit and cannot be parallelised. The audio is instead cut into
+windows of about `chunk_seconds`, preferably in a silence near each cut so
+no word is split, with `overlap_seconds` of extra audio on both sides of every
+cut. The windows are transcribed concurrently as SRT and the cues are merged
+back onto the original timeline: each window only keeps the cues whose
+midpoint lies between its own cut points, which drops the copies transcribed
+in the overlaps.
+"""
+
+import os
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from youtube_to_docs.llms import generate_transcript
+from youtube_to_docs.transcript import format_srt_timestamp
+from youtube_to_docs.utils import ErrorText, is_error_text, parse_srt, srt_to_text
+
+DEFAULT_CHUNK_MINUTES = 10
+DEFAULT_OVERLAP_SECONDS = 5
+DEFAULT_STT_WORKERS = 4
+
+# A cut is moved to the silence nearest to it within this many seconds
+SILENCE_SEARCH_SECONDS = 30
+# Quieter than this for at least SILENCE_MIN_SECONDS counts as silence
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_SECONDS = 0.5
+
+Cue = Tuple[float, float, str]
+Transcriber = Callable[..., Tuple[str, int, int]]
+
+
+def _ffmpeg_paths() -> Optional[Tuple[str, str]]:
+    """Returns (ffmpeg, ffprobe), or None if static_ffmpeg is unavailable."""
+    try:
+        from static_ffmpeg import run
+
+        return run.get_or_fetch_platform_executables_else_raise()
+    except Exception as e:
+        print(f"Chunked STT unavailable, transcribing in one pass: {e}")
+        return None
+
+
+def probe_duration(ffprobe: str, audio_path: str) -> float:
+    """Returns the duration of audio_path in seconds."""
+    result = subprocess.run(
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            audio_path,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout.strip())
+
+
+def detect_silences(ffmpeg: str, audio_path: str) -> List[Tuple[float, float]]:
+    """Returns the (start, end) seconds of the silences in audio_path."""
+    result = subprocess.run(
+        [
+            ffmpeg,
+            "-hide_banner",
+            "-nostats",
+            "-i",
+            audio_path,
+            "-af",
+            f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}",
+            "-f",
+            "null",
+            "-",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    starts = re.findall(r"silence_start: (-?[\d.]+)", result.stderr)
+    ends = re.findall(r"silence_end: ([\d.]+)", result.stderr)
+    return [(max(0.0, float(s)), float(e)) for s, e in zip(starts, ends)]
+
+
+def plan_windows(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    chunk_seconds: float,
+    overlap_seconds: float,
+) -> List[Tuple[float, float, float, float]]:
+    """
+    Splits [0, duration] into windows of about chunk_seconds. Returns
+    (start, end, keep_start, keep_end) per window: the audio to transcribe
+    (extended by overlap_seconds past each cut) and the span whose cues the
+    window contributes to the merged transcript.
+    """
+    search = min(SILENCE_SEARCH_SECONDS, chunk_seconds / 4)
+    cuts = [0.0]
+    while duration - cuts[-1] > chunk_seconds:
+        target = cuts[-1] + chunk_seconds
+        candidates = [
+            (start + end) / 2
+            for start, end in silences
+            if abs((start + end) / 2 - target) <= search
+        ]
+        cut = min(candidates, key=lambda c: abs(c - target)) if candidates else target
+        cuts.append(cut)
+    cuts.append(duration)
+
+    windows = []
+    for keep_start, keep_end in zip(cuts, cuts[1:]):
+        start = max(0.0, keep_start - overlap_seconds)
+        end = min(duration, keep_end + overlap_seconds)
+        windows.append((start, end, keep_start, keep_end))
+    return windows
+
+
+def extract_window(
+    ffmpeg: str, audio_path: str, start: float, end: float, output_path: str
+) -> None:
+    """Copies [start, end] seconds of audio_path to output_path."""
+    subprocess.run(
+        [
+            ffmpeg,
+            "-y",
+            "-ss",
+            f"{start:.3f}",
+            "-i",
+            audio_path,
+            "-t",
+            f"{end - start:.3f}",
+            "-vn",
+            "-c",
+            "copy",
+            output_path,
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def merge_cues(
+    windows: List[Tuple[float, float, float, float]], window_cues: List[List[Cue]]
+) -> List[Cue]:
+    """
+    Shifts each window's cues onto the original timeline and keeps the ones
+    whose midpoint lies in the window's keep span, so overlaps appear once.
+    """
+    merged: List[Cue] = []
+    last = len(windows) - 1
+    for i, ((start, _, keep_start, keep_end), cues) in enumerate(
+        zip(windows, window_cues)
+    ):
+        for cue_start, cue_end, text in cues:
+            cue_start += start
+            cue_end += start
+            middle = (cue_start + cue_end) / 2
+            if middle < keep_start or (middle >= keep_end and i != last):
+                continue
+            merged.append((cue_start, cue_end, text))
+    return merged
+
+
+def format_srt(cues: List[Cue]) -> str:
+    """Formats (start, end, text) cues as SRT."""
+    entries = []
+    for i, (start, end, text) in enumerate(cues, 1):
+        entries.append(
+            f"{i}\n{format_srt_timestamp(start)} --> {format_srt_timestamp(end)}\n"
+            f"{text}\n"
+        )
+    return "\n".join(entries)
+
+
+def transcribe_audio(
+    model_name: str,
+    audio_path: str,
+    url: str,
+    language: str = "en",
+    transcribe: Optional[Transcriber] = None,
+    chunk_minutes: float = DEFAULT_CHUNK_MINUTES,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    workers: int = DEFAULT_STT_WORKERS,
+) -> Tuple[str, int, int]:
+    """
+    Transcribes audio_path as SRT, in concurrent overlapping windows when it
+    is longer than chunk_minutes (0 disables chunking).
+    Returns (srt, input_tokens, output_tokens) summed over the windows, or
+    the first window's error.
+    """
+    transcribe = transcribe or generate_transcript
+
+    def single_pass() -> Tuple[str, int, int]:
+        return transcribe(model_name, audio_path, url, language=language, srt=True)
+
+    chunk_seconds = chunk_minutes * 60
+    if chunk_seconds <= 0:
+        return single_pass()
+    paths = _ffmpeg_paths()
+    if paths is None:
+        return single_pass()
+    ffmpeg, ffprobe = paths
+
+    try:
+        duration = probe_duration(ffprobe, audio_path)
+    except Exception as e:
+        print(f"Could not read audio duration, transcribing in one pass: {e}")
+        return single_pass()
+    if duration <= chunk_seconds + overlap_seconds:
+        return single_pass()
+
+    try:
+        silences = detect_silences(ffmpeg, audio_path)
+    except Exception as e:
+        print(f"Silence detection failed, cutting at fixed offsets: {e}")
+        silences = []
+    windows = plan_windows(duration, silences, chunk_seconds, overlap_seconds)
+    print(
+        f"Transcribing {duration / 60:.0f} minutes of audio in "
+        f"{len(windows)} windows..."
+    )
+
+    ext = os.path.splitext(audio_path)[1] or ".m4a"
+    with tempfile.TemporaryDirectory(prefix="ytd-stt-") as tmp_dir:
+
+        def run(index: int) -> Tuple[str, int, int]:
+            start, end, _, _ = windows[index]
+            window_path = os.path.join(tmp_dir, f"window-{index:04d}{ext}")
+            try:
+                extract_window(ffmpeg, audio_path, start, end, window_path)
+            except subprocess.CalledProcessError as e:
+                return (
+                    ErrorText(f"Error: could not cut audio window {index}: {e}"),
+                    0,
+                    0,
+                )
+            return transcribe(model_name, window_path, url, language=language, srt=True)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="stt"
+        ) as executor:
+            results = list(executor.map(run, range(len(windows))))
+
+    input_tokens = sum(r[1] for r in results)
+    output_tokens = sum(r[2] for r in results)
+    window_cues = []
+    for (start, end, keep_start, keep_end), (text, _, _) in zip(windows, results):
+        if is_error_text(text):
+            return text, input_tokens, output_tokens
+        cues = parse_srt(text)
+        if not cues and text.strip():
+            # The model ignored the SRT format: the text covers the keep span
+            cues = [(keep_start - start, keep_end - start, srt_to_text(text))]
+        window_cues.append(cues)
+
+    return format_srt(merge_cues(windows, window_cues)), input_tokens, output_tokens
@@ -1,9 +1,24 @@
 """Helpers for YouTube metadata, audio extraction, and transcript retrieval."""
 
 import os
+import queue
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, cast
+import threading
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 import isodate
 from googleapiclient.discovery import build
@@ -16,6 +31,17 @@ from youtube_transcript_api import (
     YouTubeTranscriptApi,
 )
 
+from youtube_to_docs.ratelimit import acquire
+
+# Maximum number of IDs accepted by a single videos().list call (and the page
+# size of playlistItems().list)
+VIDEOS_PER_REQUEST = 50
+
+# In incremental mode, paging a channel's uploads stops after this many
+# consecutive items that are already in the manifest (or older than its newest
+# video)
+KNOWN_RUN_TO_STOP = 5
+
 
 def extract_audio(video_id: str, output_dir: str) -> Optional[str]:
     """Extracts audio from a YouTube video using yt-dlp."""
@@ -56,6 +82,137 @@ def extract_audio(video_id: str, output_dir: str) -> Optional[str]:
     return None
 
 
+class AudioPrefetcher:
+    """
+    Downloads audio for upcoming videos on a background thread so the download
+    of video N+1..N+k overlaps with the transcription of video N.
+    At most `lookahead` downloaded files wait to be used, and no new download
+    starts while the files on disk exceed `max_bytes` (a single file is always
+    allowed, so one oversized video cannot stall the pipeline).
+    """
+
+    def __init__(
+        self,
+        video_ids: Iterable[str],
+        output_dir: str,
+        lookahead: int = 2,
+        max_bytes: int = 2 * 1024**3,
+        extract: Callable[[str, str], Optional[str]] = extract_audio,
+        needs_audio: Optional[Callable[[str], bool]] = None,
+    ):
+        self.queue: Deque[str] = deque(video_ids)
+        self.output_dir = output_dir
+        self.lookahead = max(1, lookahead)
+        self.max_bytes = max_bytes
+        self.extract = extract
+        self.needs_audio = needs_audio
+
+        self.paths: Dict[str, Optional[str]] = {}
+        self.sizes: Dict[str, int] = {}
+        self.downloading: Set[str] = set()
+        self.ready: Set[str] = set()
+        self.used_bytes = 0
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(
+            target=self._run, name="audio-prefetch", daemon=True
+        )
+
+    def start(self) -> None:
+        """Starts downloading in the background."""
+        self.thread.start()
+
+    def add(self, video_ids: Iterable[str]) -> None:
+        """Queues more videos, e.g. as further playlist pages are resolved."""
+        with self.condition:
+            self.queue.extend(video_ids)
+            self.condition.notify_all()
+
+    def _has_capacity(self) -> bool:
+        in_use = len(self.ready) + len(self.downloading)
+        within_budget = self.used_bytes == 0 or self.used_bytes < self.max_bytes
+        return in_use < self.lookahead and within_budget
+
+    def _store(self, video_id: str, path: Optional[str]) -> None:
+        # Must be called with the condition held
+        self.paths[video_id] = path
+        if path and os.path.exists(path):
+            self.sizes[video_id] = os.path.getsize(path)
+            self.used_bytes += self.sizes[video_id]
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                # Wait for room on disk and for videos to be queued
+                while not self.closed and (not self.queue or not self._has_capacity()):
+                    self.condition.wait()
+                if self.closed:
+                    return
+                video_id = self.queue.popleft()
+                self.downloading.add(video_id)
+
+            path = None
+            needed = self.needs_audio is None or self.needs_audio(video_id)
+            if needed:
+                path = self.extract(video_id, self.output_dir)
+
+            with self.condition:
+                self.downloading.discard(video_id)
+                if needed:
+                    self._store(video_id, path)
+                    self.ready.add(video_id)
+                self.condition.notify_all()
+
+    def get(self, video_id: str) -> Optional[str]:
+        """
+        Returns the local audio path for video_id, waiting for an in-progress
+        download or extracting it directly if the prefetcher has not reached it.
+        """
+        with self.condition:
+            if video_id in self.queue:
+                # Not started yet: fetch it here rather than wait our turn
+                self.queue.remove(video_id)
+            else:
+                while video_id in self.downloading:
+                    self.condition.wait()
+                if video_id in self.paths:
+                    self.ready.discard(video_id)
+                    self.condition.notify_all()
+                    return self.paths[video_id]
+
+        path = self.extract(video_id, self.output_dir)
+        with self.condition:
+            self._store(video_id, path)
+        return path
+
+    def release(self, video_id: str) -> None:
+        """Deletes the local audio for a finished video and frees its budget."""
+        with self.condition:
+            path = self.paths.pop(video_id, None)
+            self.ready.discard(video_id)
+            self.used_bytes -= self.sizes.pop(video_id, 0)
+            self.condition.notify_all()
+        # Only remove files we downloaded into our own directory
+        output_dir = os.path.abspath(self.output_dir)
+        if (
+            path
+            and os.path.abspath(path).startswith(output_dir + os.sep)
+            and os.path.exists(path)
+        ):
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Warning: Could not remove prefetched audio {path}: {e}")
+
+    def close(self) -> None:
+        """Stops prefetching and waits for an in-progress download to finish."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
+
+
 def get_youtube_service() -> Optional[Any]:
     """Builds and returns the YouTube Data API service."""
     try:
@@ -74,8 +231,30 @@ def resolve_video_ids(video_id_input: str, youtube_service: Optional[Any]) -> Li
     Resolves the input (video ID, list, playlist, or channel handle)
     into a list of video IDs.
     """
-    video_ids: List[str] = []
+    return list(iter_video_ids(video_id_input, youtube_service))
 
+
+def iter_video_ids(
+    video_id_input: str,
+    youtube_service: Optional[Any],
+    known_video_ids: Optional[Set[str]] = None,
+    latest_published: Optional[str] = None,
+    known_run: int = KNOWN_RUN_TO_STOP,
+) -> Iterator[str]:
+    """
+    Resolves the input (video ID, list, playlist, or channel handle) into
+    video IDs, yielding playlist items page by page as they are fetched.
+
+    If known_video_ids is given (incremental sync), those IDs are skipped.
+    Paging an uploads playlist (UU... or a channel handle) also stops once
+    known_run consecutive items are known or were published before the date
+    of latest_published; uploads list the newest videos first, so this usually
+    only needs a single page. Other playlists are not ordered by date, so they
+    are always paged in full.
+    """
+    incremental = known_video_ids is not None
+    known_video_ids = known_video_ids or set()
+    latest_date = str(latest_published)[:10] if latest_published else None
     # Handle full URLs
     if "youtube.com" in video_id_input or "youtu.be" in video_id_input:
         # Regex to capture the 11-character video ID from common URL formats
@@ -94,6 +273,7 @@ def resolve_video_ids(video_id_input: str, youtube_service: Optional[Any]) -> Li
         request = service.channels().list(
             part="contentDetails", forHandle=video_id_input
         )
+        acquire("youtube")
         response = request.execute()
         if not response["items"]:
             print(f"Error: No channel found for handle {video_id_input}")
@@ -106,10 +286,10 @@ def resolve_video_ids(video_id_input: str, youtube_service: Optional[Any]) -> Li
 
     # Single video (standard ID length is 11)
     if len(video_id_input) == 11 and "," not in video_id_input:
-        video_ids = [video_id_input]
+        yield video_id_input
     # List of videos
     elif "," in video_id_input:
-        video_ids = video_id_input.split(",")
+        yield from video_id_input.split(",")
     # Playlist (Standard 'PL' or Uploads 'UU')
     elif video_id_input.startswith("PL") or video_id_input.startswith("UU"):
         if not youtube_service:
@@ -117,15 +297,73 @@ def resolve_video_ids(video_id_input: str, youtube_service: Optional[Any]) -> Li
             sys.exit(1)
         service = cast(Any, youtube_service)
         request = service.playlistItems().list(
-            part="contentDetails", playlistId=video_id_input, maxResults=50
+            part="contentDetails",
+            playlistId=video_id_input,
+            maxResults=VIDEOS_PER_REQUEST,
         )
+        uploads = video_id_input.startswith("UU")
+        run = 0
         while request:
+            acquire("youtube")
             response = request.execute()
             for item in response["items"]:
-                video_ids.append(item["contentDetails"]["videoId"])
+                details = item["contentDetails"]
+                video_id = details["videoId"]
+                published = details.get("videoPublishedAt", "")[:10]
+                known = video_id in known_video_ids
+                if known or (latest_date and published and published < latest_date):
+                    run += 1
+                else:
+                    run = 0
+                if not known:
+                    yield video_id
+                if incremental and uploads and run >= known_run:
+                    print(
+                        f"Stopping after {run} videos that are already in the manifest."
+                    )
+                    return
             request = service.playlistItems().list_next(request, response)
 
-    return video_ids
+
+def iter_pages(
+    video_ids: Iterable[str],
+    page_size: int = VIDEOS_PER_REQUEST,
+    read_ahead: int = 1,
+) -> Iterator[List[str]]:
+    """
+    Groups video_ids into pages of up to page_size. The IDs are read on a
+    background thread, so up to read_ahead further pages are being resolved
+    while the caller works on the current one, so video_ids must not share
+    an API service with the caller (services are not thread-safe). Errors
+    raised while resolving (including sys.exit) are re-raised in the caller.
+    """
+    pages: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, read_ahead))
+    done = object()
+
+    def read() -> None:
+        try:
+            page: List[str] = []
+            for video_id in video_ids:
+                page.append(video_id)
+                if len(page) == page_size:
+                    pages.put(page)
+                    page = []
+            if page:
+                pages.put(page)
+        except BaseException as e:
+            pages.put(e)
+        finally:
+            pages.put(done)
+
+    threading.Thread(target=read, name="video-id-reader", daemon=True).start()
+
+    while True:
+        item = pages.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
 
 
 def get_video_details(
@@ -143,31 +381,79 @@ def get_video_details(
 
     service = cast(Any, youtube_service)
     request = service.videos().list(part="snippet,contentDetails", id=video_id)
+    acquire("youtube")
     response = request.execute()
 
     if response["items"]:
-        snippet = response["items"][0]["snippet"]
-        video_title: str = snippet["title"]
-        description: str = snippet["description"]
-        publishedAt: str = snippet["publishedAt"]
-        channelTitle: str = snippet["channelTitle"]
-        tags: str = ", ".join(snippet.get("tags", []))
-        iso_duration: str = response["items"][0]["contentDetails"]["duration"]
-        video_duration: str = str(isodate.parse_duration(iso_duration))
-        return (
-            video_title,
-            description,
-            publishedAt,
-            channelTitle,
-            tags,
-            video_duration,
-            url,
-        )
+        return _parse_video_item(response["items"][0], url)
     else:
         print(f"Warning: No details found for video ID {video_id}")
         return None
 
 
+def _parse_video_item(
+    item: Dict[str, Any], url: str
+) -> Tuple[str, str, str, str, str, str, str]:
+    """Converts a videos().list item into the get_video_details tuple."""
+    snippet = item["snippet"]
+    video_title: str = snippet["title"]
+    description: str = snippet["description"]
+    publishedAt: str = snippet["publishedAt"]
+    channelTitle: str = snippet["channelTitle"]
+    tags: str = ", ".join(snippet.get("tags", []))
+    iso_duration: str = item["contentDetails"]["duration"]
+    video_duration: str = str(isodate.parse_duration(iso_duration))
+    return (
+        video_title,
+        description,
+        publishedAt,
+        channelTitle,
+        tags,
+        video_duration,
+        url,
+    )
+
+
+# Only request the fields _parse_video_item reads
+VIDEO_DETAILS_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,channelTitle,tags),"
+    "contentDetails(duration))"
+)
+
+
+def get_videos_details(
+    video_ids: List[str], youtube_service: Optional[Any]
+) -> Dict[str, Tuple[str, str, str, str, str, str, str]]:
+    """
+    Fetches metadata for many videos using one videos().list call per 50 IDs
+    and a field mask. Returns a mapping of video ID -> get_video_details tuple.
+    Videos the API does not return (private, deleted) are left out.
+    """
+    if not youtube_service:
+        return {}
+
+    service = cast(Any, youtube_service)
+    details: Dict[str, Tuple[str, str, str, str, str, str, str]] = {}
+    unique_ids = list(dict.fromkeys(video_ids))
+
+    for start in range(0, len(unique_ids), VIDEOS_PER_REQUEST):
+        batch = unique_ids[start : start + VIDEOS_PER_REQUEST]
+        request = service.videos().list(
+            part="snippet,contentDetails",
+            id=",".join(batch),
+            maxResults=VIDEOS_PER_REQUEST,
+            fields=VIDEO_DETAILS_FIELDS,
+        )
+        acquire("youtube")
+        response = request.execute()
+        for item in response.get("items", []):
+            video_id = item["id"]
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            details[video_id] = _parse_video_item(item, url)
+
+    return details
+
+
 def fetch_transcript(
     video_id: str, language: str = "en"
 ) -> Optional[Tuple[str, bool, List[Dict[str, Any]]]]:
@@ -179,6 +465,7 @@ def fetch_transcript(
     Returns (text, is_generated).
     """
     try:
+        acquire("transcript")
         transcript_list = YouTubeTranscriptApi().list(video_id)
         transcript_obj = None
 
@@ -227,6 +514,7 @@ def fetch_transcript(
                 pass
 
         if transcript_obj:
+            acquire("transcript")
             transcript_data = transcript_obj.fetch()
 
             # Handle both dicts and objects
@@ -8,6 +8,8 @@ from typing import List, Optional, Tuple
 import polars as pl
 from rich import print as rprint
 
+from youtube_to_docs.clients import genai_client, tts_client
+from youtube_to_docs.ratelimit import acquire, get_provider
 from youtube_to_docs.storage import Storage
 from youtube_to_docs.utils import format_clickable_path
 
@@ -38,7 +40,7 @@ def generate_speech_gcp(
         return b""
 
     try:
-        client = texttospeech.TextToSpeechClient()
+        client = tts_client()
 
         input_text = texttospeech.SynthesisInput(text=text)
 
@@ -60,6 +62,7 @@ def generate_speech_gcp(
             sample_rate_hertz=24000,
         )
 
+        acquire("gcp")
         response = client.synthesize_speech(
             input=input_text,
             voice=voice,
@@ -81,7 +84,6 @@ def generate_speech(
     Returns the raw PCM audio bytes.
     """
     try:
-        from google import genai
         from google.genai import types
 
         api_key = os.environ.get("GEMINI_API_KEY")
@@ -89,8 +91,9 @@ def generate_speech(
             print("Error: GEMINI_API_KEY environment variable not set.")
             return b""
 
-        client = genai.Client(api_key=api_key)
+        client = genai_client(api_key=api_key)
 
+        acquire(get_provider(model_name))
         response = client.models.generate_content(
             model=model_name,
             contents=text,
@@ -1,6 +1,8 @@
+import hashlib
 import os
 import re
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 import polars as pl
 
@@ -116,6 +118,91 @@ def reorder_columns(df: pl.DataFrame) -> pl.DataFrame:
     return df.select(final_order)
 
 
+# Long text columns that a slim manifest replaces with a hash and size, mapped
+# to the prefix of the column holding their artifact file
+SLIM_TEXT_PREFIXES = {
+    "Summary Text ": "Summary File ",
+    "QA Text ": "QA File ",
+    "Speakers ": "Speakers File ",
+}
+
+
+def text_file_column(col: str) -> Optional[str]:
+    """
+    Returns the artifact file column for a long text column, e.g.
+    "QA Text model from youtube" -> "QA File model from youtube", or None.
+    """
+    if col.endswith(" Hash") or col.endswith(" Size"):
+        return None
+    for text_prefix, file_prefix in SLIM_TEXT_PREFIXES.items():
+        if col.startswith(text_prefix) and not col.startswith(file_prefix):
+            return file_prefix + col[len(text_prefix) :]
+    return None
+
+
+def text_digest(text: str) -> tuple[str, int]:
+    """Returns the SHA-256 and size in bytes a slim manifest keeps for text."""
+    data = text.encode("utf-8")
+    return hashlib.sha256(data).hexdigest(), len(data)
+
+
+def slim_dataframe(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Drops long texts that are stored in an artifact file from the manifest.
+    Each such text is replaced by its SHA-256 ("{column} Hash") and size in
+    bytes ("{column} Size"). Texts without an artifact file are kept.
+    """
+    for col in df.columns:
+        file_col = text_file_column(col)
+        if file_col is None or file_col not in df.columns:
+            continue
+        # Rows slimmed as they were processed leave an all-null column
+        if df[col].dtype not in (pl.Utf8, pl.Null):
+            continue
+
+        hash_col, size_col = f"{col} Hash", f"{col} Size"
+        hashes = (
+            df[hash_col].cast(pl.Utf8).to_list()
+            if hash_col in df.columns
+            else [None] * len(df)
+        )
+        sizes = (
+            df[size_col].cast(pl.Int64, strict=False).to_list()
+            if size_col in df.columns
+            else [None] * len(df)
+        )
+        texts = []
+        for i, (text, path) in enumerate(zip(df[col], df[file_col])):
+            if text and path:
+                hashes[i], sizes[i] = text_digest(text)
+                text = None
+            texts.append(text)
+
+        df = df.with_columns(
+            pl.Series(hash_col, hashes, dtype=pl.Utf8),
+            pl.Series(size_col, sizes, dtype=pl.Int64),
+        )
+        if any(t is not None for t in texts):
+            df = df.with_columns(pl.Series(col, texts, dtype=pl.Utf8))
+        else:
+            df = df.drop(col)
+    return df
+
+
+class ErrorText(str):
+    """
+    A failure message a provider call returns instead of raising, e.g.
+    "Error: ..." or "Bedrock API Error 429: ...". It is still a plain string
+    to the caller, but it is told apart from a result by its type, so a
+    summary that happens to start with "Error" is not taken for a failure.
+    """
+
+
+def is_error_text(text: object) -> bool:
+    """Returns True if text is a failure message returned by a provider call."""
+    return isinstance(text, ErrorText)
+
+
 def normalize_model_name(model_name: str) -> str:
     """
     Normalizes a model name by stripping prefixes and suffixes.
@@ -190,3 +277,51 @@ def add_question_numbers(markdown_table: str) -> str:
             new_lines.append(lines[i])
 
     return "\n".join(new_lines)
+
+
+_SRT_TIMING = re.compile(
+    r"(\d+):(\d{2}):(\d{2})[,.](\d{1,3})\s*-->\s*(\d+):(\d{2}):(\d{2})[,.](\d{1,3})"
+)
+
+
+def parse_srt(srt: str) -> List[Tuple[float, float, str]]:
+    """
+    Parses SRT content into (start_seconds, end_seconds, text) cues.
+    Tolerates the code fences and stray lines LLMs sometimes add around it.
+    """
+    cues: List[Tuple[float, float, str]] = []
+    lines = srt.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    i = 0
+    while i < len(lines):
+        match = _SRT_TIMING.search(lines[i])
+        i += 1
+        if not match:
+            continue
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = match.groups()
+        start = int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1.ljust(3, "0")) / 1000
+        end = int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2.ljust(3, "0")) / 1000
+        text_lines = []
+        while i < len(lines) and lines[i].strip() and not lines[i].startswith("```"):
+            # A cue number directly followed by the next timing line ends the cue
+            if (
+                lines[i].strip().isdigit()
+                and i + 1 < len(lines)
+                and _SRT_TIMING.search(lines[i + 1])
+            ):
+                break
+            text_lines.append(lines[i].strip())
+            i += 1
+        cues.append((start, end, " ".join(text_lines)))
+    return cues
+
+
+def srt_to_text(srt: str) -> str:
+    """
+    Returns the plain transcript text of SRT content: the cue texts joined by
+    spaces. Content without any cues (e.g. an error message, or a model that
+    ignored the SRT instruction) is returned unchanged.
+    """
+    cues = parse_srt(srt)
+    if not cues:
+        return srt.strip()
+    return " ".join(text for _, _, text in cues if text)